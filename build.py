@@ -6,12 +6,39 @@ This script packages the Viewport Configuration Tool into a single executable
 that can be distributed and run without Python installed.
 
 Works with both pip3 and pipx installations of PyInstaller.
+
+The zipapp mode instead produces a small .pyz archive that needs a system
+Python 3 but starts without any extraction step.
 """
 
+import argparse
 import subprocess
 import sys
+import zipapp
 from pathlib import Path
 
+parser = argparse.ArgumentParser(description="Build the Viewport Configuration Tool executable")
+parser.add_argument(
+    "--mode",
+    choices=["onedir", "onefile", "zipapp"],
+    default="onedir",
+    help="Packaging mode: onedir (default), onefile (single self-extracting "
+         "executable, slower startup), or zipapp (.pyz, requires Python 3)"
+)
+parser.add_argument(
+    "--onefile",
+    dest="mode",
+    action="store_const",
+    const="onefile",
+    help="Shorthand for --mode onefile"
+)
+parser.add_argument(
+    "--debug",
+    action="store_true",
+    help="Skip interpreter optimization flags (keeps asserts and docstrings) when diagnosing a build"
+)
+args = parser.parse_args()
+
 # Get the project root directory
 project_root = Path(__file__).parent
 src_dir = project_root / "src"
@@ -29,8 +56,28 @@ print("=" * 70)
 print(f"Source: {src_dir}")
 print(f"Output: {output_dir}")
 print(f"Executable: {exe_name}")
+print(f"Mode: {args.mode}")
 print("=" * 70)
 
+if args.mode == "zipapp":
+    # Package the source tree as a .pyz run by the system Python
+    pyz_path = output_dir / "viewportConfigurationTool.pyz"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    print("\nCreating zipapp...")
+    zipapp.create_archive(
+        src_dir,
+        target=pyz_path,
+        interpreter="/usr/bin/env python3",
+        main="viewport_configuration_tool.__main__:main",
+        filter=lambda path: "__pycache__" not in path.parts,
+        compressed=True,
+    )
+    print("\n" + "=" * 70)
+    print("Build complete!")
+    print(f"Zipapp location: {pyz_path}")
+    print("=" * 70)
+    sys.exit(0)
+
 # PyInstaller arguments
 pyinstaller_args = [
     "pyinstaller",
@@ -39,14 +86,52 @@ pyinstaller_args = [
     f"--distpath={output_dir}",
     f"--workpath={build_dir}",
     f"--specpath={project_root}",
-    "--onefile",  # Create a single executable
     "--console",  # Console application (needed for curses)
     "--clean",    # Clean build cache
     # Add source directory to Python path
     f"--paths={src_dir}",
-    # Collect all package data
-    "--collect-all=viewport_configuration_tool",
+    # Package modules are imported lazily, so list them explicitly
+    "--hidden-import=viewport_configuration_tool.core",
+    "--hidden-import=viewport_configuration_tool.cli",
+    "--hidden-import=viewport_configuration_tool.ui",
+    "--hidden-import=viewport_configuration_tool.network",
+]
+
+# Standard library packages the tool never uses; leaving them out shrinks the bundle.
+# (email is still needed by urllib.request, so it stays.)
+excluded_modules = [
+    "tkinter",
+    "test",
+    "unittest",
+    "idlelib",
+    "turtledemo",
+    "lib2to3",
+    "ensurepip",
+    "pydoc_data",
+    "xml.dom",
+    "xmlrpc",
+    "distutils",
 ]
+pyinstaller_args.extend(f"--exclude-module={module}" for module in excluded_modules)
+
+# Interpreter optimization: PyInstaller compiles the bundled bytecode itself at this
+# level (equivalent to -OO: no asserts, no docstrings; nothing reads __doc__)
+if not args.debug:
+    pyinstaller_args.append("--optimize=2")
+
+# Strip debug symbols from bundled binaries (not supported on Windows)
+if sys.platform != "win32":
+    pyinstaller_args.append("--strip")
+
+# Default to a pre-extracted directory bundle so launches skip the
+# per-run extraction of the bundled runtime; --onefile restores the old layout
+if args.mode == "onefile":
+    pyinstaller_args.append("--onefile")
+    exe_path = output_dir / exe_name
+else:
+    pyinstaller_args.append("--onedir")
+    pyinstaller_args.append("--contents-directory=_internal")
+    exe_path = output_dir / "viewportConfigurationTool" / exe_name
 
 # Run PyInstaller as a subprocess (works with both pip3 and pipx)
 print("\nRunning PyInstaller...")
@@ -54,7 +139,7 @@ try:
     result = subprocess.run(pyinstaller_args, check=True)
     print("\n" + "=" * 70)
     print("Build complete!")
-    print(f"Executable location: {output_dir / exe_name}")
+    print(f"Executable location: {exe_path}")
     print("=" * 70)
     sys.exit(0)
 except subprocess.CalledProcessError as e:
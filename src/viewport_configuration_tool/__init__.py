@@ -8,14 +8,27 @@ Modules:
     core: Core functionality for parsing and config management
     ui: Terminal user interface (TUI) using curses
     cli: Command-line interface for batch processing
+
+Exported names are resolved lazily on first access, so importing the package
+does not pull in curses or the XML parser until they are actually needed.
+Set VCT_EAGER_IMPORT=1 to import everything up front.
 """
 
+import importlib
+import os
+
 __version__ = "1.1.0"
 __author__ = "Viewport Configuration Tool Contributors"
 
-from .core import GameInfo, ViewportConfigurationManager
-from .ui import SystemConfig, CursesGUI, main_gui
-from .cli import main_cli
+# Map each exported name to the submodule that defines it
+_LAZY_EXPORTS = {
+    'GameInfo': 'core',
+    'ViewportConfigurationManager': 'core',
+    'SystemConfig': 'ui',
+    'CursesGUI': 'ui',
+    'main_gui': 'ui',
+    'main_cli': 'cli',
+}
 
 __all__ = [
     'GameInfo',
@@ -25,3 +38,27 @@ __all__ = [
     'main_gui',
     'main_cli',
 ]
+
+
+def __getattr__(name):
+    """Resolve an exported name from its submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List exported names for REPL completion."""
+    return sorted(set(globals()) | set(__all__))
+
+
+# Eager mode lets CI catch broken deferred imports
+if os.environ.get("VCT_EAGER_IMPORT") == "1":
+    for _name in __all__:
+        __getattr__(_name)
+    del _name
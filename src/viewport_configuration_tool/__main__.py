@@ -6,22 +6,38 @@ based on command-line arguments.
 """
 
 import sys
-import curses
 
-# Use absolute imports for PyInstaller compatibility
-try:
-    from viewport_configuration_tool.ui import main_gui
-    from viewport_configuration_tool.cli import main_cli
-except ImportError:
-    # Fallback to relative imports for development
-    from .ui import main_gui
-    from .cli import main_cli
 
-
-if __name__ == '__main__':
+def main() -> None:
+    """Launch the GUI with no arguments, otherwise run the CLI."""
     # If no arguments provided, launch GUI mode
     if len(sys.argv) == 1:
+        # Only the GUI path needs curses and the UI module
+        import curses
+
+        if __package__:
+            # Run with python -m (development, installed package or zipapp)
+            from .ui import main_gui
+        else:
+            # Run as a script, as in the PyInstaller build
+            from viewport_configuration_tool.ui import main_gui
+
         curses.wrapper(main_gui)
     else:
-        # CLI mode with arguments
+        # CLI mode with arguments; freeze_support lets frozen builds spawn
+        # the worker processes used for parallel system jobs. Unfrozen runs
+        # don't need it, so they skip importing multiprocessing
+        if getattr(sys, 'frozen', False):
+            import multiprocessing
+            multiprocessing.freeze_support()
+
+        if __package__:
+            from .cli import main_cli
+        else:
+            from viewport_configuration_tool.cli import main_cli
+
         sys.exit(main_cli())
+
+
+if __name__ == '__main__':
+    main()
@@ -4,13 +4,118 @@ Command-line interface for the viewport configuration tool.
 This module handles CLI argument parsing and batch processing.
 """
 
-import argparse
+import functools
 import os
-from .core import ViewportConfigurationManager
+import sys
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .core import ViewportConfigurationManager
+
+# (width, height, x, y) override values; None means "use DAT value" / default
+Override = Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]
+
+# (name, dat_file, rom_folder, override, export_folder)
+Job = Tuple[str, str, str, Override, Optional[str]]
+
+# Options understood by the fast-path parser: option -> (attribute, value count).
+# A count of None means "one or more values", like argparse's nargs='+'.
+_FAST_OPTIONS = {
+    '--fbneo': ('fbneo', 2),
+    '--fbneo-override': ('fbneo_override', None),
+    '--fbneo-export': ('fbneo_export', 1),
+    '--mame': ('mame', 2),
+    '--mame-override': ('mame_override', None),
+    '--mame-export': ('mame_export', 1),
+    '--jobs': ('jobs', 1),
+}
+
+# Parsed DAT data keyed by (absolute path, mtime_ns, size), so jobs that list
+# the same DAT file only parse it once per process
+_DAT_CACHE: Dict[Tuple[str, int, int], Tuple[dict, dict]] = {}
 
 
 def main_cli():
     """Main entry point for CLI mode."""
+    # Common --fbneo/--mame invocations skip building the argparse parser
+    args = _fast_parse_args(sys.argv[1:])
+
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
+
+        # Check if at least one system was configured
+        if not (args.fbneo or args.mame or args.system):
+            parser.print_help()
+            print("\nNo systems configured. Use --fbneo, --mame, or --system to add systems.")
+            print("Or run without arguments to launch GUI mode.")
+            return 1
+
+    # Build the job list: (name, dat_file, rom_folder, override, export_folder)
+    jobs = _build_jobs(args)
+
+    # Validate all paths before touching any files
+    path_error = _check_paths(jobs)
+    if path_error:
+        print(f"Error: {path_error}")
+        return 1
+
+    # Process systems
+    results = {}
+    total_processed = 0
+    total_skipped = 0
+
+    for name, processed, skipped in _run_jobs(jobs, args.jobs):
+        results[name] = (processed, skipped)
+        total_processed += processed
+        total_skipped += skipped
+
+    # Print summary in a single write
+    out = ["", "=" * 70, "SUMMARY", "=" * 70]
+
+    for system_name, (processed, skipped) in results.items():
+        out.extend(["", f"{system_name}:", f"  Processed: {processed}", f"  Skipped: {skipped}"])
+
+    out.extend(["", "TOTAL:", f"  Processed: {total_processed}", f"  Skipped: {total_skipped}"])
+    sys.stdout.write("\n".join(out) + "\n")
+
+    return 0
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """
+    Build the full argparse parser, the source of truth for help and errors.
+
+    The parser is built once and reused; parse_args() only mutates the
+    Namespace it returns, so sharing the parser between calls is safe.
+    """
+    import argparse
+
+    class OverrideAction(argparse.Action):
+        """Validate WIDTH HEIGHT [X Y] at parse time and store a 4-tuple."""
+
+        def __call__(self, parser, namespace, values, option_string=None):
+            try:
+                setattr(namespace, self.dest, _parse_override(values, option_string))
+            except ValueError as e:
+                parser.error(str(e))
+
+    class SystemOverrideAction(argparse.Action):
+        """Validate NAME WIDTH HEIGHT [X Y] at parse time and append (name, 4-tuple)."""
+
+        def __call__(self, parser, namespace, values, option_string=None):
+            if len(values) not in (3, 5):
+                parser.error(f"{option_string} requires 3 or 5 values (NAME WIDTH HEIGHT [X Y])")
+            try:
+                override = _parse_override(values[1:], option_string)
+            except ValueError as e:
+                parser.error(str(e))
+            items = list(getattr(namespace, self.dest) or [])
+            items.append((values[0], override))
+            setattr(namespace, self.dest, items)
+
     parser = argparse.ArgumentParser(
         description='ROM Viewport Configuration Settings - Process multiple emulation systems',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -50,12 +155,13 @@ Examples:
     parser.add_argument(
         '--fbneo-override',
         nargs='+',
-        type=int,
-        metavar=('WIDTH', 'HEIGHT', '[X]', '[Y]'),
+        action=OverrideAction,
+        metavar='VALUE',
         help='Resolution override for FinalBurn Neo games (WIDTH HEIGHT [X Y])'
     )
     parser.add_argument(
         '--fbneo-export',
+        default=None,
         metavar='EXPORT_FOLDER',
         help='Export folder for FinalBurn Neo configs (optional)'
     )
@@ -70,12 +176,13 @@ Examples:
     parser.add_argument(
         '--mame-override',
         nargs='+',
-        type=int,
-        metavar=('WIDTH', 'HEIGHT', '[X]', '[Y]'),
+        action=OverrideAction,
+        metavar='VALUE',
         help='Resolution override for MAME games (WIDTH HEIGHT [X Y])'
     )
     parser.add_argument(
         '--mame-export',
+        default=None,
         metavar='EXPORT_FOLDER',
         help='Export folder for MAME configs (optional)'
     )
@@ -90,9 +197,9 @@ Examples:
     )
     parser.add_argument(
         '--system-override',
-        action='append',
+        action=SystemOverrideAction,
         nargs='+',
-        metavar=('NAME', 'WIDTH', 'HEIGHT', '[X]', '[Y]'),
+        metavar='VALUE',
         help='Resolution override for a custom system (NAME WIDTH HEIGHT [X Y])'
     )
     parser.add_argument(
@@ -103,176 +210,257 @@ Examples:
         help='Export folder for a custom system'
     )
 
-    args = parser.parse_args()
+    # Parallelism
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of systems to process in parallel (default: 1, 0 = one per CPU); '
+             'parallel runs interleave their log output'
+    )
 
-    # Check if at least one system was configured
-    has_systems = args.fbneo or args.mame or args.system
+    return parser
+
+
+def _fast_parse_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse simple --fbneo/--mame invocations without building an argparse parser.
+
+    Anything outside that subset (--help, --system*, --opt=value syntax,
+    abbreviated options, malformed values) returns None so the caller falls
+    back to argparse and its help and error messages.
+
+    Args:
+        argv: Command-line arguments without the program name
+
+    Returns:
+        Namespace with the same attributes argparse would produce, or None
+    """
+    values = {
+        'fbneo': None, 'fbneo_override': None, 'fbneo_export': None,
+        'mame': None, 'mame_override': None, 'mame_export': None,
+        'system': None, 'system_override': None, 'system_export': None,
+        'jobs': 1,
+    }
+
+    i = 0
+    while i < len(argv):
+        option = argv[i]
+        spec = _FAST_OPTIONS.get(option)
+        if spec is None:
+            return None
+        dest, count = spec
+        i += 1
+
+        if count is None:
+            end = i
+            while end < len(argv) and not argv[end].startswith('--'):
+                end += 1
+        else:
+            end = i + count
+
+        option_values = argv[i:end]
+        if not option_values or (count is not None and len(option_values) != count):
+            return None
+        i = end
 
-    if not has_systems:
-        parser.print_help()
-        print("\nNo systems configured. Use --fbneo, --mame, or --system to add systems.")
-        print("Or run without arguments to launch GUI mode.")
-        return 1
+        try:
+            if dest in ('fbneo_override', 'mame_override'):
+                values[dest] = _parse_override(option_values, option)
+            elif dest == 'jobs':
+                values[dest] = int(option_values[0])
+            elif count == 1:
+                values[dest] = option_values[0]
+            else:
+                values[dest] = option_values
+        except ValueError:
+            return None
 
-    # Process systems
-    results = {}
-    total_processed = 0
-    total_skipped = 0
+    if not values['fbneo'] and not values['mame']:
+        return None
 
-    # Process FinalBurn Neo system
-    if args.fbneo:
-        dat_file, rom_folder = args.fbneo
-        override_w = None
-        override_h = None
-        override_x = None
-        override_y = None
-
-        if args.fbneo_override:
-            if len(args.fbneo_override) >= 2:
-                override_w = args.fbneo_override[0]
-                override_h = args.fbneo_override[1]
-            if len(args.fbneo_override) >= 4:
-                override_x = args.fbneo_override[2]
-                override_y = args.fbneo_override[3]
-            elif len(args.fbneo_override) not in [2, 4]:
-                print(f"Error: --fbneo-override requires 2 or 4 values (WIDTH HEIGHT [X Y])")
-                return 1
-
-        export_folder = args.fbneo_export if args.fbneo_export else None
-
-        if not os.path.exists(dat_file):
-            print(f"Error: FinalBurn Neo DAT file not found: {dat_file}")
-            return 1
-        if not os.path.exists(rom_folder):
-            print(f"Error: FinalBurn Neo ROM folder not found: {rom_folder}")
-            return 1
+    return SimpleNamespace(**values)
 
-        print("\n" + "=" * 70)
-        print("Processing: FinalBurn Neo")
-        print("=" * 70)
 
-        try:
-            manager = ViewportConfigurationManager(
-                dat_file, rom_folder, override_w, override_h, override_x, override_y, export_folder
-            )
-            manager.parse_dat_file()
-            processed, skipped = manager.process_roms()
-            results["FinalBurn Neo"] = (processed, skipped)
-            total_processed += processed
-            total_skipped += skipped
-        except Exception as e:
-            print(f"Error processing FinalBurn Neo: {e}")
-            results["FinalBurn Neo"] = (0, 0)
-
-    # Process MAME system
-    if args.mame:
-        dat_file, rom_folder = args.mame
-        override_w = None
-        override_h = None
-        override_x = None
-        override_y = None
-
-        if args.mame_override:
-            if len(args.mame_override) >= 2:
-                override_w = args.mame_override[0]
-                override_h = args.mame_override[1]
-            if len(args.mame_override) >= 4:
-                override_x = args.mame_override[2]
-                override_y = args.mame_override[3]
-            elif len(args.mame_override) not in [2, 4]:
-                print(f"Error: --mame-override requires 2 or 4 values (WIDTH HEIGHT [X Y])")
-                return 1
-
-        export_folder = args.mame_export if args.mame_export else None
-
-        if not os.path.exists(dat_file):
-            print(f"Error: MAME DAT file not found: {dat_file}")
-            return 1
-        if not os.path.exists(rom_folder):
-            print(f"Error: MAME ROM folder not found: {rom_folder}")
-            return 1
+def _check_paths(jobs: List[Job]) -> Optional[str]:
+    """
+    Check every DAT file and ROM folder before any job runs.
 
-        print("\n" + "=" * 70)
-        print("Processing: MAME")
-        print("=" * 70)
+    Paths shared by several jobs are only checked once.
 
-        try:
-            manager = ViewportConfigurationManager(
-                dat_file, rom_folder, override_w, override_h, override_x, override_y, export_folder
-            )
-            manager.parse_dat_file()
-            processed, skipped = manager.process_roms()
-            results["MAME"] = (processed, skipped)
-            total_processed += processed
-            total_skipped += skipped
-        except Exception as e:
-            print(f"Error processing MAME: {e}")
-            results["MAME"] = (0, 0)
-
-    # Process custom systems
-    if args.system:
-        # Build override and export dictionaries
-        overrides = {}
-        exports = {}
-
-        if args.system_override:
-            for override_args in args.system_override:
-                if len(override_args) == 3:
-                    # NAME WIDTH HEIGHT
-                    name, width, height = override_args
-                    overrides[name] = (int(width), int(height), None, None)
-                elif len(override_args) == 5:
-                    # NAME WIDTH HEIGHT X Y
-                    name, width, height, x, y = override_args
-                    overrides[name] = (int(width), int(height), int(x), int(y))
-                else:
-                    print(f"Error: --system-override requires 3 or 5 values (NAME WIDTH HEIGHT [X Y])")
-                    return 1
-
-        if args.system_export:
-            for name, export_folder in args.system_export:
-                exports[name] = export_folder
+    Returns:
+        Error message for the first bad path, or None if all paths are usable
+    """
+    checked = set()
 
-        for name, dat_file, rom_folder in args.system:
-            if not os.path.exists(dat_file):
-                print(f"Error: DAT file not found for {name}: {dat_file}")
-                return 1
-            if not os.path.exists(rom_folder):
-                print(f"Error: ROM folder not found for {name}: {rom_folder}")
-                return 1
+    for name, dat_file, rom_folder, _, _ in jobs:
+        if dat_file not in checked:
+            if not os.access(dat_file, os.R_OK):
+                return f"DAT file not found or not readable for {name}: {dat_file}"
+            checked.add(dat_file)
+
+        if rom_folder not in checked:
+            if not os.path.isdir(rom_folder):
+                return f"ROM folder not found for {name}: {rom_folder}"
+            checked.add(rom_folder)
 
-            print("\n" + "=" * 70)
-            print(f"Processing: {name}")
-            print("=" * 70)
+    return None
 
-            override_w, override_h, override_x, override_y = overrides.get(name, (None, None, None, None))
-            export_folder = exports.get(name, None)
 
-            try:
-                manager = ViewportConfigurationManager(
-                    dat_file, rom_folder, override_w, override_h, override_x, override_y, export_folder
-                )
-                manager.parse_dat_file()
-                processed, skipped = manager.process_roms()
-                results[name] = (processed, skipped)
-                total_processed += processed
-                total_skipped += skipped
-            except Exception as e:
-                print(f"Error processing {name}: {e}")
-                results[name] = (0, 0)
-
-    # Print summary
-    print("\n" + "=" * 70)
-    print("SUMMARY")
-    print("=" * 70)
+def _run_job(name: str, dat_file: str, rom_folder: str, override: Override,
+             export_folder: Optional[str]) -> Tuple[str, int, int]:
+    """
+    Parse the DAT file and process the ROMs for a single system.
 
-    for system_name, (processed, skipped) in results.items():
-        print(f"\n{system_name}:")
-        print(f"  Processed: {processed}")
-        print(f"  Skipped: {skipped}")
+    Defined at module level so it can be pickled for worker processes.
 
-    print(f"\nTOTAL:")
-    print(f"  Processed: {total_processed}")
-    print(f"  Skipped: {total_skipped}")
+    Returns:
+        Tuple of (name, processed_count, skipped_count)
+    """
+    sys.stdout.write(f"\n{'=' * 70}\nProcessing: {name}\n{'=' * 70}\n")
 
-    return 0
+    # Imported here so --help and argument errors never load the XML stack
+    from .core import ViewportConfigurationManager
+
+    override_w, override_h, override_x, override_y = override
+
+    try:
+        manager = ViewportConfigurationManager(
+            dat_file, rom_folder, override_w, override_h, override_x, override_y, export_folder
+        )
+        _load_dat(manager, dat_file)
+        processed, skipped = manager.process_roms()
+        return name, processed, skipped
+    except Exception as e:
+        print(f"Error processing {name}: {e}")
+        return name, 0, 0
+
+
+def _load_dat(manager: 'ViewportConfigurationManager', dat_file: str) -> None:
+    """Parse the DAT file into the manager, reusing an earlier parse of the same file."""
+    st = os.stat(dat_file)
+    key = (os.path.abspath(dat_file), st.st_mtime_ns, st.st_size)
+
+    cached = _DAT_CACHE.get(key)
+    if cached is not None:
+        # The manager only reads these dicts, so sharing them is safe
+        manager.game_resolutions, manager.game_info = cached
+        manager.log(f"Reusing parsed DAT file: {dat_file}")
+        return
+
+    manager.parse_dat_file()
+    _DAT_CACHE[key] = (manager.game_resolutions, manager.game_info)
+
+
+def _run_job_group(group: List[Job]) -> List[Tuple[str, int, int]]:
+    """Run jobs that share a DAT file serially, so the parsed DAT is reused."""
+    return [_run_job(*job) for job in group]
+
+
+def _run_jobs(jobs: List[Job], max_workers: int) -> List[Tuple[str, int, int]]:
+    """
+    Run system jobs, in parallel worker processes when more than one is allowed.
+
+    Jobs that write into the same output folder would race each other, so
+    they are always run serially in the order given. Jobs that share a DAT
+    file are sent to the same worker so the DAT is only parsed once.
+
+    Args:
+        jobs: Jobs to run
+        max_workers: Maximum worker processes (0 = auto, 1 = serial)
+
+    Returns:
+        List of (name, processed_count, skipped_count) in job order
+    """
+    if max_workers <= 0:
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+
+    output_folders = [os.path.abspath(export_folder or rom_folder)
+                      for _, _, rom_folder, _, export_folder in jobs]
+    if len(set(output_folders)) != len(output_folders):
+        max_workers = 1
+
+    # Group jobs by DAT file, remembering each job's position
+    groups: Dict[str, List[int]] = {}
+    for idx, (_, dat_file, _, _, _) in enumerate(jobs):
+        groups.setdefault(os.path.abspath(dat_file), []).append(idx)
+
+    if max_workers <= 1 or len(groups) <= 1:
+        return _run_job_group(jobs)
+
+    # Imported here so serial runs never load the process pool and multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    results: List[Tuple[str, int, int]] = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+        futures = {executor.submit(_run_job_group, [jobs[i] for i in indices]): indices
+                   for indices in groups.values()}
+        for future, indices in futures.items():
+            for idx, result in zip(indices, future.result()):
+                results[idx] = result
+    return results
+
+
+def _parse_override(values: Optional[List], label: str) -> Override:
+    """
+    Convert an override value list into a (width, height, x, y) tuple.
+
+    Args:
+        values: Override values from the command line (WIDTH HEIGHT [X Y]), or None
+        label: Option name used in the error message
+
+    Returns:
+        Tuple of (width, height, x, y); missing values are None
+
+    Raises:
+        ValueError: If the wrong number of values is given or a value is not an integer
+    """
+    if not values:
+        return (None, None, None, None)
+
+    if len(values) not in (2, 4):
+        raise ValueError(f"{label} requires 2 or 4 values (WIDTH HEIGHT [X Y])")
+
+    try:
+        numbers = [int(v) for v in values]
+    except ValueError:
+        raise ValueError(f"{label} values must be integers (WIDTH HEIGHT [X Y])")
+
+    if len(numbers) == 2:
+        return (numbers[0], numbers[1], None, None)
+    return (numbers[0], numbers[1], numbers[2], numbers[3])
+
+
+def _build_jobs(args) -> List[Job]:
+    """
+    Collect the systems requested on the command line into a single job list.
+
+    Args:
+        args: Parsed command-line arguments (argparse or fast-path namespace)
+
+    Returns:
+        List of (name, dat_file, rom_folder, override, export_folder) tuples
+    """
+    jobs: List[Job] = []
+    no_override = (None, None, None, None)
+
+    if args.fbneo:
+        dat_file, rom_folder = args.fbneo
+        jobs.append(("FinalBurn Neo", dat_file, rom_folder, args.fbneo_override or no_override,
+                     args.fbneo_export))
+
+    if args.mame:
+        dat_file, rom_folder = args.mame
+        jobs.append(("MAME", dat_file, rom_folder, args.mame_override or no_override,
+                     args.mame_export))
+
+    if args.system:
+        overrides = dict(args.system_override or [])
+        exports = {name: export_folder for name, export_folder in args.system_export or []}
+
+        for name, dat_file, rom_folder in args.system:
+            jobs.append((name, dat_file, rom_folder, overrides.get(name, no_override),
+                         exports.get(name)))
+
+    return jobs
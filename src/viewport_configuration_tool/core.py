@@ -5,12 +5,182 @@ This module contains the core functionality for parsing DAT files,
 managing ROM configurations, and applying viewport configurations.
 """
 
-import xml.etree.ElementTree as ET
+import functools
+import hashlib
+import marshal
+import mmap
+import os
+import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple, Callable, NamedTuple
 
+# lxml parses large DAT files several times faster; fall back to the stdlib parser
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+# Parsed DAT data is cached in the per-user cache folder as marshal data (plain
+# tuples, nothing executable) and reused while the DAT's (mtime, size) is
+# unchanged; bump the version when the cached layout changes
+DAT_CACHE_SUFFIX = '.vpcache'
+DAT_CACHE_VERSION = 2
+
+# The child elements _parse_game_element reads, fetched in one compiled XPath
+# sweep under lxml instead of a separate find() per field
+GAME_FIELD_TAGS = ('description', 'year', 'manufacturer', 'display', 'video')
+if HAS_LXML:
+    _GAME_FIELDS_XPATH = ET.XPath('|'.join(GAME_FIELD_TAGS))
+
+# Viewport settings in the order they are written at the top of a config file
+VIEWPORT_ORDER = (
+    'aspect_ratio_index',
+    'custom_viewport_x',
+    'custom_viewport_y',
+    'custom_viewport_width',
+    'custom_viewport_height',
+)
+VIEWPORT_KEYS = frozenset(VIEWPORT_ORDER)
+
+# Keys whose presence marks a config as holding a viewport override, and the
+# same names as bytes for scanning raw files
+OVERRIDE_KEYS = frozenset(('custom_viewport_width', 'custom_viewport_height', 'aspect_ratio_index'))
+OVERRIDE_MARKERS = tuple(key.encode('ascii') for key in OVERRIDE_KEYS)
+
+# Below this many files a thread pool costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+
+def _extract_game_fields(game) -> Optional[tuple]:
+    """
+    Pull the GameInfo fields out of a game/machine element.
+
+    This is the per-entry hot path of DAT parsing, so it works on plain locals
+    and returns a flat tuple rather than building objects itself.
+
+    Args:
+        game: A game or machine element (lxml or ElementTree)
+
+    Returns:
+        Tuple of (name, width, height, description, year, manufacturer, cloneof,
+        rotate, screen_type) with width/height still as strings, or None if the
+        entry has no name or no resolution data
+    """
+    game_name = game.get('name')
+    if not game_name:
+        return None
+
+    # Collect the interesting children in a single pass (first one of each tag wins)
+    fields = {}
+    for child in (_GAME_FIELDS_XPATH(game) if HAS_LXML else game):
+        tag = child.tag
+        if tag not in fields:
+            fields[tag] = child
+
+    width = height = None
+    rotate = screen_type = ""
+
+    # Try FinalBurn Neo format first (display tag)
+    display = fields.get('display')
+    if display is not None:
+        width = display.get('width')
+        height = display.get('height')
+        rotate = display.get('rotate') or display.get('orientation') or ""
+        screen_type = display.get('type') or ""
+
+    # If not found, try MAME/ClrMamePro format (video tag)
+    if not width or not height:
+        video = fields.get('video')
+        if video is not None:
+            width = video.get('width')
+            height = video.get('height')
+            rotate = video.get('rotate') or video.get('orientation') or ""
+            screen_type = video.get('screen') or video.get('type') or ""
+
+    # Entries without resolution data (BIOS, devices, ...) are skipped, so
+    # only read their metadata once we know they will be kept
+    if not width or not height:
+        return None
+
+    # The low-cardinality fields are interned so tens of thousands of games
+    # share one string per distinct value
+    intern = sys.intern
+    description = fields.get('description')
+    year = fields.get('year')
+    manufacturer = fields.get('manufacturer')
+    return (game_name, width, height,
+            (description.text or "") if description is not None else "",
+            intern((year.text or "") if year is not None else ""),
+            intern((manufacturer.text or "") if manufacturer is not None else ""),
+            intern(game.get('cloneof') or ""),
+            intern(rotate),
+            intern(screen_type))
+
+
+def _viewport_settings(width: Optional[int], height: Optional[int],
+                       x: Optional[int], y: Optional[int]) -> Dict[str, str]:
+    """Build the config entries for a viewport; width/height are left out when None."""
+    settings = {}
+    if width is not None:
+        settings['custom_viewport_width'] = f'"{width}"'
+    if height is not None:
+        settings['custom_viewport_height'] = f'"{height}"'
+    # Always write x and y (default to 0 if not set)
+    settings['custom_viewport_x'] = f'"{x if x is not None else 0}"'
+    settings['custom_viewport_y'] = f'"{y if y is not None else 0}"'
+    settings['aspect_ratio_index'] = '"23"'
+    return settings
+
+
+def _position_suffix(x: Optional[int], y: Optional[int]) -> str:
+    """Return the " at (x, y)" log suffix, or "" when no position is set."""
+    if x is None and y is None:
+        return ""
+    return f" at ({x if x is not None else 0}, {y if y is not None else 0})"
+
+
+def _parse_config_data(data: bytes) -> Dict[str, str]:
+    """Parse the raw bytes of a key = value config file into a dictionary."""
+    # One C-level split; partition() handles key/value in a single call
+    return {key.strip(): value.strip()
+            for key, sep, value in (line.partition('=')
+                                    for line in data.decode('utf-8', 'replace').splitlines())
+            if sep and not key.lstrip().startswith('#')}
+
+
+def _iter_file_entries(folder: Path, suffix: str):
+    """
+    Yield the DirEntry of each regular file in a folder whose name ends with suffix.
+
+    A single scandir pass; DirEntry.is_file() reuses the directory entry type,
+    so no per-file stat is needed. Hidden files are skipped, as glob('*') does.
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and not entry.name.startswith('.') and entry.is_file():
+                yield entry
+
+
+def _list_files(folder: Path, suffix: str) -> list:
+    """List the regular files in a folder whose names end with suffix."""
+    return [Path(entry.path) for entry in _iter_file_entries(folder, suffix)]
+
+
+def _user_cache_dir() -> Path:
+    """Return this tool's folder in the platform's per-user cache location."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+    elif sys.platform == 'darwin':
+        base = Path.home() / 'Library' / 'Caches'
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'viewport_configuration_tool'
+
 
 class GameInfo(NamedTuple):
     """Information about a game from DAT file."""
@@ -55,7 +225,12 @@ class ViewportConfigurationManager:
         self.override_y = override_y
         self.game_resolutions: Dict[str, Tuple[int, int]] = {}
         self.game_info: Dict[str, GameInfo] = {}  # Extended game information
+        self._resolution_pool: Dict[Tuple[int, int], Tuple[int, int]] = {}
         self.log_callback = log_callback or print
+        # Parsed config files keyed by path, tagged with (mtime_ns, size) at parse time
+        self._config_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+        # ROM names in the ROM folder, tagged with the folder's mtime_ns at scan time
+        self._rom_stems_cache: Optional[Tuple[int, frozenset]] = None
 
     def log(self, message: str) -> None:
         """Log a message using the callback or print."""
@@ -65,79 +240,40 @@ class ViewportConfigurationManager:
         """Parse the DAT file and extract game resolutions.
 
         Supports both FinalBurn Neo (display tag) and MAME (video tag) formats.
+        The file is streamed with iterparse (lxml when installed, otherwise the
+        standard library) and each game element is discarded once read, so
+        memory stays bounded even for very large MAME XML files.
         """
         if not self.dat_file:
             raise ValueError("DAT file not set")
 
+        try:
+            dat_stat = self.dat_file.stat()
+        except FileNotFoundError:
+            self.log(f"DAT file not found: {self.dat_file}")
+            raise
+
+        if self._load_dat_cache(dat_stat):
+            self.log(f"Loaded cached DAT data for {self.dat_file}")
+            self.log(f"Found {len(self.game_resolutions)} games with resolution data")
+            return
+
         self.log(f"Parsing DAT file: {self.dat_file}")
 
+        total_games = 0
+
         try:
-            tree = ET.parse(self.dat_file)
-            root = tree.getroot()
-
-            for game in root.findall('.//game'):
-                game_name = game.get('name')
-                if not game_name:
-                    continue
-
-                width = None
-                height = None
-                rotate = ""
-                screen_type = ""
-
-                # Extract metadata
-                description_elem = game.find('description')
-                year_elem = game.find('year')
-                manufacturer_elem = game.find('manufacturer')
-
-                description = description_elem.text if description_elem is not None and description_elem.text else ""
-                year = year_elem.text if year_elem is not None and year_elem.text else ""
-                manufacturer = manufacturer_elem.text if manufacturer_elem is not None and manufacturer_elem.text else ""
-                cloneof = game.get('cloneof', "")
-
-                # Try FinalBurn Neo format first (display tag)
-                display = game.find('.//display')
-                if display is not None:
-                    width = display.get('width')
-                    height = display.get('height')
-                    rotate = display.get('rotate', "") or display.get('orientation', "")
-                    screen_type = display.get('type', "")
-
-                # If not found, try MAME/ClrMamePro format (video tag)
-                if not width or not height:
-                    video = game.find('.//video')
-                    if video is not None:
-                        width = video.get('width')
-                        height = video.get('height')
-                        rotate = video.get('rotate', "") or video.get('orientation', "")
-                        screen_type = video.get('screen', "") or video.get('type', "")
-
-                if width and height:
-                    try:
-                        w = int(width)
-                        h = int(height)
-                        self.game_resolutions[game_name] = (w, h)
-
-                        # Store extended info
-                        self.game_info[game_name] = GameInfo(
-                            name=game_name,
-                            width=w,
-                            height=h,
-                            description=description,
-                            year=year,
-                            manufacturer=manufacturer,
-                            cloneof=cloneof,
-                            rotate=rotate,
-                            screen_type=screen_type
-                        )
-                    except ValueError:
-                        self.log(f"Warning: Invalid resolution for {game_name}: {width}x{height}")
+            for elem in self._iter_game_elements():
+                total_games += 1
+                self._parse_game_element(elem)
 
             self.log(f"Found {len(self.game_resolutions)} games with resolution data")
 
+            if self.game_resolutions:
+                self._save_dat_cache(dat_stat)
+
             if len(self.game_resolutions) == 0:
-                # Count total games to provide helpful feedback
-                total_games = len(root.findall('.//game')) + len(root.findall('.//machine'))
+                # Provide helpful feedback when entries exist but lack resolution data
                 if total_games > 0:
                     self.log(f"Warning: Found {total_games} game entries but none have resolution data.")
                     self.log("This DAT file may not contain display/video information.")
@@ -150,16 +286,148 @@ class ViewportConfigurationManager:
             self.log(f"DAT file not found: {self.dat_file}")
             raise
 
+    def _dat_cache_path(self) -> Path:
+        """Return the path of the parsed-data cache for the DAT file, named by a hash of its path."""
+        key = hashlib.sha256(os.fsencode(self.dat_file.resolve())).hexdigest()
+        return _user_cache_dir() / f"{key}{DAT_CACHE_SUFFIX}"
+
+    def _load_dat_cache(self, dat_stat: os.stat_result) -> bool:
+        """
+        Load parsed game data from the DAT cache if it matches the DAT file.
+
+        Args:
+            dat_stat: Current stat result of the DAT file
+
+        Returns:
+            True if the cache was valid and loaded, False otherwise
+        """
+        try:
+            with open(self._dat_cache_path(), 'rb') as f:
+                # Load straight from the mapped file instead of reading a copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    version, dat_path, mtime_ns, size, games = marshal.loads(data)
+        except Exception:
+            # Missing, empty, unreadable or stale-format caches are simply rebuilt
+            return False
+
+        if (version, dat_path, mtime_ns, size) != (DAT_CACHE_VERSION, str(self.dat_file.resolve()),
+                                                   dat_stat.st_mtime_ns, dat_stat.st_size):
+            return False
+
+        try:
+            game_info = {fields[0]: GameInfo._make(fields) for fields in games}
+        except (TypeError, ValueError):
+            return False
+
+        # Rebuild the resolution map, sharing one tuple per resolution as parsing does
+        pool = self._resolution_pool
+        self.game_resolutions = {name: pool.setdefault((g.width, g.height), (g.width, g.height))
+                                 for name, g in game_info.items()}
+        self.game_info = game_info
+        return True
+
+    def _save_dat_cache(self, dat_stat: os.stat_result) -> None:
+        """Write parsed game data to the DAT cache; failures are ignored."""
+        cache_path = self._dat_cache_path()
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        # GameInfo values go in as plain tuples; marshal cannot hold other types
+        payload = (DAT_CACHE_VERSION, str(self.dat_file.resolve()), dat_stat.st_mtime_ns,
+                   dat_stat.st_size, tuple(tuple(g) for g in self.game_info.values()))
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_path.write_bytes(marshal.dumps(payload))
+            # Atomic rename so concurrent readers never see a partial cache
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # The cache is only an optimization
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _iter_game_elements(self):
+        """Yield each game/machine element of the DAT file, freeing it once processed."""
+        if HAS_LXML:
+            # The tag filter skips everything else in C; entities are not resolved
+            context = ET.iterparse(str(self.dat_file), events=('end',), tag=('game', 'machine'),
+                                   huge_tree=True, resolve_entities=False)
+            for _, elem in context:
+                yield elem
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            return
+
+        root = None
+        for event, elem in ET.iterparse(str(self.dat_file), events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = elem
+                continue
+
+            if elem.tag in ('game', 'machine'):
+                yield elem
+                # Drop everything parsed so far to keep memory bounded
+                root.clear()
+
+    def _parse_game_element(self, game) -> None:
+        """Extract resolution and metadata from a single game/machine element."""
+        fields = _extract_game_fields(game)
+        if fields is None:
+            return
+
+        game_name, width, height = fields[0], fields[1], fields[2]
+        try:
+            w = int(width)
+            h = int(height)
+        except ValueError:
+            self.log(f"Warning: Invalid resolution for {game_name}: {width}x{height}")
+            return
+
+        # Only a few hundred distinct resolutions exist, so games share one tuple each
+        resolution = self._resolution_pool.setdefault((w, h), (w, h))
+        self.game_resolutions[game_name] = resolution
+
+        # Store extended info (fields are in GameInfo order, so build it positionally)
+        self.game_info[game_name] = GameInfo(game_name, w, h, *fields[3:])
+
     def get_rom_files(self) -> list:
         """Get list of ROM files in the ROM folder."""
         if not self.rom_folder or not self.rom_folder.exists():
             self.log(f"ROM folder not found: {self.rom_folder}")
             return []
 
-        rom_files = list(self.rom_folder.glob('*.zip'))
+        rom_files = _list_files(self.rom_folder, '.zip')
         self.log(f"Found {len(rom_files)} ROM files in {self.rom_folder}")
         return rom_files
 
+    def get_rom_stems(self) -> frozenset:
+        """
+        Get the names of the ROM files in the ROM folder, without the .zip suffix.
+
+        The folder is rescanned only when its modification time changes (a ROM
+        was added, removed or renamed); otherwise the last scan is reused.
+
+        Returns:
+            Frozenset of ROM names, empty if the ROM folder is missing
+        """
+        try:
+            folder_mtime = self.rom_folder.stat().st_mtime_ns if self.rom_folder else None
+        except OSError:
+            folder_mtime = None
+        if folder_mtime is None:
+            self.log(f"ROM folder not found: {self.rom_folder}")
+            return frozenset()
+
+        cached = self._rom_stems_cache
+        if cached is not None and cached[0] == folder_mtime:
+            return cached[1]
+
+        stems = frozenset(entry.name[:-4] for entry in _iter_file_entries(self.rom_folder, '.zip'))
+        self.log(f"Found {len(stems)} ROM files in {self.rom_folder}")
+        self._rom_stems_cache = (folder_mtime, stems)
+        return stems
+
     def read_config_file(self, config_path: Path) -> Dict[str, str]:
         """
         Read existing config file and return as dictionary.
@@ -170,14 +438,20 @@ class ViewportConfigurationManager:
         Returns:
             Dictionary of config key-value pairs
         """
-        config = {}
-        if config_path.exists():
-            with open(config_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if '=' in line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        config[key.strip()] = value.strip()
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            self._config_cache.pop(config_path, None)
+            return {}
+
+        # Serve unchanged files from memory; callers get their own copy to modify
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._config_cache.get(config_path)
+        if cached is not None and cached[0] == stamp:
+            return dict(cached[1])
+
+        config = _parse_config_data(config_path.read_bytes())
+        self._config_cache[config_path] = (stamp, dict(config))
         return config
 
     def write_config_file(self, config_path: Path, config: Dict[str, str]) -> None:
@@ -188,25 +462,30 @@ class ViewportConfigurationManager:
             config_path: Path to the config file
             config: Dictionary of config key-value pairs
         """
-        # Define preferred order for viewport settings
-        viewport_order = [
-            'aspect_ratio_index',
-            'custom_viewport_x',
-            'custom_viewport_y',
-            'custom_viewport_width',
-            'custom_viewport_height'
-        ]
-
-        with open(config_path, 'w') as f:
-            # Write viewport settings in preferred order first
-            for key in viewport_order:
-                if key in config:
-                    f.write(f'{key} = {config[key]}\n')
-
-            # Write any other settings in sorted order
-            for key, value in sorted(config.items()):
-                if key not in viewport_order:
-                    f.write(f'{key} = {value}\n')
+        # Viewport settings in preferred order first, then any other settings sorted
+        lines = [f'{key} = {config[key]}\n' for key in VIEWPORT_ORDER if key in config]
+        lines.extend(f'{key} = {value}\n' for key, value in sorted(config.items())
+                     if key not in VIEWPORT_KEYS)
+
+        # Build the whole file up front and hand it to the OS in one write on a
+        # raw descriptor, skipping the buffered file object entirely
+        data = ''.join(lines).encode('utf-8')
+        fd = os.open(config_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            stat = os.fstat(fd)
+        finally:
+            os.close(fd)
+
+        # Remember what was just written so the next read skips the parse
+        self._config_cache[config_path] = ((stat.st_mtime_ns, stat.st_size), dict(config))
+
+    def _delete_config_file(self, config_path: Path) -> None:
+        """Delete a config file and drop it from the config cache."""
+        self._config_cache.pop(config_path, None)
+        config_path.unlink()
 
     def update_rom_config(self, rom_name: str, width: int, height: int,
                           x: Optional[int] = None, y: Optional[int] = None) -> None:
@@ -220,6 +499,11 @@ class ViewportConfigurationManager:
             x: Optional viewport X position
             y: Optional viewport Y position
         """
+        self.log(self._update_rom_config(rom_name, _viewport_settings(width, height, x, y),
+                                         f"{width}x{height}{_position_suffix(x, y)}"))
+
+    def _update_rom_config(self, rom_name: str, settings: Dict[str, str], summary: str) -> str:
+        """Merge viewport settings into a ROM's config and return the log message."""
         # Use export folder if set, otherwise use ROM folder
         output_folder = self.export_folder if self.export_folder else self.rom_folder
         config_path = output_folder / f"{rom_name}.zip.cfg"
@@ -227,22 +511,18 @@ class ViewportConfigurationManager:
         # Read existing config or create new one
         config = self.read_config_file(config_path)
 
-        # Update viewport settings
-        config['custom_viewport_width'] = f'"{width}"'
-        config['custom_viewport_height'] = f'"{height}"'
-        # Always write x and y (default to 0 if not set)
-        config['custom_viewport_x'] = f'"{x if x is not None else 0}"'
-        config['custom_viewport_y'] = f'"{y if y is not None else 0}"'
-        config['aspect_ratio_index'] = '"23"'
+        # Re-runs mostly find the settings already in place; leave those files
+        # (and their mtimes) alone
+        if all(config.get(key) == value for key, value in settings.items()):
+            return f"Config for {rom_name}.zip already up to date: {summary}"
+
+        config.update(settings)
 
         # Write updated config
         self.write_config_file(config_path, config)
 
         action = "Updated" if config_path.exists() else "Created"
-        log_msg = f"{action} config for {rom_name}.zip: {width}x{height}"
-        if x is not None or y is not None:
-            log_msg += f" at ({x if x is not None else 0}, {y if y is not None else 0})"
-        self.log(log_msg)
+        return f"{action} config for {rom_name}.zip: {summary}"
 
     def remove_rom_config(self, rom_name: str, delete_if_empty: bool = True) -> Tuple[bool, bool]:
         """
@@ -274,8 +554,7 @@ class ViewportConfigurationManager:
 
         # Remove viewport settings
         removed_any = False
-        for key in ['custom_viewport_width', 'custom_viewport_height',
-                    'custom_viewport_x', 'custom_viewport_y', 'aspect_ratio_index']:
+        for key in VIEWPORT_ORDER:
             if key in config:
                 del config[key]
                 removed_any = True
@@ -288,7 +567,7 @@ class ViewportConfigurationManager:
         is_empty = not config
 
         if is_empty and delete_if_empty:
-            config_path.unlink()
+            self._delete_config_file(config_path)
             self.log(f"Removed config file for {rom_name}.zip (was empty after removing overrides)")
         elif is_empty:
             # Config is empty but we're not deleting - write empty config
@@ -323,7 +602,7 @@ class ViewportConfigurationManager:
             # Not empty, don't delete
             return False
 
-        config_path.unlink()
+        self._delete_config_file(config_path)
         self.log(f"Deleted empty config file: {rom_name}.zip.cfg")
         return True
 
@@ -345,42 +624,17 @@ class ViewportConfigurationManager:
             return 0, 0
 
         # Get all .cfg files
-        config_files = list(output_folder.glob('*.zip.cfg'))
+        config_files = _list_files(output_folder, '.zip.cfg')
         self.log(f"Found {len(config_files)} config files in {output_folder}")
 
         removed_count = 0
         skipped_count = 0
-        total = len(config_files)
-
-        for idx, config_file in enumerate(config_files, 1):
-            # Extract ROM name from config filename (remove .zip.cfg)
-            rom_name = config_file.stem.replace('.zip', '')
-
-            if progress_callback:
-                progress_callback(idx, total, rom_name)
-
-            # Read existing config
-            config = self.read_config_file(config_file)
-
-            # Check if it has viewport overrides
-            has_overrides = any(key in config for key in
-                              ['custom_viewport_width', 'custom_viewport_height', 'aspect_ratio_index'])
-
-            if has_overrides:
-                # Remove viewport settings
-                config.pop('custom_viewport_width', None)
-                config.pop('custom_viewport_height', None)
-                config.pop('aspect_ratio_index', None)
-
-                # If config is now empty, delete the file
-                if not config:
-                    config_file.unlink()
-                    self.log(f"Removed {config_file.name} (was empty after removing overrides)")
-                else:
-                    # Write updated config
-                    self.write_config_file(config_file, config)
-                    self.log(f"Removed viewport overrides from {config_file.name}")
 
+        items = [(config_file.stem.replace('.zip', ''), config_file) for config_file in config_files]
+        for rom_name, message in self._run_config_jobs(items, self._remove_overrides_from_file,
+                                                       progress_callback):
+            if message:
+                self.log(message)
                 removed_count += 1
             else:
                 skipped_count += 1
@@ -405,23 +659,18 @@ class ViewportConfigurationManager:
 
         processed_count = 0
         skipped_count = 0
-        total = len(rom_files)
-
-        for idx, rom_file in enumerate(rom_files, 1):
-            rom_name = rom_file.stem
 
-            if progress_callback:
-                progress_callback(idx, total, rom_name)
-
-            # Check if we have resolution data for this game
-            if rom_name in self.game_resolutions:
-                dat_width, dat_height = self.game_resolutions[rom_name]
-
-                # Use override values if specified, otherwise use DAT values
-                width = self.override_width if self.override_width is not None else dat_width
-                height = self.override_height if self.override_height is not None else dat_height
-
-                self.update_rom_config(rom_name, width, height, self.override_x, self.override_y)
+        # Settings that are the same for every ROM (position, aspect ratio and any
+        # size overrides) are formatted once up front
+        static_settings = _viewport_settings(self.override_width, self.override_height,
+                                             self.override_x, self.override_y)
+        worker = functools.partial(self._process_rom, static_settings=static_settings,
+                                   position=_position_suffix(self.override_x, self.override_y))
+
+        items = [(rom_file.stem, rom_file.stem) for rom_file in rom_files]
+        for rom_name, message in self._run_config_jobs(items, worker, progress_callback):
+            if message:
+                self.log(message)
                 processed_count += 1
             else:
                 self.log(f"Skipped {rom_name}.zip: No resolution data in DAT file")
@@ -433,12 +682,102 @@ class ViewportConfigurationManager:
 
         return processed_count, skipped_count
 
-    def backup_configs(self, backup_path: Optional[Path] = None) -> Tuple[bool, Optional[Path], Optional[str]]:
+    def _process_rom(self, rom_name: str, static_settings: Dict[str, str], position: str) -> Optional[str]:
+        """Update one ROM's config; returns the log message, or None if it has no resolution data."""
+        if rom_name not in self.game_resolutions:
+            return None
+
+        dat_width, dat_height = self.game_resolutions[rom_name]
+
+        # Use override values if specified, otherwise use DAT values
+        width = self.override_width if self.override_width is not None else dat_width
+        height = self.override_height if self.override_height is not None else dat_height
+
+        # Only the size can vary per ROM, and only when it is not overridden
+        settings = static_settings
+        if self.override_width is None or self.override_height is None:
+            settings = dict(static_settings)
+            settings['custom_viewport_width'] = f'"{width}"'
+            settings['custom_viewport_height'] = f'"{height}"'
+
+        return self._update_rom_config(rom_name, settings, f"{width}x{height}{position}")
+
+    def _remove_overrides_from_file(self, config_file: Path) -> Optional[str]:
+        """Strip viewport overrides from one config file; returns the log message, or None if it had none."""
+        # Cheap byte scan first so configs without overrides are never parsed
+        try:
+            data = config_file.read_bytes()
+        except FileNotFoundError:
+            return None
+        if not any(marker in data for marker in OVERRIDE_MARKERS):
+            return None
+
+        # Parse the bytes already in hand rather than reading the file again
+        config = _parse_config_data(data)
+
+        # Check if it has viewport overrides
+        if OVERRIDE_KEYS.isdisjoint(config):
+            return None
+
+        # Remove viewport settings
+        for key in OVERRIDE_KEYS:
+            config.pop(key, None)
+
+        # If config is now empty, delete the file
+        if not config:
+            self._delete_config_file(config_file)
+            return f"Removed {config_file.name} (was empty after removing overrides)"
+
+        # Write updated config
+        self.write_config_file(config_file, config)
+        return f"Removed viewport overrides from {config_file.name}"
+
+    def _run_config_jobs(self, items: list, worker: Callable,
+                         progress_callback: Optional[Callable[[int, int, str], None]] = None):
+        """
+        Run worker(arg) for each (rom_name, arg) pair and yield (rom_name, result).
+
+        Config work is small-file I/O that releases the GIL, so large batches
+        are spread over a thread pool. Results, logging and progress callbacks
+        are all handled on the calling thread, in completion order.
+
+        Args:
+            items: List of (rom_name, arg) pairs
+            worker: Callable run once per arg
+            progress_callback: Optional callback(current, total, rom_name) for progress updates
+        """
+        total = len(items)
+
+        if total < PARALLEL_THRESHOLD:
+            for idx, (rom_name, arg) in enumerate(items, 1):
+                if progress_callback:
+                    progress_callback(idx, total, rom_name)
+                yield rom_name, worker(arg)
+            return
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(worker, arg): rom_name for rom_name, arg in items}
+            for idx, future in enumerate(as_completed(futures), 1):
+                rom_name = futures[future]
+                if progress_callback:
+                    progress_callback(idx, total, rom_name)
+                yield rom_name, future.result()
+
+    def backup_configs(self, backup_path: Optional[Path] = None,
+                       compression: int = zipfile.ZIP_STORED,
+                       progress_callback: Optional[Callable[[int, int, str], None]] = None
+                       ) -> Tuple[bool, Optional[Path], Optional[str]]:
         """
         Create a zip backup of all config files in the ROM folder.
 
+        Config files are tiny, so they are stored uncompressed by default; pass
+        zipfile.ZIP_DEFLATED (or ZIP_ZSTANDARD on Python 3.14+) for a smaller archive.
+
         Args:
             backup_path: Optional path for the backup file. If None, generates a timestamped filename.
+            compression: zipfile compression method for the archive entries
+            progress_callback: Optional callback(current, total, file_name), called after each file is added
 
         Returns:
             Tuple of (success: bool, backup_path: Optional[Path], error_message: Optional[str])
@@ -452,7 +791,7 @@ class ViewportConfigurationManager:
             return False, None, error_msg
 
         # Get all .cfg files
-        config_files = list(config_folder.glob('*.cfg'))
+        config_files = _list_files(config_folder, '.cfg')
 
         if not config_files:
             error_msg = "No config files found to backup"
@@ -465,10 +804,18 @@ class ViewportConfigurationManager:
             backup_path = config_folder / f"config_backup_{timestamp}.zip"
 
         try:
-            with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for config_file in config_files:
-                    # Add file to zip with just the filename (no path)
-                    zipf.write(config_file, config_file.name)
+            # Compressed methods use their fastest level; ignored for ZIP_STORED
+            compresslevel = None if compression == zipfile.ZIP_STORED else 1
+            with zipfile.ZipFile(backup_path, 'w', compression, compresslevel=compresslevel) as zipf:
+                total = len(config_files)
+                for idx, config_file in enumerate(config_files, 1):
+                    # Add file to zip with just the filename (no path), keeping its
+                    # timestamp; reading it ourselves avoids zipfile reopening it
+                    info = zipfile.ZipInfo.from_file(config_file, config_file.name)
+                    zipf.writestr(info, config_file.read_bytes(),
+                                  compress_type=compression, compresslevel=compresslevel)
+                    if progress_callback:
+                        progress_callback(idx, total, config_file.name)
 
             self.log(f"Backup created: {backup_path}")
             self.log(f"Backed up {len(config_files)} config files")
@@ -5,11 +5,32 @@ This module handles downloading DAT files from predefined sources,
 including zip file extraction and error handling.
 """
 
+import gzip
+import shutil
+import threading
 import urllib.request
 import urllib.error
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, Optional, List, NamedTuple
+from typing import Dict, Tuple, Optional, List, NamedTuple
+
+# urllib3 keeps the TLS connection to the DAT host alive between downloads;
+# fall back to urllib.request (one connection per download) when missing
+try:
+    import urllib3
+    HAS_URLLIB3 = True
+except ImportError:
+    HAS_URLLIB3 = False
+
+# Stream downloads to disk in 1 MB chunks
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Concurrent downloads in download_all; also the size of the connection pool
+MAX_PARALLEL_DOWNLOADS = 4
+
+_pool = None
+_pool_lock = threading.Lock()
 
 
 class DATSource(NamedTuple):
@@ -83,7 +104,7 @@ def download_dat_file(source: DATSource, output_dir: Path) -> Tuple[bool, Option
 
     try:
         # Download file
-        urllib.request.urlretrieve(source.url, output_path)
+        _fetch_to_file(source.url, output_path)
 
         # If it's a zip file, extract it
         if source.filename.endswith('.zip'):
@@ -101,18 +122,18 @@ def download_dat_file(source: DATSource, output_dir: Path) -> Tuple[bool, Option
             # Regular DAT/XML file
             return True, output_path, None
 
-    except urllib.error.URLError as e:
-        # Network error
+    except HTTPError as e:
+        # HTTP error
         if output_path.exists():
             output_path.unlink()
-        error_msg = f"Network error: {str(e)}\n\nPlease check your internet connection."
+        error_msg = f"HTTP error:\nStatus code: {e.status_code}\nReason: {e.reason}"
         return False, None, error_msg
 
-    except urllib.error.HTTPError as e:
-        # HTTP error
+    except NetworkError as e:
+        # Network error
         if output_path.exists():
             output_path.unlink()
-        error_msg = f"HTTP error:\nStatus code: {e.code}\nReason: {e.reason}"
+        error_msg = f"Network error: {str(e)}\n\nPlease check your internet connection."
         return False, None, error_msg
 
     except Exception as e:
@@ -123,6 +144,79 @@ def download_dat_file(source: DATSource, output_dir: Path) -> Tuple[bool, Option
         return False, None, error_msg
 
 
+def download_all(sources: List[DATSource],
+                 output_dir: Path) -> Dict[str, Tuple[bool, Optional[Path], Optional[str]]]:
+    """
+    Download several DAT files concurrently.
+
+    Args:
+        sources: DATSources to download
+        output_dir: Directory to save the downloaded files
+
+    Returns:
+        Dictionary mapping each source name to its download_dat_file result
+    """
+    if not sources:
+        return {}
+
+    max_workers = min(len(sources), MAX_PARALLEL_DOWNLOADS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda source: download_dat_file(source, output_dir), sources)
+        return {source.name: result for source, result in zip(sources, results)}
+
+
+def _get_pool():
+    """Return the shared urllib3 connection pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = urllib3.PoolManager(maxsize=MAX_PARALLEL_DOWNLOADS, retries=urllib3.Retry(3, backoff_factor=0.5))
+        return _pool
+
+
+def _fetch_to_file(url: str, output_path: Path) -> None:
+    """
+    Stream a URL to a file, requesting gzip transfer encoding.
+
+    Args:
+        url: URL to download
+        output_path: File to write the response body to
+
+    Raises:
+        HTTPError: If the server returns an error status
+        NetworkError: If the server cannot be reached
+    """
+    headers = {'Accept-Encoding': 'gzip'}
+
+    if HAS_URLLIB3:
+        try:
+            resp = _get_pool().request('GET', url, headers=headers, preload_content=False)
+        except urllib3.exceptions.HTTPError as e:
+            raise NetworkError(str(e)) from e
+        try:
+            if resp.status >= 400:
+                raise HTTPError(f"HTTP {resp.status}", resp.status, resp.reason)
+            # resp.read() decodes gzip transparently
+            with open(output_path, 'wb') as f:
+                shutil.copyfileobj(resp, f, length=DOWNLOAD_CHUNK_SIZE)
+        finally:
+            resp.release_conn()
+        return
+
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request) as resp:
+            stream = resp
+            if resp.headers.get('Content-Encoding') == 'gzip':
+                stream = gzip.GzipFile(fileobj=resp)
+            with open(output_path, 'wb') as f:
+                shutil.copyfileobj(stream, f, length=DOWNLOAD_CHUNK_SIZE)
+    except urllib.error.HTTPError as e:
+        raise HTTPError(f"HTTP {e.code}", e.code, e.reason) from e
+    except urllib.error.URLError as e:
+        raise NetworkError(str(e)) from e
+
+
 def _extract_dat_from_zip(zip_path: Path, extract_dir: Path) -> Path:
     """
     Extract DAT/XML file from a zip archive.
@@ -152,9 +246,11 @@ def _extract_dat_from_zip(zip_path: Path, extract_dir: Path) -> Path:
             if not dat_file:
                 raise ZipExtractionError("No DAT or XML file found in zip archive.")
 
-            # Extract just the DAT file
-            zip_ref.extract(dat_file, extract_dir)
-            extracted_path = extract_dir / dat_file
+            # Extract just the DAT file, flattened into extract_dir (dropping any
+            # folders inside the archive also keeps it from escaping extract_dir)
+            extracted_path = extract_dir / Path(dat_file).name
+            with zip_ref.open(dat_file) as src, open(extracted_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, length=DOWNLOAD_CHUNK_SIZE)
 
             return extracted_path
 
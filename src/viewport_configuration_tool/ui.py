@@ -6,18 +6,373 @@ ROM viewport configurations across multiple emulation systems.
 """
 
 import curses
-import json
+import fnmatch
+import functools
+import itertools
 import os
+import re
+import stat
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 from .core import GameInfo, ViewportConfigurationManager
-from .network import get_dat_sources, download_dat_file
+from .network import get_dat_sources, download_all, download_dat_file
 from . import __version__
 
+# orjson encodes/decodes the settings file in C; fall back to the stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    import json
+    HAS_ORJSON = False
+
+
+def _dump_json(data) -> bytes:
+    """Serialize data as compact UTF-8 JSON."""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _load_json(data: bytes):
+    """Parse UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _stat_mode(path: str) -> Optional[int]:
+    """Return the st_mode of a path from a single stat, or None if it cannot be read."""
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+
+
+# Folder next to the package that downloaded DAT files are saved to
+_DOWNLOADED_DATS_DIR = Path(__file__).parent.parent.parent / "downloaded_dats"
+
+
+@functools.lru_cache(maxsize=1)
+def _downloaded_dats_dir() -> Path:
+    """Return the downloaded DAT folder, creating it on first use."""
+    _DOWNLOADED_DATS_DIR.mkdir(exist_ok=True)
+    return _DOWNLOADED_DATS_DIR
+
+
+@functools.lru_cache(maxsize=32)
+def _top_border(width: int) -> str:
+    """Return a top box border of the given total width."""
+    return "┌" + "─" * (width - 2) + "┐"
+
+
+@functools.lru_cache(maxsize=32)
+def _mid_border(width: int) -> str:
+    """Return a box separator line of the given total width."""
+    return "├" + "─" * (width - 2) + "┤"
+
+
+@functools.lru_cache(maxsize=32)
+def _bottom_border(width: int) -> str:
+    """Return a bottom box border of the given total width."""
+    return "└" + "─" * (width - 2) + "┘"
+
+
+@functools.lru_cache(maxsize=32)
+def _blank_row(width: int) -> str:
+    """Return an empty boxed row of the given total width."""
+    return "│" + " " * (width - 2) + "│"
+
+
+@functools.lru_cache(maxsize=32)
+def _separator(width: int) -> str:
+    """Return the '=' line between a game list and its details pane."""
+    return "=" * width
+
+
+@functools.lru_cache(maxsize=128)
+def _box_row(text: str, width: int) -> str:
+    """Return a boxed content row of the given total width, clipping the text."""
+    return "│ " + text[:width - 4].ljust(width - 3) + "│"
+
+
+@functools.lru_cache(maxsize=32)
+def _blank(width: int) -> str:
+    """Return a run of spaces of the given width."""
+    return " " * width
+
+
+@functools.lru_cache(maxsize=512)
+def _menu_row(text: str, is_selected: bool, width: int) -> str:
+    """Return a menu row clipped to width; the selected row is padded to fill it."""
+    if is_selected:
+        return f"> {text}".ljust(width)[:width]
+    return f"  {text}"[:width]
+
+
+@functools.lru_cache(maxsize=8)
+def _dat_browser_columns(total_width: int) -> Tuple[Tuple[int, ...], str]:
+    """
+    Lay out the DAT browser game list columns for a screen width.
+
+    Args:
+        total_width: Screen width in columns
+
+    Returns:
+        Tuple of (column widths, header line). The widths are, in order: name,
+        description, year, manufacturer, resolution, orientation, screen type,
+        clone, ROM status and override status
+    """
+    available_width = total_width - 4  # Leave some margin
+
+    # Calculate dynamic column widths based on available width
+    # Minimum widths for fixed columns
+    name_width = 15
+    year_width = 6
+    res_width = 11
+    orient_width = 6   # Orientation (rotate)
+    screen_width = 8   # Screen type (raster/vector/etc)
+    clone_width = 10
+    rom_width = 4      # ROM status (Y/N/-)
+    ovr_width = 4      # Override status (Y/N)
+
+    # Remaining width split between description and manufacturer
+    fixed_width = name_width + year_width + res_width + orient_width + screen_width + clone_width + rom_width + ovr_width + 8  # spaces between
+    remaining = available_width - fixed_width
+
+    if remaining > 30:
+        desc_width = int(remaining * 0.6)
+        mfr_width = remaining - desc_width
+    else:
+        desc_width = max(20, remaining // 2)
+        mfr_width = max(10, remaining - desc_width)
+
+    header = f"{'Name':<{name_width}} {'Desc':<{desc_width}} {'Year':<{year_width}} {'Mfr':<{mfr_width}} {'Res':<{res_width}} {'Orient':<{orient_width}} {'Screen':<{screen_width}} {'Clone':<{clone_width}} {'ROM':<{rom_width}} {'OVR':<{ovr_width}}"
+    return ((name_width, desc_width, year_width, mfr_width, res_width, orient_width,
+             screen_width, clone_width, rom_width, ovr_width), header)
+
+
+@functools.lru_cache(maxsize=8)
+def _game_list_columns(total_width: int) -> Tuple[Tuple[int, ...], str]:
+    """
+    Lay out the ROM collection game list columns for a screen width.
+
+    Args:
+        total_width: Screen width in columns
+
+    Returns:
+        Tuple of (column widths, header line). The widths are, in order: name,
+        description, year, manufacturer, resolution, orientation, screen type
+        and ROM status
+    """
+    available_width = total_width - 4
+
+    # Calculate dynamic column widths
+    name_width = 15
+    year_width = 6
+    res_width = 11
+    orient_width = 6
+    screen_width = 8
+    status_width = 8
+
+    fixed_width = name_width + year_width + res_width + orient_width + screen_width + status_width + 6
+    remaining = available_width - fixed_width
+
+    if remaining > 30:
+        desc_width = int(remaining * 0.6)
+        mfr_width = remaining - desc_width
+    else:
+        desc_width = max(20, remaining // 2)
+        mfr_width = max(10, remaining - desc_width)
+
+    header = f"{'Name':<{name_width}} {'Desc':<{desc_width}} {'Year':<{year_width}} {'Mfr':<{mfr_width}} {'Res':<{res_width}} {'Orient':<{orient_width}} {'Screen':<{screen_width}} {'Status':<{status_width}}"
+    return ((name_width, desc_width, year_width, mfr_width, res_width, orient_width,
+             screen_width, status_width), header)
+
+
+def _has_viewport_override(content: bytes, include_aspect_ratio: bool = False) -> bool:
+    """
+    Check raw config file bytes for viewport override keys.
+
+    Args:
+        content: Config file contents, undecoded
+        include_aspect_ratio: Also count aspect_ratio_index as an override
+
+    Returns:
+        True if custom_viewport_width/height (or aspect_ratio_index) is present
+    """
+    # One scan for the shared prefix rejects files without any viewport key;
+    # bytes "in" runs in C and beats a regex alternation here
+    if b'custom_viewport_' in content and (
+            b'custom_viewport_width' in content or b'custom_viewport_height' in content):
+        return True
+    return include_aspect_ratio and b'aspect_ratio_index' in content
+
+
+def _count_override_configs(folder: Path, stop_at_first: bool = False) -> Tuple[int, int]:
+    """
+    Count the config files in a folder and those holding viewport overrides.
+
+    Args:
+        folder: Folder holding the .zip.cfg files
+        stop_at_first: Stop at the first config with overrides
+
+    Returns:
+        Tuple of (config file count, count of those with overrides)
+    """
+    config_count = 0
+    override_count = 0
+    # One scandir pass, without building a Path per config as glob does
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith('.zip.cfg') or name.startswith('.'):
+                continue
+            config_count += 1
+            try:
+                with open(entry.path, 'rb') as f:
+                    content = f.read()
+            except OSError:
+                continue
+            if _has_viewport_override(content, include_aspect_ratio=True):
+                override_count += 1
+                if stop_at_first:
+                    break
+    return config_count, override_count
+
+
+# Map color pairs to their blue-background equivalents
+# 2->10 (success), 3->11 (error), 4->12 (warning), 5->13 (info)
+_BLUE_BACKGROUND_COLORS = {2: 10, 3: 11, 4: 12, 5: 13}
+
+
+# Keys each looping screen reacts to; anything else leaves the frame unchanged
+_MENU_KEYS = frozenset((curses.KEY_UP, curses.KEY_DOWN, ord('\n'), 27, ord('q')))
+_DAT_BROWSER_KEYS = _MENU_KEYS | frozenset(map(ord, "dD/cC"))
+_GAME_LIST_KEYS = _MENU_KEYS | frozenset(map(ord, "/cCQ"))
+_FILE_BROWSER_KEYS = _MENU_KEYS | frozenset((ord(' '),))
+_LOG_KEYS = frozenset((curses.KEY_UP, curses.KEY_DOWN, 27, ord('q')))
+
+
+def _fold_key(key: int) -> int:
+    """Map an upper-case ASCII letter key code to its lower-case code; other keys pass through."""
+    return key | 0x20 if 0x41 <= key <= 0x5A else key
+
+
+# Games held by the DAT browser list pad at a time; ncurses caps pad heights
+# near 32767 lines, below the size of a full MAME DAT
+_DAT_PAD_ROWS = 1024
+
+# Static (label, description) rows of the per-system menus, built once so the
+# hotkey index cached by menu_keys() stays warm between visits
+_CONFIG_MENU_ITEMS = (
+    ("[1] Set DAT File Path", "Browse or manually enter DAT file path"),
+    ("[2] Download and set DAT File from Web", "Download DAT file from libretro repositories"),
+    ("[3] Set ROM Folder Path", "Browse or manually enter ROM folder path"),
+    ("[4] Set Export Folder Path", "Set optional export folder for config files"),
+    ("[5] Set Viewport Configuration", "Configure viewport width, height, and position overrides"),
+    ("[6] Backup Config Files", "Create a zip backup of all config files"),
+    ("[7] Restore Config Files", "Restore config files from a zip backup"),
+    ("[8] Back", "Return to main menu"),
+)
+_DAT_FILE_MENU_ITEMS = (
+    ("[1] Browse for File", "Use file browser to select DAT file"),
+    ("[2] Manual Entry", "Manually enter the DAT file path"),
+    ("[3] Cancel", "Cancel and return to previous menu"),
+)
+_ROM_FOLDER_MENU_ITEMS = (
+    ("[1] Browse for Folder", "Use file browser to select ROM folder"),
+    ("[2] Manual Entry", "Manually enter the ROM folder path"),
+    ("[3] Cancel", "Cancel and return to previous menu"),
+)
+_EXPORT_FOLDER_MENU_ITEMS = (
+    ("[1] Browse for Folder", "Use file browser to select export folder"),
+    ("[2] Manual Entry", "Manually enter the export folder path"),
+    ("[3] Clear Export Folder", "Clear export folder setting (will use ROM folder)"),
+    ("[4] Cancel", "Cancel and return to previous menu"),
+)
+
+# Whether run() should cycle the screen once to stop ncurses flushing on every
+# cursor move. Only seen with ncurses 6.4 and later; other curses builds
+# (PDCurses/windows-curses has no ncurses_version) would just flash the screen
+_RESET_NCURSES_FLUSH = getattr(curses, 'ncurses_version', (0, 0, 0))[:2] >= (6, 4)
+
+# Screen whose color pairs are already set up; a fresh initscr() resets them
+_colors_screen = None
+
+
+def _init_colors(stdscr) -> None:
+    """Define the UI color pairs once per curses screen."""
+    global _colors_screen
+    if _colors_screen is stdscr:
+        return
+
+    curses.init_pair(1, curses.COLOR_YELLOW, curses.COLOR_BLUE)  # Selected - yellow on blue (matches footer)
+    curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)  # Success
+    curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)    # Error
+    curses.init_pair(4, curses.COLOR_YELLOW, curses.COLOR_BLACK) # Warning
+    curses.init_pair(5, curses.COLOR_CYAN, curses.COLOR_BLACK)   # Info
+    curses.init_pair(6, curses.COLOR_WHITE, curses.COLOR_BLACK)  # Box backgrounds - light on dark (A_DIM for muted effect)
+    curses.init_pair(7, curses.COLOR_CYAN, curses.COLOR_BLUE)    # Header background - cyan on blue
+    curses.init_pair(8, curses.COLOR_YELLOW, curses.COLOR_BLUE)  # Footer background - yellow on blue
+    curses.init_pair(9, curses.COLOR_WHITE, curses.COLOR_BLUE)   # Alert window background - white on blue
+    curses.init_pair(10, curses.COLOR_GREEN, curses.COLOR_BLUE)   # Success on blue
+    curses.init_pair(11, curses.COLOR_WHITE, curses.COLOR_BLUE)   # Error on blue (white for better readability)
+    curses.init_pair(12, curses.COLOR_YELLOW, curses.COLOR_BLUE)  # Warning on blue
+    curses.init_pair(13, curses.COLOR_CYAN, curses.COLOR_BLUE)    # Info on blue
+    curses.init_pair(14, curses.COLOR_WHITE, curses.COLOR_BLUE)   # White on blue
+
+    _colors_screen = stdscr
+
+
+@functools.lru_cache(maxsize=64)
+def _alert_layout(title: str, message: str, footer_text: str,
+                  screen_height: int, screen_width: int) -> Tuple[Tuple[str, ...], int, int, int, int]:
+    """
+    Compute the geometry of a centered alert window.
+
+    Args:
+        title: Window title
+        message: Message body, one content row per line
+        footer_text: Hint shown below the window
+        screen_height: Screen height in rows
+        screen_width: Screen width in columns
+
+    Returns:
+        Tuple of (lines, window_width, window_height, start_y, start_x)
+    """
+    lines = tuple(message.split('\n'))
+
+    # Calculate window size with padding
+    max_line_len = max(len(line) for line in lines) if lines else 0
+    max_line_len = max(max_line_len, len(title) + 4, len(footer_text) + 4)
+    window_width = min(max_line_len + 10, screen_width - 4)  # Increased padding
+    window_height = len(lines) + 6  # Title + content + borders + padding
+
+    # Calculate centered position
+    start_y = max(1, (screen_height - window_height) // 2)
+    start_x = max(1, (screen_width - window_width) // 2)
+
+    return lines, window_width, window_height, start_y, start_x
+
+
 class SystemConfig:
     """Configuration for a single emulation system."""
 
+    # Attributes written to the settings file by to_dict()
+    PERSISTED_FIELDS = frozenset((
+        "name", "dat_file", "rom_folder", "override_width", "override_height",
+        "override_x", "override_y", "export_folder",
+    ))
+
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = tuple(sorted(PERSISTED_FIELDS)) + ("manager",)
+
     def __init__(self, name: str, dat_file: str = "", rom_folder: str = "",
                  override_width: Optional[int] = None,
                  override_height: Optional[int] = None,
@@ -34,6 +389,11 @@ class SystemConfig:
         self.export_folder = export_folder
         self.manager: Optional[ViewportConfigurationManager] = None
 
+    @property
+    def output_location(self) -> str:
+        """Folder config files are written to: the export folder, else the ROM folder."""
+        return self.export_folder or self.rom_folder
+
     def to_dict(self) -> dict:
         """Convert system config to dictionary for JSON serialization."""
         return {
@@ -71,28 +431,38 @@ class CursesGUI:
         self.height, self.width = stdscr.getmaxyx()
 
         # Initialize colors
-        curses.init_pair(1, curses.COLOR_YELLOW, curses.COLOR_BLUE)  # Selected - yellow on blue (matches footer)
-        curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)  # Success
-        curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)    # Error
-        curses.init_pair(4, curses.COLOR_YELLOW, curses.COLOR_BLACK) # Warning
-        curses.init_pair(5, curses.COLOR_CYAN, curses.COLOR_BLACK)   # Info
-        curses.init_pair(6, curses.COLOR_WHITE, curses.COLOR_BLACK)  # Box backgrounds - light on dark (A_DIM for muted effect)
-        curses.init_pair(7, curses.COLOR_CYAN, curses.COLOR_BLUE)    # Header background - cyan on blue
-        curses.init_pair(8, curses.COLOR_YELLOW, curses.COLOR_BLUE)  # Footer background - yellow on blue
-        curses.init_pair(9, curses.COLOR_WHITE, curses.COLOR_BLUE)   # Alert window background - white on blue
-        curses.init_pair(10, curses.COLOR_GREEN, curses.COLOR_BLUE)   # Success on blue
-        curses.init_pair(11, curses.COLOR_WHITE, curses.COLOR_BLUE)   # Error on blue (white for better readability)
-        curses.init_pair(12, curses.COLOR_YELLOW, curses.COLOR_BLUE)  # Warning on blue
-        curses.init_pair(13, curses.COLOR_CYAN, curses.COLOR_BLUE)    # Info on blue
-        curses.init_pair(14, curses.COLOR_WHITE, curses.COLOR_BLUE)   # White on blue
+        _init_colors(stdscr)
+
+        # Attributes the list rows are drawn with, combined once
+        self.selected_attr = curses.color_pair(1) | curses.A_BOLD
+        self.found_attr = curses.color_pair(2)
+        self.missing_attr = curses.color_pair(3)
+        self.found_bold_attr = self.found_attr | curses.A_BOLD
+        self.missing_bold_attr = self.missing_attr | curses.A_BOLD
 
         # Multi-system support
         self.systems: List[SystemConfig] = []
+        # What the settings file last held: (system dicts, current index, auto-save)
+        self._saved_state: Optional[tuple] = None
+        # Hotkey maps per menu list: id -> (menu list, {key char: index}, accepted keys)
+        self._menu_key_index: Dict[int, Tuple[List, Dict[int, int], frozenset]] = {}
+        # Parsed DAT data shared by the DAT browser and system managers:
+        # absolute path -> (mtime_ns, size, game_resolutions, game_info). One
+        # entry per file; a changed file replaces its entry
+        self._dat_cache: Dict[str, Tuple[int, int, dict, dict]] = {}
+        # DAT browser search text per parsed game_info dict:
+        # id -> (game_info, [(lowercased searchable text, game), ...])
+        self._search_index_cache: Dict[int, Tuple[dict, List[Tuple[str, GameInfo]]]] = {}
+        # Games sorted by name per parsed game_info dict: id -> (game_info, games)
+        self._sorted_games_cache: Dict[int, Tuple[dict, List[GameInfo]]] = {}
+        # Configure screen status lines keyed by the settings and width they show
+        self._status_cache: Dict[tuple, Tuple[str, str, str, str]] = {}
         self.current_system_idx = 0
         self.auto_save_enabled = True  # Auto-save on exit by default
 
         # UI state
-        self.log_messages: List[str] = []
+        # Oldest messages fall off once the log holds 1000 entries
+        self.log_messages: Deque[str] = deque(maxlen=1000)
         self.current_screen = "main_menu"
 
         # Auto-load config if it exists
@@ -101,8 +471,6 @@ class CursesGUI:
     def log(self, message: str) -> None:
         """Add a message to the log."""
         self.log_messages.append(message)
-        if len(self.log_messages) > 1000:
-            self.log_messages = self.log_messages[-1000:]
 
     def sanitize_for_curses(self, text: str) -> str:
         """Sanitize text for safe display in curses (handles encoding issues)."""
@@ -141,17 +509,95 @@ class CursesGUI:
             # Silently ignore curses errors (usually from writing outside bounds)
             return False
 
+    def present(self) -> None:
+        """Flush the finished frame to the terminal in a single update."""
+        # Mark stdscr for output and let doupdate() emit one coalesced diff, so
+        # any overlay windows drawn in the same frame go out in the same write
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+
+    def wait_for_key(self, accepted: frozenset) -> int:
+        """
+        Block until a key the current screen reacts to is pressed.
+
+        Other keys are swallowed here, so the caller does not redraw a frame
+        that would come out identical. KEY_RESIZE is always returned.
+
+        Args:
+            accepted: Key codes the caller handles
+
+        Returns:
+            The key code pressed
+        """
+        while True:
+            key = self.stdscr.getch()
+            if key in accepted or key == curses.KEY_RESIZE:
+                return key
+
+    def wait_for_move(self, accepted: frozenset) -> Tuple[int, int]:
+        """
+        Like wait_for_key, but fold a burst of queued arrow keys into one move.
+
+        Holding Up/Down queues keys faster than a frame can be drawn; the ones
+        already waiting are read without blocking and summed, so the menu is
+        redrawn once for the whole burst. The first other key ends the burst
+        and is pushed back for the next read.
+
+        Args:
+            accepted: Key codes the caller handles
+
+        Returns:
+            Tuple of (key, delta): for arrow keys, the key is KEY_UP or KEY_DOWN
+            and delta the net number of rows to move down (negative for up);
+            for any other key, delta is 0
+        """
+        key = self.wait_for_key(accepted)
+        if key != curses.KEY_UP and key != curses.KEY_DOWN:
+            return key, 0
+
+        delta = 0
+        self.stdscr.nodelay(True)
+        try:
+            while key == curses.KEY_UP or key == curses.KEY_DOWN:
+                delta += 1 if key == curses.KEY_DOWN else -1
+                key = self.stdscr.getch()
+                while key != -1 and key not in accepted and key != curses.KEY_RESIZE:
+                    key = self.stdscr.getch()
+            if key != -1:
+                curses.ungetch(key)
+        finally:
+            self.stdscr.nodelay(False)
+
+        return (curses.KEY_DOWN if delta > 0 else curses.KEY_UP), delta
+
     def save_config(self) -> bool:
         """Save current system configurations to JSON file."""
         try:
+            state = self._config_state()
+            if self._state_unchanged(state) and self.CONFIG_FILE.exists():
+                # Nothing changed since the last save or load; the file is current
+                self.log(f"Configuration unchanged in {self.CONFIG_FILE}")
+                return True
+
             config_data = {
-                "systems": [system.to_dict() for system in self.systems],
+                "systems": state[0],
                 "current_system_idx": self.current_system_idx,
                 "auto_save_enabled": self.auto_save_enabled
             }
 
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            # Write beside the target and rename over it, so a crash mid-write
+            # leaves the previous configuration intact
+            tmp_path = self.CONFIG_FILE.with_name(f"{self.CONFIG_FILE.name}.tmp")
+            try:
+                tmp_path.write_bytes(_dump_json(config_data))
+                os.replace(tmp_path, self.CONFIG_FILE)
+            except OSError:
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+                raise
+            self._saved_state = state
 
             self.log(f"Configuration saved to {self.CONFIG_FILE}")
             return True
@@ -159,16 +605,29 @@ class CursesGUI:
             self.log(f"Error saving configuration: {e}")
             return False
 
+    def _config_state(self) -> tuple:
+        """Snapshot the persisted state as it would be written to the settings file."""
+        return (tuple(system.to_dict() for system in self.systems),
+                self.current_system_idx, self.auto_save_enabled)
+
+    def _state_unchanged(self, state: tuple) -> bool:
+        """Check whether state matches what was last saved or loaded."""
+        return self._saved_state == state
+
     def load_config(self) -> bool:
         """Load system configurations from JSON file."""
         try:
             if not self.CONFIG_FILE.exists():
                 return False
 
-            with open(self.CONFIG_FILE, 'r') as f:
-                config_data = json.load(f)
+            config_data = _load_json(self.CONFIG_FILE.read_bytes())
 
-            self.systems = [SystemConfig.from_dict(s) for s in config_data.get("systems", [])]
+            # Check the overall shape before building any SystemConfig objects
+            systems = config_data.get("systems", []) if isinstance(config_data, dict) else None
+            if not isinstance(systems, list) or not all(isinstance(s, dict) for s in systems):
+                raise ValueError("unexpected file layout")
+
+            self.systems = [SystemConfig.from_dict(s) for s in systems]
             self.current_system_idx = config_data.get("current_system_idx", 0)
             self.auto_save_enabled = config_data.get("auto_save_enabled", True)
 
@@ -178,6 +637,8 @@ class CursesGUI:
             else:
                 self.current_system_idx = 0
 
+            self._saved_state = self._config_state()
+
             self.log(f"Configuration loaded from {self.CONFIG_FILE}")
             self.log(f"Loaded {len(self.systems)} system(s)")
             return True
@@ -193,21 +654,20 @@ class CursesGUI:
     def draw_header(self, title: str) -> None:
         """Draw the header bar."""
         try:
-            self.stdscr.attron(curses.color_pair(7) | curses.A_BOLD)
             header_text = f" {title} "
-            self.stdscr.addstr(0, 0, header_text.ljust(self.width)[:self.width])
-            self.stdscr.attroff(curses.color_pair(7) | curses.A_BOLD)
+            self.stdscr.addstr(0, 0, header_text.ljust(self.width)[:self.width],
+                               curses.color_pair(7) | curses.A_BOLD)
         except curses.error:
             pass
 
     def draw_footer(self, text: str) -> None:
         """Draw the footer bar with help text."""
+        footer_y = self.height - 1
         try:
-            footer_y = self.height - 1
-            self.stdscr.attron(curses.color_pair(8) | curses.A_BOLD)
-            self.stdscr.addstr(footer_y, 0, text.ljust(self.width)[:self.width])
-            self.stdscr.attroff(curses.color_pair(8) | curses.A_BOLD)
+            self.stdscr.addstr(footer_y, 0, text.ljust(self.width)[:self.width],
+                               curses.color_pair(8) | curses.A_BOLD)
         except curses.error:
+            # Filling the bottom-right cell moves the cursor off-screen
             pass
 
     def draw_menu(self, title: str, items: List, selected: int, start_y: int = 2) -> None:
@@ -224,11 +684,9 @@ class CursesGUI:
             item_text = item[0] if isinstance(item, tuple) else item
 
             if idx == selected:
-                self.stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
-                self.stdscr.addstr(y, 2, f"> {item_text}".ljust(self.width - 4)[:self.width - 4])
-                self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
+                self.stdscr.addstr(y, 2, _menu_row(item_text, True, self.width - 4), curses.color_pair(1) | curses.A_BOLD)
             else:
-                self.stdscr.addstr(y, 2, f"  {item_text}"[:self.width - 4])
+                self.stdscr.addstr(y, 2, _menu_row(item_text, False, self.width - 4))
 
     def get_menu_selection_from_key(self, key: int, menu_items: List) -> Optional[int]:
         """
@@ -246,29 +704,52 @@ class CursesGUI:
         Returns:
             Index of the matching menu item, or None if no match
         """
-        key_char = chr(key) if 32 <= key <= 126 else None
-        if not key_char:
-            return None
+        # Keys are printable key codes, so any other key simply misses
+        return self._menu_key_entry(menu_items)[1].get(key)
+
+    def menu_keys(self, menu_items: List) -> frozenset:
+        """
+        Get the keys a menu reacts to, for wait_for_key.
+
+        Args:
+            menu_items: List of menu item strings or tuples (item_text, description)
 
+        Returns:
+            Navigation, Enter, Esc and q, plus each "[X]" hotkey of the menu
+        """
+        return self._menu_key_entry(menu_items)[2]
+
+    def _menu_key_entry(self, menu_items: List) -> Tuple[List, Dict[int, int], frozenset]:
+        """Get the cached (menu list, hotkey map, accepted keys) entry of a menu."""
+        entry = self._menu_key_index.get(id(menu_items))
+        # Holding the list keeps its id from being reused while cached
+        if entry is None or entry[0] is not menu_items:
+            if len(self._menu_key_index) >= 32:
+                self._menu_key_index.clear()
+            key_map = self._build_menu_key_map(menu_items)
+            entry = (menu_items, key_map, _MENU_KEYS.union(key_map))
+            self._menu_key_index[id(menu_items)] = entry
+        return entry
+
+    @staticmethod
+    def _build_menu_key_map(menu_items: List) -> Dict[int, int]:
+        """Map the key code of each printable "[X]" menu prefix to its item index."""
+        key_map: Dict[int, int] = {}
         for idx, item in enumerate(menu_items):
             # Handle both string items and tuple items (text, description)
             item_text = item[0] if isinstance(item, tuple) else item
 
-            # Extract prefix from [X] format
+            # Extract prefix from [X] format; the first item wins on duplicates
             if item_text.strip().startswith('[') and ']' in item_text:
                 start = item_text.index('[') + 1
                 end = item_text.index(']')
                 prefix = item_text[start:end].strip()
-                if prefix == key_char:
-                    return idx
-
-        return None
+                if len(prefix) == 1 and 32 <= ord(prefix) <= 126:
+                    key_map.setdefault(ord(prefix), idx)
+        return key_map
 
     def get_input(self, prompt: str, default: str = "") -> Optional[str]:
         """Get text input from user in a centered window."""
-        curses.echo()
-        curses.curs_set(1)
-
         # Build message lines
         lines = [prompt]
         if default:
@@ -287,75 +768,226 @@ class CursesGUI:
         start_x = max(1, (self.width - window_width) // 2)
 
         # Draw background with blue color for entire window area
-        self.stdscr.clear()
-        self.stdscr.attron(curses.color_pair(9))
+        self.stdscr.erase()
+        blue = curses.color_pair(9)
         for y in range(start_y, min(start_y + window_height + 2, self.height - 1)):
-            self.stdscr.addstr(y, start_x, " " * window_width)
+            self.stdscr.addstr(y, start_x, _blank(window_width), blue)
 
         # Top border with blue background
-        self.stdscr.addstr(start_y, start_x, "┌" + "─" * (window_width - 2) + "┐")
+        self.stdscr.addstr(start_y, start_x, _top_border(window_width), blue)
 
         # Title line with blue background
         title_text = " Input "
-        title_line = " " * (window_width - 2)
-        self.stdscr.addstr(start_y + 1, start_x, "│" + title_line + "│")
-        self.stdscr.attron(curses.color_pair(13) | curses.A_BOLD)  # Cyan on blue
-        self.stdscr.addstr(start_y + 1, start_x + (window_width - len(title_text)) // 2, title_text)
-        self.stdscr.attroff(curses.color_pair(13) | curses.A_BOLD)
-        self.stdscr.attron(curses.color_pair(9))
+        self.stdscr.addstr(start_y + 1, start_x, _blank_row(window_width), blue)
+        self.stdscr.addstr(start_y + 1, start_x + (window_width - len(title_text)) // 2, title_text,
+                           curses.color_pair(13) | curses.A_BOLD)  # Cyan on blue
 
         # Separator after title
-        self.stdscr.addstr(start_y + 2, start_x, "├" + "─" * (window_width - 2) + "┤")
+        self.stdscr.addstr(start_y + 2, start_x, _mid_border(window_width), blue)
 
         # Empty line for padding
-        self.stdscr.addstr(start_y + 3, start_x, "│" + " " * (window_width - 2) + "│")
+        self.stdscr.addstr(start_y + 3, start_x, _blank_row(window_width), blue)
 
         # Content lines with blue background
         content_y = start_y + 4
         for idx, line in enumerate(lines):
-            y = content_y + idx
-            content_line = " " * (window_width - 2)
-            self.stdscr.addstr(y, start_x, "│" + content_line + "│")
-            self.stdscr.attron(curses.color_pair(13))  # Cyan on blue for input content
-            # Center-align content
-            content_x = start_x + (window_width - len(line)) // 2
-            self.stdscr.addstr(y, content_x, line[:window_width - 4])
-            self.stdscr.attroff(curses.color_pair(13))
-            self.stdscr.attron(curses.color_pair(9))
+            # Cyan on blue for input content
+            self._draw_boxed_line(content_y + idx, start_x, window_width, line, 13)
 
         # Input line with blue background
         input_y = content_y + len(lines)
-        self.stdscr.addstr(input_y, start_x, "│" + " " * (window_width - 2) + "│")
+        self.stdscr.addstr(input_y, start_x, _blank_row(window_width), blue)
 
         # Empty line for padding
         padding_y = input_y + 1
-        self.stdscr.addstr(padding_y, start_x, "│" + " " * (window_width - 2) + "│")
+        self.stdscr.addstr(padding_y, start_x, _blank_row(window_width), blue)
 
         # Bottom border
         bottom_y = padding_y + 1
-        self.stdscr.addstr(bottom_y, start_x, "└" + "─" * (window_width - 2) + "┘")
-        self.stdscr.attroff(curses.color_pair(9))
+        self.stdscr.addstr(bottom_y, start_x, _bottom_border(window_width), blue)
 
-        self.stdscr.refresh()
+        self.present()
 
         # Get input at the input line position
         input_x = start_x + 3
         input_width = window_width - 6
+        # Show the cursor only once the window is drawn, right at the prompt
+        self.stdscr.leaveok(False)
+        curses.curs_set(1)
         try:
-            # Set color for input text (cyan on blue background)
-            self.stdscr.attron(curses.color_pair(13))
-            result = self.stdscr.getstr(input_y, input_x, input_width).decode('utf-8').strip()
-            self.stdscr.attroff(curses.color_pair(13))
+            # Cyan on blue for input text
+            result = self._read_line(input_y, input_x, input_width, curses.color_pair(13)).strip()
         except KeyboardInterrupt:
             result = None
 
-        curses.noecho()
         curses.curs_set(0)
+        self.stdscr.leaveok(True)
 
         if result == "" and default:
             return default
         return result if result else None
 
+    def get_form(self, title: str, fields: List[Tuple[str, str]]) -> Optional[List[str]]:
+        """
+        Edit several text fields on one screen in a centered window.
+
+        Up/Down or Tab/Shift-Tab move between fields, Enter moves to the next
+        field and submits on the last one, and Esc cancels. Only the rows a key
+        changed are repainted.
+
+        Args:
+            title: Prompt shown above the fields
+            fields: List of (label, initial value) pairs
+
+        Returns:
+            The stripped field values in field order, or None if cancelled
+        """
+        hint = "Tab/Up/Down: Field | Enter: Next/Save | Esc: Cancel"
+        label_width = max(len(label) for label, _ in fields)
+
+        # Calculate window size with padding
+        max_line_len = max(len(title), len(hint), label_width + 22, 40)
+        window_width = min(max_line_len + 10, self.width - 4)
+        window_height = len(fields) + 10  # Title + prompt + fields + hint + borders + padding
+        input_width = window_width - 8 - label_width
+
+        # Calculate centered position
+        start_y = max(1, (self.height - window_height) // 2)
+        start_x = max(1, (self.width - window_width) // 2)
+
+        # Draw background with blue color for entire window area
+        self.stdscr.erase()
+        blue = curses.color_pair(9)
+        for y in range(start_y, min(start_y + window_height + 2, self.height - 1)):
+            self.stdscr.addstr(y, start_x, _blank(window_width), blue)
+
+        self.stdscr.addstr(start_y, start_x, _top_border(window_width), blue)
+
+        title_text = " Input "
+        self.stdscr.addstr(start_y + 1, start_x, _blank_row(window_width), blue)
+        self.stdscr.addstr(start_y + 1, start_x + (window_width - len(title_text)) // 2, title_text,
+                           curses.color_pair(13) | curses.A_BOLD)  # Cyan on blue
+
+        self.stdscr.addstr(start_y + 2, start_x, _mid_border(window_width), blue)
+        self.stdscr.addstr(start_y + 3, start_x, _blank_row(window_width), blue)
+        self._draw_boxed_line(start_y + 4, start_x, window_width, title, 13)
+        self.stdscr.addstr(start_y + 5, start_x, _blank_row(window_width), blue)
+
+        fields_y = start_y + 6
+        for idx in range(len(fields)):
+            self.stdscr.addstr(fields_y + idx, start_x, _blank_row(window_width), blue)
+
+        hint_y = fields_y + len(fields) + 1
+        self.stdscr.addstr(hint_y - 1, start_x, _blank_row(window_width), blue)
+        self._draw_boxed_line(hint_y, start_x, window_width, hint, 9)
+        self.stdscr.addstr(hint_y + 1, start_x, _blank_row(window_width), blue)
+        self.stdscr.addstr(hint_y + 2, start_x, _bottom_border(window_width), blue)
+
+        values = [list(value[:input_width]) for _, value in fields]
+        value_x = start_x + 3 + label_width + 2
+
+        def draw_field(idx: int, focused: bool) -> None:
+            """Paint one field row; the focused label is bold."""
+            label_attr = curses.color_pair(13) | (curses.A_BOLD if focused else 0)
+            self.stdscr.addstr(fields_y + idx, start_x + 3, fields[idx][0].rjust(label_width) + ":", label_attr)
+            self.stdscr.addstr(fields_y + idx, value_x, "".join(values[idx]).ljust(input_width),
+                               curses.color_pair(13) | curses.A_UNDERLINE)
+
+        focused = 0
+        for idx in range(len(fields)):
+            draw_field(idx, idx == focused)
+
+        # Show the cursor while editing, at the end of the focused field
+        self.stdscr.leaveok(False)
+        curses.curs_set(1)
+        blocking = False  # Paint the form before the first key
+        try:
+            while True:
+                self.stdscr.nodelay(not blocking)
+                try:
+                    ch = self.stdscr.get_wch()
+                except curses.error:
+                    # Input drained: show the repainted rows once for the whole burst
+                    self.stdscr.move(fields_y + focused, value_x + len(values[focused]))
+                    self.present()
+                    blocking = True
+                    continue
+                blocking = False
+
+                chars = values[focused]
+                move = 0
+                if ch == '\x1b':
+                    return None
+                if ch in ('\n', '\r') or ch == curses.KEY_ENTER:
+                    if focused == len(fields) - 1:
+                        return ["".join(value).strip() for value in values]
+                    move = 1
+                elif ch == '\t' or ch == curses.KEY_DOWN:
+                    move = 1
+                elif ch == curses.KEY_BTAB or ch == curses.KEY_UP:
+                    move = -1
+                elif ch in ('\b', '\x7f') or ch == curses.KEY_BACKSPACE:
+                    if chars:
+                        chars.pop()
+                        draw_field(focused, True)
+                elif isinstance(ch, str) and ch.isprintable() and len(chars) < input_width:
+                    chars.append(ch)
+                    draw_field(focused, True)
+
+                if move:
+                    draw_field(focused, False)
+                    focused = (focused + move) % len(fields)
+                    draw_field(focused, True)
+        except KeyboardInterrupt:
+            return None
+        finally:
+            self.stdscr.nodelay(False)
+            curses.curs_set(0)
+            self.stdscr.leaveok(True)
+
+    def _read_line(self, y: int, x: int, width: int, attr: int) -> str:
+        """
+        Read one line of text typed into a field on the screen.
+
+        Keys are echoed into an in-memory buffer; the field is repainted and
+        the screen updated only once all pending input (e.g. a paste) has been
+        consumed, instead of once per character as getstr() does.
+
+        Args:
+            y: Row of the input field
+            x: Column where the input field starts
+            width: Maximum number of characters accepted
+            attr: Attributes used to draw the typed text
+
+        Returns:
+            The entered text, without the terminating Enter
+        """
+        chars: List[str] = []
+        blocking = False  # Paint the empty field before the first key
+        try:
+            while True:
+                self.stdscr.nodelay(not blocking)
+                try:
+                    ch = self.stdscr.get_wch()
+                except curses.error:
+                    # Input drained: repaint the field once for the whole burst
+                    self.stdscr.addstr(y, x, "".join(chars).ljust(width), attr)
+                    self.stdscr.move(y, x + len(chars))
+                    self.present()
+                    blocking = True
+                    continue
+                blocking = False
+
+                if ch in ('\n', '\r') or ch == curses.KEY_ENTER:
+                    return "".join(chars)
+                if ch in ('\b', '\x7f') or ch == curses.KEY_BACKSPACE:
+                    if chars:
+                        chars.pop()
+                elif isinstance(ch, str) and ch.isprintable() and len(chars) < width:
+                    chars.append(ch)
+        finally:
+            self.stdscr.nodelay(False)
+
     def file_browser(self, title: str, start_path: str = None,
                      select_dirs: bool = False, file_pattern: str = None) -> Optional[str]:
         """
@@ -370,108 +1002,86 @@ class CursesGUI:
         Returns:
             Selected path or None if cancelled
         """
-        if start_path and os.path.exists(start_path):
-            if os.path.isfile(start_path):
-                current_dir = Path(start_path).parent
-            else:
-                current_dir = Path(start_path)
-        else:
+        # One stat decides between "missing", "file" (open its folder) and "folder"
+        start_mode = _stat_mode(start_path) if start_path else None
+        if start_mode is None:
             current_dir = Path.home()
+        elif stat.S_ISREG(start_mode):
+            current_dir = Path(start_path).parent
+        else:
+            current_dir = Path(start_path)
+
+        # Support multiple patterns separated by semicolon, translated once into
+        # a single case-insensitive regex for the whole browsing session
+        pattern_re = None
+        if file_pattern:
+            patterns = [p.strip().lower() for p in file_pattern.split(';')]
+            pattern_re = re.compile('|'.join(fnmatch.translate(p) for p in patterns))
 
         selected = 0
         scroll_offset = 0
+        reload_dir = True
+        full_redraw = True
+        prev_selected = selected
+
+        # Footer
+        if select_dirs:
+            footer = "Up/Down: Navigate | Enter: Select Dir/Open | Space: Select Current Dir | Esc/q: Cancel"
+        else:
+            footer = "Up/Down: Navigate | Enter: Select/Open | Esc/q: Cancel"
 
         while True:
-            # Get directory contents
-            try:
-                items = []
-
-                # Add parent directory option
-                if current_dir.parent != current_dir:
-                    items.append(("../", True, current_dir.parent))
-
-                # List directories
-                dirs = sorted([d for d in current_dir.iterdir() if d.is_dir() and not d.name.startswith('.')])
-                for d in dirs:
-                    items.append((d.name + "/", True, d))
-
-                # List files (if not selecting directories only)
-                if not select_dirs:
-                    files = sorted([f for f in current_dir.iterdir() if f.is_file() and not f.name.startswith('.')])
-
-                    # Apply file pattern filter if specified
-                    if file_pattern:
-                        import fnmatch
-                        # Support multiple patterns separated by semicolon
-                        patterns = [p.strip() for p in file_pattern.split(';')]
-                        filtered_files = []
-                        for f in files:
-                            for pattern in patterns:
-                                if fnmatch.fnmatch(f.name.lower(), pattern.lower()):
-                                    filtered_files.append(f)
-                                    break
-                        files = filtered_files
-
-                    for f in files:
-                        items.append((f.name, False, f))
-
-            except PermissionError:
-                items = [("../", True, current_dir.parent)]
+            # Get directory contents only when entering a directory
+            if reload_dir:
+                items = self._list_browser_items(current_dir, select_dirs, pattern_re)
+                reload_dir = False
 
-            # Adjust scroll
+            # Adjust scroll; a shifted window needs every row repainted
             max_visible = self.height - 8
             if selected < scroll_offset:
                 scroll_offset = selected
+                full_redraw = True
             elif selected >= scroll_offset + max_visible:
                 scroll_offset = selected - max_visible + 1
+                full_redraw = True
 
             # Draw browser
-            self.stdscr.clear()
-            self.draw_header(title)
-
-            # Show current path
-            path_str = str(current_dir)
-            if len(path_str) > self.width - 10:
-                path_str = "..." + path_str[-(self.width - 13):]
-
-            self.stdscr.attron(curses.color_pair(5))
-            self.stdscr.addstr(2, 2, f"Path: {path_str}")
-            self.stdscr.attroff(curses.color_pair(5))
-
-            # Display items
-            y = 4
-            for idx in range(scroll_offset, min(scroll_offset + max_visible, len(items))):
-                if y >= self.height - 3:
-                    break
+            if full_redraw:
+                self.stdscr.erase()
+                self.draw_header(title)
 
-                name, is_dir, path = items[idx]
+                # Show current path
+                path_str = str(current_dir)
+                if len(path_str) > self.width - 10:
+                    path_str = "..." + path_str[-(self.width - 13):]
 
-                if idx == selected:
-                    self.stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
-                    self.stdscr.addstr(y, 2, f"> {name}".ljust(self.width - 4)[:self.width - 4])
-                    self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
-                else:
-                    if is_dir:
-                        self.stdscr.attron(curses.color_pair(5))
-                    self.stdscr.addstr(y, 2, f"  {name}"[:self.width - 4])
-                    if is_dir:
-                        self.stdscr.attroff(curses.color_pair(5))
+                self.stdscr.addstr(2, 2, f"Path: {path_str}", curses.color_pair(5))
 
-                y += 1
+                # Display items
+                y = 4
+                for idx in range(scroll_offset, min(scroll_offset + max_visible, len(items))):
+                    if y >= self.height - 3:
+                        break
+                    self._draw_browser_item(y, items[idx], idx == selected)
+                    y += 1
 
-            # Footer
-            if select_dirs:
-                footer = "Up/Down: Navigate | Enter: Select Dir/Open | Space: Select Current Dir | Esc/q: Cancel"
-            else:
-                footer = "Up/Down: Navigate | Enter: Select/Open | Esc/q: Cancel"
-            self.draw_footer(footer)
+                self.draw_footer(footer)
+                full_redraw = False
+            elif selected != prev_selected:
+                # Moving within the visible window only changes two rows
+                self._draw_browser_item(4 + prev_selected - scroll_offset, items[prev_selected], False)
+                self._draw_browser_item(4 + selected - scroll_offset, items[selected], True)
 
-            self.stdscr.refresh()
+            self.present()
+            prev_selected = selected
 
             # Handle input
-            key = self.stdscr.getch()
+            key = self.wait_for_key(_FILE_BROWSER_KEYS)
 
-            if key == curses.KEY_UP and selected > 0:
+            if key == curses.KEY_RESIZE:
+                self.height, self.width = self.stdscr.getmaxyx()
+                full_redraw = True
+            elif key == curses.KEY_UP and selected > 0:
                 selected -= 1
             elif key == curses.KEY_DOWN and selected < len(items) - 1:
                 selected += 1
@@ -486,116 +1096,188 @@ class CursesGUI:
                         current_dir = path
                         selected = 0
                         scroll_offset = 0
+                        reload_dir = True
+                        full_redraw = True
                     else:
                         # Select file
                         return str(path)
             elif key == 27 or key == ord('q'):  # ESC or q
                 return None
 
+    def _list_browser_items(self, current_dir: Path, select_dirs: bool,
+                            pattern_re: Optional[re.Pattern]) -> List[tuple]:
+        """
+        List the entries shown by the file browser for one directory.
+
+        Args:
+            current_dir: Directory to list
+            select_dirs: If True, list directories only
+            pattern_re: Optional compiled filter matched against lowercased file names
+
+        Returns:
+            List of (display name, is_dir, path) tuples, parent entry first
+        """
+        try:
+            items = []
+
+            # Add parent directory option
+            if current_dir.parent != current_dir:
+                items.append(("../", True, current_dir.parent))
+
+            # One scandir pass; DirEntry caches the entry type, so telling
+            # folders from files needs no extra stat per entry
+            dir_entries = []
+            file_entries = []
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir():
+                        dir_entries.append(entry)
+                    elif not select_dirs and entry.is_file():
+                        file_entries.append(entry)
+
+            # List directories
+            dir_entries.sort(key=lambda e: os.path.normcase(e.name))
+            for d in dir_entries:
+                items.append((d.name + "/", True, Path(d.path)))
+
+            # List files (if not selecting directories only)
+            if not select_dirs:
+                # Apply file pattern filter if specified, on the entry names so
+                # only the files kept get a Path object
+                if pattern_re is not None:
+                    file_entries = [f for f in file_entries if pattern_re.match(f.name.lower())]
+
+                file_entries.sort(key=lambda e: os.path.normcase(e.name))
+                for f in file_entries:
+                    items.append((f.name, False, Path(f.path)))
+
+        except PermissionError:
+            items = [("../", True, current_dir.parent)]
+
+        return items
+
+    def _draw_browser_item(self, y: int, item: tuple, is_selected: bool) -> None:
+        """Draw a single file browser row, highlighted when selected."""
+        name, is_dir, _ = item
+        self.stdscr.move(y, 0)
+        self.stdscr.clrtoeol()
+        if is_selected:
+            self.stdscr.addstr(y, 2, _menu_row(name, True, self.width - 4), curses.color_pair(1) | curses.A_BOLD)
+        elif is_dir:
+            self.stdscr.addstr(y, 2, _menu_row(name, False, self.width - 4), curses.color_pair(5))
+        else:
+            self.stdscr.addstr(y, 2, _menu_row(name, False, self.width - 4))
+
     def _draw_alert_window(self, title: str, message: str, footer_text: str,
                            color_pair: int = 5, footer_color: int = 5) -> tuple:
         """Shared method to draw a centered alert window. Returns (start_y, start_x, window_width, bottom_y)."""
-        lines = message.split('\n')
-
-        # Map color pairs to their blue-background equivalents
-        # 2->10 (success), 3->11 (error), 4->12 (warning), 5->13 (info)
-        color_map = {2: 10, 3: 11, 4: 12, 5: 13}
-        content_color = color_map.get(color_pair, 14)  # Default to white on blue
-        title_color = color_map.get(color_pair, 14)
-        footer_color_blue = color_map.get(footer_color, 14)
-
-        # Calculate window size with padding
-        max_line_len = max(len(line) for line in lines) if lines else 0
-        max_line_len = max(max_line_len, len(title) + 4, len(footer_text) + 4)
-        window_width = min(max_line_len + 10, self.width - 4)  # Increased padding
-        window_height = len(lines) + 6  # Title + content + borders + padding
+        lines, window_width, window_height, start_y, start_x = _alert_layout(
+            title, message, footer_text, self.height, self.width)
 
-        # Calculate centered position
-        start_y = max(1, (self.height - window_height) // 2)
-        start_x = max(1, (self.width - window_width) // 2)
+        content_color = _BLUE_BACKGROUND_COLORS.get(color_pair, 14)  # Default to white on blue
+        title_color = content_color
+        footer_color_blue = _BLUE_BACKGROUND_COLORS.get(footer_color, 14)
 
         # Draw shadow effect (bottom and right edges)
         shadow_offset = 1
         # Right shadow
         for y in range(start_y + 1, min(start_y + window_height + 2, self.height - 1)):
             if start_x + window_width + shadow_offset < self.width:
-                self.stdscr.attron(curses.A_DIM)
-                self.stdscr.addstr(y, start_x + window_width, "░")
-                self.stdscr.attroff(curses.A_DIM)
+                self.stdscr.addstr(y, start_x + window_width, "░", curses.A_DIM)
         # Bottom shadow
         if start_y + window_height + 2 < self.height - 1:
-            for x in range(start_x + shadow_offset, min(start_x + window_width + shadow_offset, self.width)):
-                self.stdscr.attron(curses.A_DIM)
-                self.stdscr.addstr(start_y + window_height + 2, x, "░")
-                self.stdscr.attroff(curses.A_DIM)
+            shadow_x = start_x + shadow_offset
+            shadow_len = min(start_x + window_width + shadow_offset, self.width) - shadow_x
+            self.stdscr.addstr(start_y + window_height + 2, shadow_x, "░" * shadow_len, curses.A_DIM)
 
         # Draw background with blue color for entire window area
-        self.stdscr.attron(curses.color_pair(9))
+        blue = curses.color_pair(9)
         for y in range(start_y, min(start_y + window_height + 2, self.height - 1)):
-            self.stdscr.addstr(y, start_x, " " * window_width)
+            self.stdscr.addstr(y, start_x, _blank(window_width), blue)
 
         # Top border with blue background
-        self.stdscr.addstr(start_y, start_x, "┌" + "─" * (window_width - 2) + "┐")
+        self.stdscr.addstr(start_y, start_x, _top_border(window_width), blue)
 
         # Title line with blue background
         title_text = f" {title} "
-        title_line = " " * (window_width - 2)
-        self.stdscr.addstr(start_y + 1, start_x, "│" + title_line + "│")
-        self.stdscr.attron(curses.color_pair(title_color) | curses.A_BOLD)
-        self.stdscr.addstr(start_y + 1, start_x + (window_width - len(title_text)) // 2, title_text)
-        self.stdscr.attroff(curses.color_pair(title_color) | curses.A_BOLD)
-        self.stdscr.attron(curses.color_pair(9))
+        self.stdscr.addstr(start_y + 1, start_x, _blank_row(window_width), blue)
+        self.stdscr.addstr(start_y + 1, start_x + (window_width - len(title_text)) // 2, title_text,
+                           curses.color_pair(title_color) | curses.A_BOLD)
 
         # Separator after title
-        self.stdscr.addstr(start_y + 2, start_x, "├" + "─" * (window_width - 2) + "┤")
+        self.stdscr.addstr(start_y + 2, start_x, _mid_border(window_width), blue)
 
         # Empty line for padding
-        self.stdscr.addstr(start_y + 3, start_x, "│" + " " * (window_width - 2) + "│")
+        self.stdscr.addstr(start_y + 3, start_x, _blank_row(window_width), blue)
 
         # Content lines with blue background
         for idx, line in enumerate(lines):
-            y = start_y + 4 + idx
-            content_line = " " * (window_width - 2)
-            self.stdscr.addstr(y, start_x, "│" + content_line + "│")
-            self.stdscr.attron(curses.color_pair(content_color))
-            # Center-align content within the window
-            content_x = start_x + (window_width - len(line)) // 2
-            self.stdscr.addstr(y, content_x, line[:window_width - 4])
-            self.stdscr.attroff(curses.color_pair(content_color))
-            self.stdscr.attron(curses.color_pair(9))
+            self._draw_boxed_line(start_y + 4 + idx, start_x, window_width, line, content_color)
 
         # Empty line for padding
         bottom_padding_y = start_y + 4 + len(lines)
-        self.stdscr.addstr(bottom_padding_y, start_x, "│" + " " * (window_width - 2) + "│")
+        self.stdscr.addstr(bottom_padding_y, start_x, _blank_row(window_width), blue)
 
         # Bottom border
         bottom_y = bottom_padding_y + 1
-        self.stdscr.addstr(bottom_y, start_x, "└" + "─" * (window_width - 2) + "┘")
+        self.stdscr.addstr(bottom_y, start_x, _bottom_border(window_width), blue)
 
         # Footer message below window with blue background
         footer_y = bottom_y + 1
         if footer_y < self.height - 1:
-            self.stdscr.addstr(footer_y, start_x, " " * window_width)
-            self.stdscr.attron(curses.color_pair(footer_color_blue))
-            self.stdscr.addstr(footer_y, start_x + (window_width - len(footer_text)) // 2, footer_text)
-            self.stdscr.attroff(curses.color_pair(footer_color_blue))
+            self.stdscr.addstr(footer_y, start_x, _blank(window_width), blue)
+            self.stdscr.addstr(footer_y, start_x + (window_width - len(footer_text)) // 2, footer_text,
+                               curses.color_pair(footer_color_blue))
 
-        self.stdscr.attroff(curses.color_pair(9))
 
         return start_y, start_x, window_width, bottom_y
 
+    def _draw_boxed_line(self, y: int, x: int, width: int, line: str, color_pair: int) -> None:
+        """
+        Draw one centered content row of a dialog box.
+
+        The whole row (borders, padding and text) goes out in a single addnstr
+        in the dialog's blue frame colour, then chgat recolors just the text span.
+        """
+        text = line[:width - 4]
+        # Center-align content within the window, keeping it inside the borders
+        offset = max(2, (width - len(line)) // 2)
+        row = "│" + " " * (offset - 1) + text + " " * (width - 2 - (offset - 1) - len(text)) + "│"
+        self.stdscr.addnstr(y, x, row, width, curses.color_pair(9))
+        if text:
+            self.stdscr.chgat(y, x + offset, len(text), curses.color_pair(color_pair))
+
+    def _snapshot_screen(self):
+        """Copy the current frame so a dialog drawn over it can be taken down again."""
+        # Sized from the window itself, which is current even mid-resize
+        backup = curses.newwin(*self.stdscr.getmaxyx(), 0, 0)
+        self.stdscr.overwrite(backup)
+        return backup
+
     def show_message(self, title: str, message: str, color_pair: int = 5) -> None:
         """Show a message in a centered window and wait for user to press a key."""
-        self._draw_alert_window(title, message, "Press any key to continue...", color_pair, 5)
-        self.stdscr.refresh()
-        self.stdscr.getch()
+        backup = self._snapshot_screen()
+        try:
+            self._draw_alert_window(title, message, "Press any key to continue...", color_pair, 5)
+            self.present()
+            self.stdscr.getch()
+        finally:
+            # Put back the frame underneath; the caller's next present() sends
+            # only the cells the dialog covered
+            backup.overwrite(self.stdscr)
 
     def show_confirm(self, title: str, message: str, color_pair: int = 5) -> bool:
         """Show a confirmation dialog in a centered window. Returns True if 'y' pressed."""
-        self._draw_alert_window(title, message, "Press 'y' to confirm, any other key to cancel", color_pair, 4)
-        self.stdscr.refresh()
-        key = self.stdscr.getch()
-        return key == ord('y') or key == ord('Y')
+        backup = self._snapshot_screen()
+        try:
+            self._draw_alert_window(title, message, "Press 'y' to confirm, any other key to cancel", color_pair, 4)
+            self.present()
+            key = self.stdscr.getch()
+        finally:
+            backup.overwrite(self.stdscr)
+        return _fold_key(key) == ord('y')
 
     def get_current_system(self) -> Optional[SystemConfig]:
         """Get the currently selected system."""
@@ -606,197 +1288,178 @@ class CursesGUI:
     def main_menu(self) -> None:
         """Display and handle the main menu."""
         selected = 0
+        # (hotkey, label, description, action); a None action exits the menu
         menu_items = [
-            ("1", "Manage Systems", "Add, edit, or remove system configurations"),
-            ("2", "Select Active System", "Choose which system to work with"),
-            ("3", "Configure Current System", "Set DAT file, ROM folder, and viewport configuration"),
-            ("4", "Browse DAT File", "Explore games in the DAT file with detailed metadata"),
-            ("5", "Process Current System", "Apply viewport configurations to current system ROMs"),
-            ("6", "Process All Systems", "Apply viewport configurations to all configured systems"),
-            ("7", "Remove Current System Overrides", "Remove viewport overrides from current system config files"),
-            ("8", "Remove All Systems Overrides", "Remove viewport overrides from all systems config files"),
-            ("s", "Save Configuration", "Save all system configurations to disk"),
-            ("c", "Load Configuration", "Load system configurations from disk"),
-            ("0", "Settings", "Configure application preferences"),
-            ("l", "View Log", "View application log messages"),
-            ("q", "Exit", "Quit the application")
+            ("1", "Manage Systems", "Add, edit, or remove system configurations", self.manage_systems),
+            ("2", "Select Active System", "Choose which system to work with", self.select_system),
+            ("3", "Configure Current System", "Set DAT file, ROM folder, and viewport configuration",
+             self.configure_current_system),
+            ("4", "Browse DAT File", "Explore games in the DAT file with detailed metadata", self.browse_dat_file),
+            ("5", "Process Current System", "Apply viewport configurations to current system ROMs",
+             self.process_current_system),
+            ("6", "Process All Systems", "Apply viewport configurations to all configured systems",
+             self.process_all_systems),
+            ("7", "Remove Current System Overrides", "Remove viewport overrides from current system config files",
+             self.remove_current_system_overrides),
+            ("8", "Remove All Systems Overrides", "Remove viewport overrides from all systems config files",
+             self.remove_all_systems_overrides),
+            ("s", "Save Configuration", "Save all system configurations to disk", self.save_config_menu),
+            ("c", "Load Configuration", "Load system configurations from disk", self.load_config_menu),
+            ("0", "Settings", "Configure application preferences", self.settings_menu),
+            ("l", "View Log", "View application log messages", self.view_log),
+            ("q", "Exit", "Quit the application", None)
         ]
 
-        while True:
-            self.stdscr.clear()
-            self.draw_header(f"Viewport Configuration Tool v{__version__} - Main Menu")
+        # Hotkey code (either case) -> menu index; Enter uses the selected index
+        key_index = {ord(char): idx for idx, item in enumerate(menu_items)
+                     for char in (item[0], item[0].upper())}
+        accepted_keys = frozenset((curses.KEY_UP, curses.KEY_DOWN, ord('\n'))).union(key_index)
 
-            # Display system overview
-            y = 2
-            self.stdscr.attron(curses.color_pair(5))
-            self.stdscr.addstr(y, 2, f"Systems: {len(self.systems)}")
-            auto_save_status = "On" if self.auto_save_enabled else "Off"
-            self.stdscr.addstr(y, self.width - 20, f"Auto-Save: {auto_save_status}")
-            self.stdscr.attroff(curses.color_pair(5))
-
-            # Display current system in a rectangle
-            current_system = self.get_current_system()
-            y += 2
-            box_width = self.width - 6
-            box_x = 3
+        full_redraw = True
+        prev_selected = selected
+        desc_y = self.height - 3
 
-            # Draw top border
-            self.stdscr.attron(curses.color_pair(6) | curses.A_DIM)
-            self.stdscr.addstr(y, box_x, "┌" + "─" * (box_width - 2) + "┐")
-            y += 1
+        while True:
+            if full_redraw:
+                # Static parts (header, system box, footer) only change after a
+                # sub-menu returns or the terminal is resized
+                self.stdscr.erase()
+                menu_y = self._draw_main_menu_chrome()
+                for idx, item in enumerate(menu_items):
+                    self._draw_main_menu_item(menu_y + idx, item, idx == selected)
+                desc_y = self.height - 3
+                full_redraw = False
+            elif selected != prev_selected:
+                # Arrow keys only move the highlight: repaint the two affected rows
+                self._draw_main_menu_item(menu_y + prev_selected, menu_items[prev_selected], False)
+                self._draw_main_menu_item(menu_y + selected, menu_items[selected], True)
 
-            if current_system:
-                # Current system name
-                system_line = f"Current System: {current_system.name}"
-                self.stdscr.attron(curses.color_pair(6) | curses.A_DIM | curses.A_BOLD)
-                self.stdscr.addstr(y, box_x, "│ " + system_line[:box_width-4].ljust(box_width-3) + "│")
-                self.stdscr.attroff(curses.color_pair(6) | curses.A_DIM | curses.A_BOLD)
-                y += 1
+            # Show description of selected option at bottom
+            description = menu_items[selected][2]
+            self.stdscr.move(desc_y, 0)
+            self.stdscr.clrtoeol()
+            self.stdscr.addstr(desc_y, 2, description[:self.width-4], curses.color_pair(5))
 
-                # DAT file
-                self.stdscr.attron(curses.color_pair(6) | curses.A_DIM)
-                dat_status = current_system.dat_file if current_system.dat_file else "[Not Set]"
-                dat_line = f"  DAT: {dat_status}"
-                self.stdscr.addstr(y, box_x, "│ " + dat_line[:box_width-4].ljust(box_width-3) + "│")
-                y += 1
+            self.present()
+            prev_selected = selected
 
-                # ROM folder
-                rom_status = current_system.rom_folder if current_system.rom_folder else "[Not Set]"
-                rom_line = f"  ROMs: {rom_status}"
-                self.stdscr.addstr(y, box_x, "│ " + rom_line[:box_width-4].ljust(box_width-3) + "│")
-                y += 1
+            key = self.wait_for_key(accepted_keys)
 
-                # Export folder
-                export_status = current_system.export_folder if current_system.export_folder else "[None - use ROM folder]"
-                export_line = f"  Export: {export_status}"
-                self.stdscr.addstr(y, box_x, "│ " + export_line[:box_width-4].ljust(box_width-3) + "│")
-                y += 1
+            # Anything but plain navigation may change the screen underneath
+            if key not in (curses.KEY_UP, curses.KEY_DOWN):
+                full_redraw = True
 
-                # Override
-                override_status = f"{current_system.override_width}x{current_system.override_height}" \
-                    if current_system.override_width else "[None]"
-                override_line = f"  Override: {override_status}"
-                self.stdscr.addstr(y, box_x, "│ " + override_line[:box_width-4].ljust(box_width-3) + "│")
+            # Handle navigation
+            if key == curses.KEY_RESIZE:
+                self.height, self.width = self.stdscr.getmaxyx()
+            elif key == curses.KEY_UP and selected > 0:
+                selected -= 1
+            elif key == curses.KEY_DOWN and selected < len(menu_items) - 1:
+                selected += 1
             else:
-                # No system configured
-                msg = "No systems configured - use 'Manage Systems' to add one"
-                self.stdscr.attron(curses.color_pair(6) | curses.A_DIM)
-                self.stdscr.addstr(y, box_x, "│ " + msg[:box_width-4].ljust(box_width-3) + "│")
-
+                # Direct hotkey, or Enter on the selected item
+                idx = selected if key == ord('\n') else key_index.get(key)
+                if idx is not None:
+                    action = menu_items[idx][3]
+                    if action is None:
+                        break
+                    action()
+
+    def _draw_main_menu_chrome(self) -> int:
+        """Draw the static parts of the main menu. Returns the y of the first menu item."""
+        self.draw_header(f"Viewport Configuration Tool v{__version__} - Main Menu")
+
+        # Display system overview
+        y = 2
+        self.stdscr.addstr(y, 2, f"Systems: {len(self.systems)}", curses.color_pair(5))
+        auto_save_status = "On" if self.auto_save_enabled else "Off"
+        self.stdscr.addstr(y, self.width - 20, f"Auto-Save: {auto_save_status}", curses.color_pair(5))
+
+        # Display current system in a rectangle
+        current_system = self.get_current_system()
+        y += 2
+        box_width = self.width - 6
+        box_x = 3
+
+        # Draw top border
+        box_attr = curses.color_pair(6) | curses.A_DIM
+        self.stdscr.addstr(y, box_x, _top_border(box_width), box_attr)
+        y += 1
+
+        if current_system:
+            # Current system name
+            system_line = f"Current System: {current_system.name}"
+            self.stdscr.addstr(y, box_x, _box_row(system_line, box_width),
+                               box_attr | curses.A_BOLD)
             y += 1
-            # Draw bottom border
-            self.stdscr.addstr(y, box_x, "└" + "─" * (box_width - 2) + "┘")
-            self.stdscr.attroff(curses.color_pair(6) | curses.A_DIM)
-
-            # Menu items
-            y += 2
-            for idx, (key, label, _) in enumerate(menu_items):
-                if idx == selected:
-                    self.stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
-                    self.stdscr.addstr(y, 4, f"> [{key}] {label}")
-                    self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
-                else:
-                    self.stdscr.addstr(y, 4, f"  [{key}] {label}")
-                y += 1
 
-            # Show description of selected option at bottom
-            _, _, description = menu_items[selected]
-            desc_y = self.height - 3
-            self.stdscr.attron(curses.color_pair(5))
-            self.stdscr.addstr(desc_y, 2, description[:self.width-4])
-            self.stdscr.attroff(curses.color_pair(5))
+            # DAT file
+            dat_status = current_system.dat_file if current_system.dat_file else "[Not Set]"
+            dat_line = f"  DAT: {dat_status}"
+            self.stdscr.addstr(y, box_x, _box_row(dat_line, box_width), box_attr)
+            y += 1
 
-            self.draw_footer("Up/Down: Navigate | 1-8/s/c/0/l: Select | Enter: Confirm | q: Quit")
-            self.stdscr.refresh()
+            # ROM folder
+            rom_status = current_system.rom_folder if current_system.rom_folder else "[Not Set]"
+            rom_line = f"  ROMs: {rom_status}"
+            self.stdscr.addstr(y, box_x, _box_row(rom_line, box_width), box_attr)
+            y += 1
 
-            key = self.stdscr.getch()
+            # Export folder
+            export_status = current_system.export_folder if current_system.export_folder else "[None - use ROM folder]"
+            export_line = f"  Export: {export_status}"
+            self.stdscr.addstr(y, box_x, _box_row(export_line, box_width), box_attr)
+            y += 1
 
-            # Handle navigation
-            if key == curses.KEY_UP and selected > 0:
-                selected -= 1
-            elif key == curses.KEY_DOWN and selected < len(menu_items) - 1:
-                selected += 1
-            # Direct key execution
-            elif key == ord('1'):
-                self.manage_systems()
-            elif key == ord('2'):
-                self.select_system()
-            elif key == ord('3'):
-                self.configure_current_system()
-            elif key == ord('4'):
-                self.browse_dat_file()
-            elif key == ord('5'):
-                self.process_current_system()
-            elif key == ord('6'):
-                self.process_all_systems()
-            elif key == ord('7'):
-                self.remove_current_system_overrides()
-            elif key == ord('8'):
-                self.remove_all_systems_overrides()
-            elif key == ord('s') or key == ord('S'):
-                self.save_config_menu()
-            elif key == ord('c') or key == ord('C'):
-                self.load_config_menu()
-            elif key == ord('0'):
-                self.settings_menu()
-            elif key == ord('l') or key == ord('L'):
-                self.view_log()
-            elif key == ord('q') or key == ord('Q'):
-                break
-            # Enter key executes selected item
-            elif key == ord('\n'):
-                if selected == 0:
-                    self.manage_systems()
-                elif selected == 1:
-                    self.select_system()
-                elif selected == 2:
-                    self.configure_current_system()
-                elif selected == 3:
-                    self.browse_dat_file()
-                elif selected == 4:
-                    self.process_current_system()
-                elif selected == 5:
-                    self.process_all_systems()
-                elif selected == 6:
-                    self.remove_current_system_overrides()
-                elif selected == 7:
-                    self.remove_all_systems_overrides()
-                elif selected == 8:
-                    self.save_config_menu()
-                elif selected == 9:
-                    self.load_config_menu()
-                elif selected == 10:
-                    self.settings_menu()
-                elif selected == 11:
-                    self.view_log()
-                elif selected == 12:
-                    break
+            # Override
+            override_status = f"{current_system.override_width}x{current_system.override_height}" \
+                if current_system.override_width else "[None]"
+            override_line = f"  Override: {override_status}"
+            self.stdscr.addstr(y, box_x, _box_row(override_line, box_width), box_attr)
+        else:
+            # No system configured
+            msg = "No systems configured - use 'Manage Systems' to add one"
+            self.stdscr.addstr(y, box_x, _box_row(msg, box_width), box_attr)
+
+        y += 1
+        # Draw bottom border
+        self.stdscr.addstr(y, box_x, _bottom_border(box_width), box_attr)
+
+        # Footer sits below everything else and never changes
+        self.draw_footer("Up/Down: Navigate | 1-8/s/c/0/l: Select | Enter: Confirm | q: Quit")
+
+        # Menu items start two rows below the system box
+        return y + 2
+
+    def _draw_main_menu_item(self, y: int, item: tuple, is_selected: bool) -> None:
+        """Draw a single main menu row, highlighted when selected."""
+        key, label = item[:2]
+        self.stdscr.move(y, 0)
+        self.stdscr.clrtoeol()
+        if is_selected:
+            self.stdscr.addstr(y, 4, f"> [{key}] {label}", curses.color_pair(1) | curses.A_BOLD)
+        else:
+            self.stdscr.addstr(y, 4, f"  [{key}] {label}")
 
     def settings_menu(self) -> None:
         """Settings menu for configuring application preferences."""
         selected = 0
 
         while True:
-            self.stdscr.clear()
+            self.stdscr.erase()
             self.draw_header("Settings")
 
             y = 2
-            self.stdscr.attron(curses.color_pair(5))
-            self.stdscr.addstr(y, 2, "Current Settings:")
-            self.stdscr.attroff(curses.color_pair(5))
+            self.stdscr.addstr(y, 2, "Current Settings:", curses.color_pair(5))
 
             y += 2
             auto_save_status = "Enabled" if self.auto_save_enabled else "Disabled"
             auto_save_color = 2 if self.auto_save_enabled else 3
             self.stdscr.addstr(y, 4, "Auto-Save on Exit: ")
-            self.stdscr.attron(curses.color_pair(auto_save_color) | curses.A_BOLD)
-            self.stdscr.addstr(auto_save_status)
-            self.stdscr.attroff(curses.color_pair(auto_save_color) | curses.A_BOLD)
+            self.stdscr.addstr(auto_save_status, curses.color_pair(auto_save_color) | curses.A_BOLD)
 
             y += 1
-            self.stdscr.attron(curses.color_pair(4))
-            self.stdscr.addstr(y, 4, f"Config File: {self.CONFIG_FILE}")
-            self.stdscr.attroff(curses.color_pair(4))
+            self.stdscr.addstr(y, 4, f"Config File: {self.CONFIG_FILE}", curses.color_pair(4))
 
             y += 2
             menu_items = [
@@ -808,16 +1471,16 @@ class CursesGUI:
             # Show description of selected option at bottom
             _, description = menu_items[selected]
             desc_y = self.height - 3
-            self.stdscr.attron(curses.color_pair(5))
-            self.stdscr.addstr(desc_y, 2, description[:self.width-4])
-            self.stdscr.attroff(curses.color_pair(5))
+            self.stdscr.addstr(desc_y, 2, description[:self.width-4], curses.color_pair(5))
 
             self.draw_footer("Up/Down: Navigate | Enter: Select | Esc/q: Back")
-            self.stdscr.refresh()
+            self.present()
 
-            key = self.stdscr.getch()
+            key = self.wait_for_key(_MENU_KEYS)
 
-            if key == curses.KEY_UP and selected > 0:
+            if key == curses.KEY_RESIZE:
+                self.height, self.width = self.stdscr.getmaxyx()
+            elif key == curses.KEY_UP and selected > 0:
                 selected -= 1
             elif key == curses.KEY_DOWN and selected < len(menu_items) - 1:
                 selected += 1
@@ -870,6 +1533,78 @@ class CursesGUI:
             else:
                 self.show_message("Error", "Failed to load configuration.\nCheck the log for details.", 3)
 
+    def _load_dat(self, manager: ViewportConfigurationManager, dat_file: str) -> None:
+        """Parse the DAT file into the manager, reusing an earlier parse of the same file."""
+        st = os.stat(dat_file)
+        path = os.path.abspath(dat_file)
+
+        cached = self._dat_cache.get(path)
+        if cached is not None:
+            if cached[:2] == (st.st_mtime_ns, st.st_size):
+                # The manager only reads these dicts, so sharing them is safe
+                manager.game_resolutions, manager.game_info = cached[2:]
+                return
+            # The file changed; drop the stale parse and everything built from it
+            self._forget_game_info(cached[3])
+
+        # A first parse of a large DAT takes a moment; say so instead of
+        # leaving the previous screen frozen until the result is ready
+        self.draw_footer(f"Reading DAT file {os.path.basename(dat_file)}...")
+        self.present()
+        manager.parse_dat_file()
+        self._dat_cache[path] = (st.st_mtime_ns, st.st_size,
+                                 manager.game_resolutions, manager.game_info)
+
+    def _forget_game_info(self, game_info: dict) -> None:
+        """Drop the sorted games and search index built from a superseded DAT parse."""
+        self._sorted_games_cache.pop(id(game_info), None)
+        self._search_index_cache.pop(id(game_info), None)
+
+    def _sorted_games(self, game_info: dict) -> List[GameInfo]:
+        """
+        Get the games of a parsed DAT sorted by name, sorted once per parsed DAT.
+
+        Args:
+            game_info: Parsed game info dict (name -> GameInfo)
+
+        Returns:
+            List of GameInfo ordered by name; callers must not modify it
+        """
+        cached = self._sorted_games_cache.get(id(game_info))
+        # The cache holds the dict itself, so a matching id is the same dict
+        if cached is not None and cached[0] is game_info:
+            return cached[1]
+
+        # Names are the dict keys, so sorting plain strings needs no key function
+        games = [game_info[name] for name in sorted(game_info)]
+        self._sorted_games_cache[id(game_info)] = (game_info, games)
+        return games
+
+    def _search_index(self, game_info: dict, games: List[GameInfo]) -> List[Tuple[str, GameInfo]]:
+        """
+        Get the DAT browser search text of each game, built once per parsed DAT.
+
+        Args:
+            game_info: Parsed game info dict the games come from
+            games: The games of game_info, in display order
+
+        Returns:
+            List of (lowercased searchable text, game) pairs in the order of games
+        """
+        cached = self._search_index_cache.get(id(game_info))
+        # The cache holds the dict itself, so a matching id is the same dict
+        if cached is not None and cached[0] is game_info:
+            return cached[1]
+
+        # Lowercase the searchable fields once; NUL keeps a match from
+        # spanning two fields
+        index = [
+            (f"{g.name}\0{g.description}\0{g.year}\0{g.manufacturer}".lower(), g)
+            for g in games
+        ]
+        self._search_index_cache[id(game_info)] = (game_info, index)
+        return index
+
     def browse_dat_file(self) -> None:
         """Browse DAT file with detailed information, split view, and filtering."""
         system = self.get_current_system()
@@ -893,9 +1628,9 @@ class CursesGUI:
                 None,  # No export folder needed for browsing
                 log_callback=self.log
             )
-            temp_manager.parse_dat_file()
+            self._load_dat(temp_manager, system.dat_file)
 
-            all_games = sorted(temp_manager.game_info.values(), key=lambda g: g.name)
+            all_games = self._sorted_games(temp_manager.game_info)
 
             if not all_games:
                 self.show_message("Warning", "No games with resolution data found in DAT file.", 4)
@@ -906,48 +1641,80 @@ class CursesGUI:
             filter_text = ""
             games = all_games  # Initially show all games
 
-            while True:
-                self.stdscr.clear()
+            # (ROM status, override status) per game name; the files only change
+            # through the write/delete actions below, which drop their entry
+            status_cache: Dict[str, Tuple[str, str]] = {}
+
+            # One directory listing each answers "does the file exist" for every
+            # game; the config listing is re-read after a write/delete action
+            rom_names = self._folder_file_names(system.rom_folder, ".zip")
+            cfg_folder = system.output_location
+            cfg_names = None
+
+            # Formatted row text (without statuses) per game name
+            row_cache: Dict[str, str] = {}
+            row_cache_widths = None
+
+            # (lowercased searchable text, game) pairs, built on the first filter,
+            # and the pairs matching the current filter
+            search_index: Optional[List[Tuple[str, GameInfo]]] = None
+            matches: List[Tuple[str, GameInfo]] = []
+
+            # Rendered game rows live in a pad covering games[pad_base:]; a row
+            # is drawn into it once and scrolling just copies a different slice
+            # to the screen. pad_drawn holds the game indices already drawn and
+            # pad_selected the one drawn highlighted
+            list_pad = None
+            pad_base = 0
+            pad_drawn: set = set()
+            pad_selected = None
+
+            # A selection move only changes two list rows and the preview, so
+            # the rest of the frame is redrawn only when full_redraw is set
+            full_redraw = True
+
+            # Preview writes of the last previewed game, replayed until the
+            # selection moves
+            cached_preview_key = None
+            preview_ops: List[Tuple[int, int, str, int]] = []
 
+            while True:
                 # Calculate split point (60% top, 40% bottom)
                 split_y = int(self.height * 0.6)
+                column_widths, header = _dat_browser_columns(self.width)
+                rom_width, ovr_width = column_widths[-2:]
 
-                # === TOP SECTION: Game List ===
-                if filter_text:
-                    self.draw_header(f"DAT Browser: {system.name} ({len(games)}/{len(all_games)} games) Filter: {filter_text}")
-                else:
-                    self.draw_header(f"DAT Browser: {system.name} ({len(games)} games)")
+                if full_redraw:
+                    # erase() only blanks the virtual screen: curses then compares
+                    # the new frame with what the terminal shows and sends just the
+                    # cells that changed, instead of repainting everything as
+                    # clear() forces
+                    self.stdscr.erase()
 
-                # Column headers for top section - dynamic width calculation
-                y = 2
-                available_width = self.width - 4  # Leave some margin
-
-                # Calculate dynamic column widths based on available width
-                # Minimum widths for fixed columns
-                name_width = 15
-                year_width = 6
-                res_width = 11
-                orient_width = 6   # Orientation (rotate)
-                screen_width = 8   # Screen type (raster/vector/etc)
-                clone_width = 10
-                rom_width = 4      # ROM status (Y/N/-)
-                ovr_width = 4      # Override status (Y/N)
-
-                # Remaining width split between description and manufacturer
-                fixed_width = name_width + year_width + res_width + orient_width + screen_width + clone_width + rom_width + ovr_width + 8  # spaces between
-                remaining = available_width - fixed_width
-
-                if remaining > 30:
-                    desc_width = int(remaining * 0.6)
-                    mfr_width = remaining - desc_width
+                    # === TOP SECTION: Game List ===
+                    if filter_text:
+                        self.draw_header(f"DAT Browser: {system.name} ({len(games)}/{len(all_games)} games) Filter: {filter_text}")
+                    else:
+                        self.draw_header(f"DAT Browser: {system.name} ({len(games)} games)")
+
+                    # Column headers for top section; the layout only changes with the width
+                    self.safe_addstr(2, 0, header[:self.width], curses.color_pair(5) | curses.A_BOLD)
+
+                    # Draw separator line
+                    self.safe_addstr(split_y, 0, _separator(self.width), curses.color_pair(5))
+
+                    # === BOTTOM SECTION: Config Preview ===
+                    self.safe_addstr(split_y + 1, 1, "Overrides Preview:", curses.color_pair(5) | curses.A_BOLD)
                 else:
-                    desc_width = max(20, remaining // 2)
-                    mfr_width = max(10, remaining - desc_width)
+                    # Blank the old preview below its title
+                    for row in range(split_y + 2, self.height - 1):
+                        self.stdscr.move(row, 0)
+                        self.stdscr.clrtoeol()
 
-                self.stdscr.attron(curses.color_pair(5) | curses.A_BOLD)
-                header = f"{'Name':<{name_width}} {'Desc':<{desc_width}} {'Year':<{year_width}} {'Mfr':<{mfr_width}} {'Res':<{res_width}} {'Orient':<{orient_width}} {'Screen':<{screen_width}} {'Clone':<{clone_width}} {'ROM':<{rom_width}} {'OVR':<{ovr_width}}"
-                self.safe_addstr(y, 0, header[:self.width])
-                self.stdscr.attroff(curses.color_pair(5) | curses.A_BOLD)
+                if column_widths != row_cache_widths:
+                    # Formatted rows are only valid for the widths they were built with
+                    row_cache.clear()
+                    row_cache_widths = column_widths
 
                 # Calculate visible games in top section
                 max_visible_top = split_y - 4  # Header + column header + padding
@@ -958,241 +1725,105 @@ class CursesGUI:
                 elif selected >= scroll_offset + max_visible_top:
                     scroll_offset = selected - max_visible_top + 1
 
+                if cfg_names is None:
+                    cfg_names = self._folder_file_names(cfg_folder, ".zip.cfg")
+
                 # Display games in top section
-                y = 3
-                for idx in range(scroll_offset, min(scroll_offset + max_visible_top, len(games))):
-                    if y >= split_y - 1:
-                        break
+                visible_end = min(scroll_offset + max_visible_top, len(games))
+                pad_rows = min(len(games) - pad_base, max(_DAT_PAD_ROWS, 2 * max_visible_top))
+                if list_pad is None or scroll_offset < pad_base or visible_end > pad_base + pad_rows:
+                    # Center the pad on the visible rows; the spare line keeps the
+                    # bottom-right cell of the last row writable
+                    pad_base = max(0, scroll_offset - _DAT_PAD_ROWS // 2)
+                    pad_rows = min(len(games) - pad_base, max(_DAT_PAD_ROWS, 2 * max_visible_top))
+                    list_pad = curses.newpad(pad_rows + 1, self.width)
+                    pad_drawn = set()
+                    pad_selected = None
+
+                if pad_selected != selected:
+                    # Only the old and new selection need their highlight changed
+                    pad_drawn.discard(pad_selected)
+                    pad_drawn.discard(selected)
+                    pad_selected = selected
+
+                # Bound once; a fresh pad or a long scroll draws many rows here
+                draw_row = self._draw_dat_row
+                status_widths = (rom_width, ovr_width)
+                for idx in range(scroll_offset, visible_end):
+                    if idx in pad_drawn:
+                        continue
 
                     game = games[idx]
 
-                    # Check if ROM exists
-                    rom_status = "-"
-                    if system.rom_folder:
-                        rom_path = Path(system.rom_folder) / f"{game.name}.zip"
-                        rom_status = "Y" if rom_path.exists() else "N"
-
-                    # Check if viewport override exists in config
-                    override_status = "N"
-                    config_path = None
-
-                    # Determine config file location
-                    if system.export_folder:
-                        config_path = Path(system.export_folder) / f"{game.name}.zip.cfg"
-                    elif system.rom_folder:
-                        config_path = Path(system.rom_folder) / f"{game.name}.zip.cfg"
-
-                    # Check if config exists and contains viewport overrides
-                    if config_path is not None and config_path.exists():
-                        try:
-                            with open(config_path, 'r') as f:
-                                content = f.read()
-                                if 'custom_viewport_width' in content or 'custom_viewport_height' in content:
-                                    override_status = "Y"
-                        except Exception:
-                            # If we can't read the file, assume no override
-                            pass
-
-                    # Sanitize and truncate fields to fit calculated widths
-                    name = self.sanitize_for_curses(game.name)[:name_width-1]
-                    desc = self.sanitize_for_curses(game.description)[:desc_width-1]
-                    year = self.sanitize_for_curses(game.year)[:year_width-1]
-                    mfr = self.sanitize_for_curses(game.manufacturer)[:mfr_width-1]
-                    res = f"{game.width}x{game.height}"[:res_width-1]
-                    orient = (self.sanitize_for_curses(game.rotate)[:orient_width-1] if game.rotate else "-")
-                    screen = (self.sanitize_for_curses(game.screen_type)[:screen_width-1] if game.screen_type else "-")
-                    clone = (self.sanitize_for_curses(game.cloneof)[:clone_width-1] if game.cloneof else "-")
-
-                    # Build line without ROM and OVR status (will add them separately with colors)
-                    line_base = f"{name:<{name_width}} {desc:<{desc_width}} {year:<{year_width}} {mfr:<{mfr_width}} {res:<{res_width}} {orient:<{orient_width}} {screen:<{screen_width}} {clone:<{clone_width}} "
-
-                    if idx == selected:
-                        self.stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
-                        self.safe_addstr(y, 0, f">{line_base}")
-                        self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
-
-                        # Add ROM status with color
-                        x_pos = 1 + len(line_base)
-                        if rom_status == "Y":
-                            self.stdscr.attron(curses.color_pair(2) | curses.A_BOLD)  # Green
-                            self.safe_addstr(y, x_pos, f"{rom_status:<{rom_width}}")
-                            self.stdscr.attroff(curses.color_pair(2) | curses.A_BOLD)
-                        elif rom_status == "N":
-                            self.stdscr.attron(curses.color_pair(3) | curses.A_BOLD)  # Red
-                            self.safe_addstr(y, x_pos, f"{rom_status:<{rom_width}}")
-                            self.stdscr.attroff(curses.color_pair(3) | curses.A_BOLD)
-                        else:
-                            self.stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
-                            self.safe_addstr(y, x_pos, f"{rom_status:<{rom_width}}")
-                            self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
-
-                        # Add override status
-                        self.stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
-                        self.safe_addstr(y, x_pos + rom_width, f"{override_status:<{ovr_width}}")
-                        self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
-                    else:
-                        self.safe_addstr(y, 0, f" {line_base}")
-
-                        # Add ROM status with color
-                        x_pos = 1 + len(line_base)
-                        if rom_status == "Y":
-                            self.stdscr.attron(curses.color_pair(2) | curses.A_BOLD)  # Green
-                            self.safe_addstr(y, x_pos, f"{rom_status:<{rom_width}}")
-                            self.stdscr.attroff(curses.color_pair(2) | curses.A_BOLD)
-                        elif rom_status == "N":
-                            self.stdscr.attron(curses.color_pair(3) | curses.A_BOLD)  # Red
-                            self.safe_addstr(y, x_pos, f"{rom_status:<{rom_width}}")
-                            self.stdscr.attroff(curses.color_pair(3) | curses.A_BOLD)
-                        else:
-                            self.safe_addstr(y, x_pos, f"{rom_status:<{rom_width}}")
-
-                        # Add override status
-                        self.safe_addstr(y, x_pos + rom_width, f"{override_status:<{ovr_width}}")
-
-                    y += 1
+                    statuses = status_cache.get(game.name)
+                    if statuses is None:
+                        statuses = status_cache[game.name] = self._game_file_status(
+                            system, game.name, rom_names, cfg_names)
 
-                # Draw separator line
-                self.stdscr.attron(curses.color_pair(5))
-                self.safe_addstr(split_y, 0, "=" * self.width)
-                self.stdscr.attroff(curses.color_pair(5))
+                    # Column text only depends on the game and the widths
+                    line_base = row_cache.get(game.name)
+                    if line_base is None:
+                        line_base = row_cache[game.name] = self._format_game_row(game, column_widths)
 
-                # === BOTTOM SECTION: Config Preview ===
-                y = split_y + 1
-                self.stdscr.attron(curses.color_pair(5) | curses.A_BOLD)
-                self.safe_addstr(y, 1, "Overrides Preview:")
-                self.stdscr.attroff(curses.color_pair(5) | curses.A_BOLD)
+                    draw_row(list_pad, idx - pad_base, line_base, statuses,
+                             status_widths, idx == selected)
+                    pad_drawn.add(idx)
 
-                y += 1
                 if selected < len(games):
                     game = games[selected]
-
-                    # Determine what resolution will be written
-                    final_width = system.override_width if system.override_width else game.width
-                    final_height = system.override_height if system.override_height else game.height
-
-                    # Show game details
-                    self.stdscr.attron(curses.color_pair(5))
-                    game_line = f"Game: {self.sanitize_for_curses(game.name)}"
-                    self.safe_addstr(y, 1, game_line[:self.width-2])
-                    y += 1
-                    if game.description:
-                        desc_safe = self.sanitize_for_curses(game.description)
-                        desc_display = desc_safe if len(desc_safe) <= self.width - 15 else desc_safe[:self.width-18] + "..."
-                        desc_line = f"Description: {desc_display}"
-                        self.safe_addstr(y, 1, desc_line[:self.width-2])
-                        y += 1
-
-                    # Show year and manufacturer on same line if they fit
-                    if game.year or game.manufacturer:
-                        info_line = ""
-                        if game.year:
-                            info_line += f"Year: {self.sanitize_for_curses(game.year)}"
-                        if game.manufacturer:
-                            if info_line:
-                                info_line += "  |  "
-                            info_line += f"Manufacturer: {self.sanitize_for_curses(game.manufacturer)}"
-                        self.safe_addstr(y, 1, info_line[:self.width-2])
-                        y += 1
-
-                    # Show orientation and screen type if available
-                    if game.rotate or game.screen_type:
-                        display_line = ""
-                        if game.rotate:
-                            display_line += f"Orientation: {self.sanitize_for_curses(game.rotate)}"
-                        if game.screen_type:
-                            if display_line:
-                                display_line += "  |  "
-                            display_line += f"Screen: {self.sanitize_for_curses(game.screen_type)}"
-                        self.safe_addstr(y, 1, display_line[:self.width-2])
-                        y += 1
-
-                    if game.cloneof:
-                        clone_line = f"Clone of: {self.sanitize_for_curses(game.cloneof)}"
-                        self.safe_addstr(y, 1, clone_line[:self.width-2])
-                        y += 1
-
-                    self.stdscr.attroff(curses.color_pair(5))
-
-                    y += 1
-
-                    # Show original vs final resolution
-                    res_line = f"Original Resolution: {game.width}x{game.height}"
-                    self.safe_addstr(y, 1, res_line[:self.width-2])
-                    y += 1
-
-                    if system.override_width or system.override_height:
-                        self.stdscr.attron(curses.color_pair(4))
-                        override_line = f"Override Applied: {final_width}x{final_height}"
-                        self.safe_addstr(y, 1, override_line[:self.width-2])
-                        self.stdscr.attroff(curses.color_pair(4))
-                        y += 1
-
-                    y += 1
-
-                    # Show config file name outside the box
-                    cfg_line = f"Overrides will be written to {game.name}.zip.cfg as:"
-                    self.safe_addstr(y, 1, cfg_line[:self.width-2])
-                    y += 1
-
-                    # Draw rectangle for config file preview
-                    box_width = self.width - 4
-                    box_x = 2
-
-                    # Draw top border with dark gray background
-                    self.stdscr.attron(curses.color_pair(6) | curses.A_DIM)
-                    self.safe_addstr(y, box_x, "┌" + "─" * (box_width - 2) + "┐")
-                    y += 1
-
-                    # Config file entries inside box with dark gray background
-                    # Show aspect_ratio_index first
-                    aspect_line = f"aspect_ratio_index = \"23\""
-                    self.safe_addstr(y, box_x, "│ " + aspect_line[:box_width-4].ljust(box_width-3) + "│")
-                    y += 1
-
-                    # Show X and Y position (always show them, use override if set or 0 if not)
-                    final_x = system.override_x if system.override_x is not None else 0
-                    final_y = system.override_y if system.override_y is not None else 0
-
-                    x_line = f"custom_viewport_x = \"{final_x}\""
-                    self.safe_addstr(y, box_x, "│ " + x_line[:box_width-4].ljust(box_width-3) + "│")
-                    y += 1
-
-                    y_line = f"custom_viewport_y = \"{final_y}\""
-                    self.safe_addstr(y, box_x, "│ " + y_line[:box_width-4].ljust(box_width-3) + "│")
-                    y += 1
-
-                    width_line = f"custom_viewport_width = \"{final_width}\""
-                    self.safe_addstr(y, box_x, "│ " + width_line[:box_width-4].ljust(box_width-3) + "│")
-                    y += 1
-
-                    height_line = f"custom_viewport_height = \"{final_height}\""
-                    self.safe_addstr(y, box_x, "│ " + height_line[:box_width-4].ljust(box_width-3) + "│")
-                    y += 1
-
-                    # Draw bottom border
-                    self.safe_addstr(y, box_x, "└" + "─" * (box_width - 2) + "┘")
-                    self.stdscr.attroff(curses.color_pair(6) | curses.A_DIM)
-
+                    # The system's overrides are fixed while browsing, so the
+                    # preview only changes with the game and the width
+                    preview_key = (game.name, self.width)
+                    if preview_key != cached_preview_key:
+                        preview_ops = self._dat_preview_ops(system, game)
+                        cached_preview_key = preview_key
+                    addstr = self.safe_addstr
+                    preview_y = split_y + 2
+                    for row, x, text, attr in preview_ops:
+                        addstr(preview_y + row, x, text, attr)
+
+                # Drawn last so a preview running into the bottom line never covers it
                 self.draw_footer("Up/Down: Navigate | Enter: Write Config | d: Delete Override | /: Filter | c: Clear | q: Back")
-                self.stdscr.refresh()
 
-                key = self.stdscr.getch()
-
-                if key == curses.KEY_UP and selected > 0:
+                # Copy the visible slice of the pad into the list area in one C
+                # call. Keeping the whole frame in stdscr lets dialogs snapshot
+                # and restore it, list included
+                if visible_end > scroll_offset:
+                    list_pad.overwrite(self.stdscr, scroll_offset - pad_base, 0,
+                                       3, 0, 2 + visible_end - scroll_offset, self.width - 1)
+                self.present()
+                full_redraw = False
+
+                # Letter keys work in either case, so compare against lower case only.
+                # A move past either end of the list changes nothing, so it is
+                # dropped here instead of repainting an identical frame
+                while True:
+                    key = _fold_key(self.wait_for_key(_DAT_BROWSER_KEYS))
+                    if not ((key == curses.KEY_UP and selected == 0) or
+                            (key == curses.KEY_DOWN and selected >= len(games) - 1)):
+                        break
+                # Selection moves and the write/delete dialogs, which put back the
+                # frame they covered, leave the header alone. Other keys can change
+                # it or leave an input box on screen
+                full_redraw = key not in (curses.KEY_UP, curses.KEY_DOWN, ord('d'), ord('\n'))
+
+                if key == curses.KEY_RESIZE:
+                    # The terminal contents are unknown after a resize; repaint fully
+                    self.height, self.width = self.stdscr.getmaxyx()
+                    self.stdscr.clear()
+                    list_pad = None
+                elif key == curses.KEY_UP and selected > 0:
                     selected -= 1
                 elif key == curses.KEY_DOWN and selected < len(games) - 1:
                     selected += 1
-                elif key == ord('d') or key == ord('D'):
+                elif key == ord('d'):
                     # Delete override for selected game
                     if selected < len(games):
                         game = games[selected]
 
                         # Determine output location
-                        if system.export_folder:
-                            output_location = system.export_folder
-                        elif system.rom_folder:
-                            output_location = system.rom_folder
-                        else:
+                        output_location = system.output_location
+                        if not output_location:
                             self.show_message("Error", "No ROM folder or export folder set.\nPlease configure the system first.", 3)
                             continue
 
@@ -1205,6 +1836,9 @@ class CursesGUI:
                         confirm_msg += f"Location: {output_location}"
 
                         if self.show_confirm("Confirm Remove Override", confirm_msg, 4):
+                            status_cache.pop(game.name, None)
+                            pad_drawn.discard(selected)
+                            cfg_names = None
                             try:
                                 # Create a temporary manager to remove the config
                                 remove_manager = ViewportConfigurationManager(
@@ -1243,11 +1877,8 @@ class CursesGUI:
                         final_height = system.override_height if system.override_height else game.height
 
                         # Determine output location
-                        if system.export_folder:
-                            output_location = system.export_folder
-                        elif system.rom_folder:
-                            output_location = system.rom_folder
-                        else:
+                        output_location = system.output_location
+                        if not output_location:
                             self.show_message("Error", "No ROM folder or export folder set.\nPlease configure the system first.", 3)
                             continue
 
@@ -1257,6 +1888,9 @@ class CursesGUI:
                         confirm_msg += f"Output: {output_location}"
 
                         if self.show_confirm("Confirm Write Config", confirm_msg, 5):
+                            status_cache.pop(game.name, None)
+                            pad_drawn.discard(selected)
+                            cfg_names = None
                             try:
                                 # Create a temporary manager to write the config
                                 write_manager = ViewportConfigurationManager(
@@ -1269,7 +1903,7 @@ class CursesGUI:
                                     system.export_folder if system.export_folder else None,
                                     log_callback=self.log
                                 )
-                                write_manager.parse_dat_file()
+                                # The resolution is already known, so no DAT parse is needed
                                 write_manager.update_rom_config(game.name, final_width, final_height,
                                                                system.override_x, system.override_y)
                                 self.show_message("Success", f"Config written for {game.name}\n{final_width}x{final_height}", 2)
@@ -1279,49 +1913,292 @@ class CursesGUI:
                     # Enter filter mode
                     new_filter = self.get_input("Filter games (name/description/year/mfr):", filter_text)
                     if new_filter is not None:
-                        filter_text = new_filter.lower()
+                        new_filter = new_filter.lower()
                         # Apply filter
-                        if filter_text:
-                            games = [g for g in all_games if
-                                    filter_text in g.name.lower() or
-                                    filter_text in g.description.lower() or
-                                    filter_text in g.year.lower() or
-                                    filter_text in g.manufacturer.lower()]
+                        if new_filter:
+                            if search_index is None:
+                                search_index = self._search_index(temp_manager.game_info, all_games)
+                            # A filter containing the previous one can only narrow its matches
+                            pool = matches if filter_text and filter_text in new_filter else search_index
+                            matches = [entry for entry in pool if new_filter in entry[0]]
+                            games = [g for _, g in matches]
                         else:
                             games = all_games
+                        filter_text = new_filter
                         # Reset selection
                         selected = 0
                         scroll_offset = 0
-                elif key == ord('c') or key == ord('C'):
+                        list_pad = None
+                elif key == ord('c'):
                     # Clear filter
                     filter_text = ""
                     games = all_games
                     selected = 0
                     scroll_offset = 0
+                    list_pad = None
                 elif key == 27 or key == ord('q'):  # ESC or q
                     break
 
         except Exception as e:
             self.show_message("Error", f"Failed to browse DAT file:\n{str(e)}", 3)
 
+    def _dat_preview_ops(self, system: SystemConfig, game: GameInfo) -> List[Tuple[int, int, str, int]]:
+        """
+        Lay out the DAT browser preview pane for one game.
+
+        Args:
+            system: System whose overrides apply
+            game: Selected game
+
+        Returns:
+            List of (row offset, x, text, attribute) writes; row 0 is the line
+            below the "Overrides Preview:" title
+        """
+        sanitize = self.sanitize_for_curses
+        text_width = self.width - 2
+        ops: List[Tuple[int, int, str, int]] = []
+        y = 0
+
+        # Determine what resolution will be written
+        final_width = system.override_width if system.override_width else game.width
+        final_height = system.override_height if system.override_height else game.height
+
+        # Show game details
+        info_attr = curses.color_pair(5)
+        game_line = f"Game: {sanitize(game.name)}"
+        ops.append((y, 1, game_line[:text_width], info_attr))
+        y += 1
+        if game.description:
+            desc_safe = sanitize(game.description)
+            desc_display = desc_safe if len(desc_safe) <= self.width - 15 else desc_safe[:self.width-18] + "..."
+            desc_line = f"Description: {desc_display}"
+            ops.append((y, 1, desc_line[:text_width], info_attr))
+            y += 1
+
+        # Show year and manufacturer on same line if they fit
+        if game.year or game.manufacturer:
+            info_line = ""
+            if game.year:
+                info_line += f"Year: {sanitize(game.year)}"
+            if game.manufacturer:
+                if info_line:
+                    info_line += "  |  "
+                info_line += f"Manufacturer: {sanitize(game.manufacturer)}"
+            ops.append((y, 1, info_line[:text_width], info_attr))
+            y += 1
+
+        # Show orientation and screen type if available
+        if game.rotate or game.screen_type:
+            display_line = ""
+            if game.rotate:
+                display_line += f"Orientation: {sanitize(game.rotate)}"
+            if game.screen_type:
+                if display_line:
+                    display_line += "  |  "
+                display_line += f"Screen: {sanitize(game.screen_type)}"
+            ops.append((y, 1, display_line[:text_width], info_attr))
+            y += 1
+
+        if game.cloneof:
+            clone_line = f"Clone of: {sanitize(game.cloneof)}"
+            ops.append((y, 1, clone_line[:text_width], info_attr))
+            y += 1
+
+        y += 1
+
+        # Show original vs final resolution
+        res_line = f"Original Resolution: {game.width}x{game.height}"
+        ops.append((y, 1, res_line[:text_width], 0))
+        y += 1
+
+        if system.override_width or system.override_height:
+            override_line = f"Override Applied: {final_width}x{final_height}"
+            ops.append((y, 1, override_line[:text_width], curses.color_pair(4)))
+            y += 1
+
+        y += 1
+
+        # Show config file name outside the box
+        cfg_line = f"Overrides will be written to {game.name}.zip.cfg as:"
+        ops.append((y, 1, cfg_line[:text_width], 0))
+        y += 1
+
+        # Show X and Y position (always show them, use override if set or 0 if not)
+        final_x = system.override_x if system.override_x is not None else 0
+        final_y = system.override_y if system.override_y is not None else 0
+
+        # Config file entries, aspect_ratio_index first
+        config_lines = (
+            "aspect_ratio_index = \"23\"",
+            f"custom_viewport_x = \"{final_x}\"",
+            f"custom_viewport_y = \"{final_y}\"",
+            f"custom_viewport_width = \"{final_width}\"",
+            f"custom_viewport_height = \"{final_height}\"",
+        )
+
+        # Rectangle for config file preview with dark gray background;
+        # borders and rows are prebuilt strings under a single attribute
+        box_width = self.width - 4
+        box_attr = curses.color_pair(6) | curses.A_DIM
+        box_lines = (_top_border(box_width),
+                     *[_box_row(config_line, box_width) for config_line in config_lines],
+                     _bottom_border(box_width))
+        for box_line in box_lines:
+            ops.append((y, 2, box_line, box_attr))
+            y += 1
+
+        return ops
+
+    def _draw_dat_row(self, win, y: int, line_base: str, statuses: Tuple[str, str],
+                      status_widths: Tuple[int, int], is_selected: bool) -> None:
+        """
+        Draw one DAT browser game row, clipped to the screen width.
+
+        Args:
+            win: Window or pad to draw into
+            y: Line within win
+            line_base: Row text from _format_game_row
+            statuses: (ROM status, override status) from _game_file_status
+            status_widths: Widths of the ROM and override status columns
+            is_selected: Whether to draw the row highlighted
+        """
+        rom_status, override_status = statuses
+        rom_width, ovr_width = status_widths
+        row_attr = self.selected_attr if is_selected else 0
+
+        # ROM status with color
+        if rom_status == "Y":
+            rom_attr = self.found_bold_attr  # Green
+        elif rom_status == "N":
+            rom_attr = self.missing_bold_attr  # Red
+        else:
+            rom_attr = row_attr
+
+        x_pos = 1 + len(line_base)
+        pieces = (
+            (0, f"{'>' if is_selected else ' '}{line_base}", row_attr),
+            (x_pos, f"{rom_status:<{rom_width}}", rom_attr),
+            (x_pos + rom_width, f"{override_status:<{ovr_width}}", row_attr),
+        )
+        addstr = win.addstr
+        width = self.width
+        for x, text, attr in pieces:
+            if x >= width:
+                break
+            try:
+                addstr(y, x, text[:width - x], attr)
+            except curses.error:
+                pass
+
+    def _format_game_row(self, game: GameInfo, column_widths: tuple) -> str:
+        """
+        Format the column text of one DAT browser row, without the status columns.
+
+        Args:
+            game: Game to format
+            column_widths: Column widths from _dat_browser_columns
+
+        Returns:
+            Padded row text; the ROM and OVR columns are drawn separately in color
+        """
+        (name_width, desc_width, year_width, mfr_width,
+         res_width, orient_width, screen_width, clone_width) = column_widths[:8]
+
+        # Sanitize and truncate fields to fit calculated widths
+        name = self.sanitize_for_curses(game.name)[:name_width-1]
+        desc = self.sanitize_for_curses(game.description)[:desc_width-1]
+        year = self.sanitize_for_curses(game.year)[:year_width-1]
+        mfr = self.sanitize_for_curses(game.manufacturer)[:mfr_width-1]
+        res = f"{game.width}x{game.height}"[:res_width-1]
+        orient = (self.sanitize_for_curses(game.rotate)[:orient_width-1] if game.rotate else "-")
+        screen = (self.sanitize_for_curses(game.screen_type)[:screen_width-1] if game.screen_type else "-")
+        clone = (self.sanitize_for_curses(game.cloneof)[:clone_width-1] if game.cloneof else "-")
+
+        # ljust pads without parsing a format spec per field
+        return (f"{name.ljust(name_width)} {desc.ljust(desc_width)} {year.ljust(year_width)} "
+                f"{mfr.ljust(mfr_width)} {res.ljust(res_width)} {orient.ljust(orient_width)} "
+                f"{screen.ljust(screen_width)} {clone.ljust(clone_width)} ")
+
+    @staticmethod
+    def _folder_file_names(folder: str, suffix: str) -> frozenset:
+        """
+        List the names of the files in a folder that end with suffix.
+
+        Args:
+            folder: Folder to list; empty for none
+            suffix: File name suffix to keep (e.g. ".zip")
+
+        Returns:
+            Set of matching file names; empty if the folder is unset or unreadable
+        """
+        if not folder:
+            return frozenset()
+        try:
+            with os.scandir(folder) as entries:
+                return frozenset(entry.name for entry in entries
+                                 if entry.name.endswith(suffix) and entry.is_file())
+        except OSError:
+            return frozenset()
+
+    @staticmethod
+    def _game_file_status(system: SystemConfig, game_name: str,
+                          rom_names: frozenset, cfg_names: frozenset) -> Tuple[str, str]:
+        """
+        Check a game's ROM and viewport override for the DAT browser.
+
+        Args:
+            system: System whose ROM and export folders are checked
+            game_name: Game (ROM set) name
+            rom_names: File names present in the ROM folder
+            cfg_names: File names present in the config folder
+
+        Returns:
+            Tuple of (ROM status "Y"/"N"/"-", override status "Y"/"N")
+        """
+        # Check if ROM exists
+        rom_status = "-"
+        if system.rom_folder:
+            rom_status = "Y" if f"{game_name}.zip" in rom_names else "N"
+
+        # Check if viewport override exists in config; configs go to the export
+        # folder when set, otherwise next to the ROMs
+        override_status = "N"
+        cfg_name = f"{game_name}.zip.cfg"
+        if cfg_name in cfg_names:
+            try:
+                # Plain string join, without building a Path for every checked game
+                with open(os.path.join(system.output_location, cfg_name), 'rb') as f:
+                    content = f.read()
+                if _has_viewport_override(content):
+                    override_status = "Y"
+            except Exception:
+                # If we can't read the file, assume no override
+                pass
+
+        return rom_status, override_status
+
     def manage_systems(self) -> None:
         """Manage system configurations."""
         selected = 0
+        # Rebuilt only after Enter, the one key that can add, remove or edit a system
+        items_dirty = True
 
         while True:
-            menu_items = []
-            for system in self.systems:
-                status = "OK" if system.dat_file and system.rom_folder else "!"
-                menu_items.append((f"[{status}] {system.name}", f"Configure {system.name} settings"))
-
-            menu_items.extend([
-                ("", ""),
-                ("Add New System", "Add a new emulation system configuration"),
-                ("Remove Selected System", "Remove the currently selected system"),
-                ("Back", "Return to main menu")
-            ])
-
-            self.stdscr.clear()
+            if items_dirty:
+                menu_items = []
+                for system in self.systems:
+                    status = "OK" if system.dat_file and system.rom_folder else "!"
+                    menu_items.append((f"[{status}] {system.name}", f"Configure {system.name} settings"))
+
+                menu_items.extend([
+                    ("", ""),
+                    ("Add New System", "Add a new emulation system configuration"),
+                    ("Remove Selected System", "Remove the currently selected system"),
+                    ("Back", "Return to main menu")
+                ])
+                items_dirty = False
+
+            self.stdscr.erase()
             self.draw_header("Manage Systems")
 
             self.draw_menu("", menu_items, selected, 2)
@@ -1330,21 +2207,22 @@ class CursesGUI:
             _, description = menu_items[selected]
             if description:  # Only show if there's a description
                 desc_y = self.height - 3
-                self.stdscr.attron(curses.color_pair(5))
-                self.safe_addstr(desc_y, 2, description[:self.width-4])
-                self.stdscr.attroff(curses.color_pair(5))
+                self.safe_addstr(desc_y, 2, description[:self.width-4], curses.color_pair(5))
 
             self.draw_footer("Up/Down: Navigate | Enter: Select | Esc/q: Back")
-            self.stdscr.refresh()
+            self.present()
 
-            key = self.stdscr.getch()
+            key = self.wait_for_key(_MENU_KEYS)
 
-            if key == curses.KEY_UP and selected > 0:
+            if key == curses.KEY_RESIZE:
+                self.height, self.width = self.stdscr.getmaxyx()
+            elif key == curses.KEY_UP and selected > 0:
                 selected -= 1
             elif key == curses.KEY_DOWN and selected < len(menu_items) - 1:
                 selected += 1
             elif key == ord('\n'):
                 item_text = menu_items[selected][0] if isinstance(menu_items[selected], tuple) else menu_items[selected]
+                items_dirty = True
 
                 if selected < len(self.systems):
                     # Edit existing system
@@ -1379,23 +2257,31 @@ class CursesGUI:
             return
 
         selected = self.current_system_idx
+        # The system list cannot change while this menu is open
+        menu_items = [system.name for system in self.systems]
 
+        redraw = True
         while True:
-            self.stdscr.clear()
-            self.draw_header("Select Active System")
-
-            menu_items = [system.name for system in self.systems]
-            self.draw_menu("", menu_items, selected, 2)
-
-            self.draw_footer("Up/Down: Navigate | Enter: Select | Esc/q: Back")
-            self.stdscr.refresh()
-
-            key = self.stdscr.getch()
-
-            if key == curses.KEY_UP and selected > 0:
-                selected -= 1
-            elif key == curses.KEY_DOWN and selected < len(menu_items) - 1:
-                selected += 1
+            if redraw:
+                self.stdscr.erase()
+                self.draw_header("Select Active System")
+
+                self.draw_menu("", menu_items, selected, 2)
+
+                self.draw_footer("Up/Down: Navigate | Enter: Select | Esc/q: Back")
+                self.present()
+
+            key, delta = self.wait_for_move(_MENU_KEYS)
+            # Any key but a move may change the screen underneath
+            redraw = not delta
+
+            if key == curses.KEY_RESIZE:
+                self.height, self.width = self.stdscr.getmaxyx()
+            elif delta:
+                moved = max(0, min(len(menu_items) - 1, selected + delta))
+                # A move past either end leaves the frame as it is
+                redraw = moved != selected
+                selected = moved
             elif key == ord('\n'):
                 self.current_system_idx = selected
                 self.show_message("Success", f"Active system: {self.systems[selected].name}", 2)
@@ -1403,6 +2289,37 @@ class CursesGUI:
             elif key == 27 or key == ord('q'):
                 break
 
+    def _system_status_lines(self, system: SystemConfig) -> Tuple[str, str, str, str]:
+        """
+        Get the DAT, ROMs, Export and Override lines of the configure screen.
+
+        Args:
+            system: System whose settings are shown
+
+        Returns:
+            The four status lines, with paths clipped to the screen width
+        """
+        key = (self.width, system.dat_file, system.rom_folder, system.export_folder,
+               system.override_width, system.override_height)
+        lines = self._status_cache.get(key)
+        if lines is None:
+            clip = self.width - 10
+            dat_status = system.dat_file if system.dat_file else "[Not Set]"
+            rom_status = system.rom_folder if system.rom_folder else "[Not Set]"
+            export_status = system.export_folder if system.export_folder else "[None - use ROM folder]"
+            override_status = f"{system.override_width}x{system.override_height}" \
+                if system.override_width else "[None]"
+            lines = (
+                f"DAT: {dat_status[:clip]}",
+                f"ROMs: {rom_status[:clip]}",
+                f"Export: {export_status[:clip]}",
+                f"Override: {override_status}",
+            )
+            if len(self._status_cache) >= 32:
+                self._status_cache.clear()
+            self._status_cache[key] = lines
+        return lines
+
     def configure_current_system(self) -> None:
         """Configure the current system."""
         system = self.get_current_system()
@@ -1411,57 +2328,46 @@ class CursesGUI:
             return
 
         selected = 0
-        menu_items = [
-            ("[1] Set DAT File Path", "Browse or manually enter DAT file path"),
-            ("[2] Download and set DAT File from Web", "Download DAT file from libretro repositories"),
-            ("[3] Set ROM Folder Path", "Browse or manually enter ROM folder path"),
-            ("[4] Set Export Folder Path", "Set optional export folder for config files"),
-            ("[5] Set Viewport Configuration", "Configure viewport width, height, and position overrides"),
-            ("[6] Backup Config Files", "Create a zip backup of all config files"),
-            ("[7] Restore Config Files", "Restore config files from a zip backup"),
-            ("[8] Back", "Return to main menu")
-        ]
+        menu_items = _CONFIG_MENU_ITEMS
+        # Action of each menu item, in menu order; None is Back
+        actions = (
+            self.set_system_dat_file,
+            self.download_dat_file_from_web,
+            self.set_system_rom_folder,
+            self.set_system_export_folder,
+            self.set_system_resolution_override,
+            self.backup_system_configs,
+            self.restore_system_configs,
+            None,
+        )
 
+        redraw = True
         while True:
-            self.stdscr.clear()
-            self.draw_header(f"Configure: {system.name}")
-
-            y = 2
-            self.stdscr.attron(curses.color_pair(5))
-            self.stdscr.addstr(y, 2, "Current Settings:")
-            self.stdscr.attroff(curses.color_pair(5))
-
-            y += 1
-            dat_status = system.dat_file if system.dat_file else "[Not Set]"
-            self.stdscr.addstr(y, 4, f"DAT: {dat_status[:self.width-10]}")
+            if redraw:
+                self.stdscr.erase()
+                self.draw_header(f"Configure: {system.name}")
 
-            y += 1
-            rom_status = system.rom_folder if system.rom_folder else "[Not Set]"
-            self.stdscr.addstr(y, 4, f"ROMs: {rom_status[:self.width-10]}")
-
-            y += 1
-            export_status = system.export_folder if system.export_folder else "[None - use ROM folder]"
-            self.stdscr.addstr(y, 4, f"Export: {export_status[:self.width-10]}")
+                y = 2
+                self.stdscr.addstr(y, 2, "Current Settings:", curses.color_pair(5))
 
-            y += 1
-            override_status = f"{system.override_width}x{system.override_height}" \
-                if system.override_width else "[None]"
-            self.stdscr.addstr(y, 4, f"Override: {override_status}")
+                for line in self._system_status_lines(system):
+                    y += 1
+                    self.stdscr.addstr(y, 4, line)
 
-            y += 2
-            self.draw_menu("", menu_items, selected, y)
+                y += 2
+                self.draw_menu("", menu_items, selected, y)
 
-            # Show description of selected option at bottom
-            _, description = menu_items[selected]
-            desc_y = self.height - 3
-            self.stdscr.attron(curses.color_pair(5))
-            self.stdscr.addstr(desc_y, 2, description[:self.width-4])
-            self.stdscr.attroff(curses.color_pair(5))
+                # Show description of selected option at bottom
+                _, description = menu_items[selected]
+                desc_y = self.height - 3
+                self.stdscr.addstr(desc_y, 2, description[:self.width-4], curses.color_pair(5))
 
-            self.draw_footer("Up/Down: Navigate | Enter: Select | Esc/q: Back")
-            self.stdscr.refresh()
+                self.draw_footer("Up/Down: Navigate | Enter: Select | Esc/q: Back")
+                self.present()
 
-            key = self.stdscr.getch()
+            key, delta = self.wait_for_move(self.menu_keys(menu_items))
+            # Any key but a move may change the screen underneath
+            redraw = not delta
 
             # Check for numeric key press
             key_selection = self.get_menu_selection_from_key(key, menu_items)
@@ -1470,65 +2376,51 @@ class CursesGUI:
                 # Simulate Enter key press
                 key = ord('\n')
 
-            if key == curses.KEY_UP and selected > 0:
-                selected -= 1
-            elif key == curses.KEY_DOWN and selected < len(menu_items) - 1:
-                selected += 1
+            if key == curses.KEY_RESIZE:
+                self.height, self.width = self.stdscr.getmaxyx()
+            elif delta:
+                moved = max(0, min(len(menu_items) - 1, selected + delta))
+                # A move past either end leaves the frame as it is
+                redraw = moved != selected
+                selected = moved
             elif key == ord('\n'):
-                if selected == 0:
-                    self.set_system_dat_file(system)
-                elif selected == 1:
-                    self.download_dat_file_from_web(system)
-                elif selected == 2:
-                    self.set_system_rom_folder(system)
-                elif selected == 3:
-                    self.set_system_export_folder(system)
-                elif selected == 4:
-                    self.set_system_resolution_override(system)
-                elif selected == 5:
-                    self.backup_system_configs(system)
-                elif selected == 6:
-                    self.restore_system_configs(system)
-                elif selected == 7:
+                action = actions[selected]
+                if action is None:
                     break
+                action(system)
             elif key == 27 or key == ord('q'):
                 break
 
-
     def set_system_dat_file(self, system: SystemConfig) -> None:
         """Set the DAT file path for a system."""
         # Show selection menu: Browse or Manual Entry
         selected = 0
-        menu_items = [
-            ("[1] Browse for File", "Use file browser to select DAT file"),
-            ("[2] Manual Entry", "Manually enter the DAT file path"),
-            ("[3] Cancel", "Cancel and return to previous menu")
-        ]
+        menu_items = _DAT_FILE_MENU_ITEMS
 
+        redraw = True
         while True:
-            self.stdscr.clear()
-            self.draw_header(f"Set DAT File: {system.name}")
+            if redraw:
+                self.stdscr.erase()
+                self.draw_header(f"Set DAT File: {system.name}")
 
-            y = 2
-            if system.dat_file:
-                self.stdscr.attron(curses.color_pair(5))
-                self.stdscr.addstr(y, 2, f"Current: {system.dat_file[:self.width-12]}")
-                self.stdscr.attroff(curses.color_pair(5))
-                y += 2
+                y = 2
+                if system.dat_file:
+                    self.stdscr.addstr(y, 2, f"Current: {system.dat_file[:self.width-12]}", curses.color_pair(5))
+                    y += 2
 
-            self.draw_menu("", menu_items, selected, y)
+                self.draw_menu("", menu_items, selected, y)
 
-            # Show description of selected option at bottom
-            _, description = menu_items[selected]
-            desc_y = self.height - 3
-            self.stdscr.attron(curses.color_pair(5))
-            self.stdscr.addstr(desc_y, 2, description[:self.width-4])
-            self.stdscr.attroff(curses.color_pair(5))
+                # Show description of selected option at bottom
+                _, description = menu_items[selected]
+                desc_y = self.height - 3
+                self.stdscr.addstr(desc_y, 2, description[:self.width-4], curses.color_pair(5))
 
-            self.draw_footer("Up/Down: Navigate | Enter: Select | Esc/q: Cancel")
-            self.stdscr.refresh()
+                self.draw_footer("Up/Down: Navigate | Enter: Select | Esc/q: Cancel")
+                self.present()
 
-            key = self.stdscr.getch()
+            key, delta = self.wait_for_move(self.menu_keys(menu_items))
+            # Any key but a move may change the screen underneath
+            redraw = not delta
 
             # Check for numeric key press
             key_selection = self.get_menu_selection_from_key(key, menu_items)
@@ -1536,10 +2428,13 @@ class CursesGUI:
                 selected = key_selection
                 key = ord('\n')
 
-            if key == curses.KEY_UP and selected > 0:
-                selected -= 1
-            elif key == curses.KEY_DOWN and selected < len(menu_items) - 1:
-                selected += 1
+            if key == curses.KEY_RESIZE:
+                self.height, self.width = self.stdscr.getmaxyx()
+            elif delta:
+                moved = max(0, min(len(menu_items) - 1, selected + delta))
+                # A move past either end leaves the frame as it is
+                redraw = moved != selected
+                selected = moved
             elif key == ord('\n'):
                 if selected == 0:  # Browse
                     start_path = system.dat_file if system.dat_file else None
@@ -1557,7 +2452,9 @@ class CursesGUI:
                 elif selected == 1:  # Manual Entry
                     result = self.get_input(f"Enter DAT file path for {system.name}:", system.dat_file)
                     if result:
-                        if os.path.exists(result):
+                        # A folder at the path is as unusable as no file at all
+                        mode = _stat_mode(result)
+                        if mode is not None and stat.S_ISREG(mode):
                             system.dat_file = result
                             system.manager = None
                             self.show_message("Success", f"DAT file set to:\n{result}", 2)
@@ -1572,73 +2469,80 @@ class CursesGUI:
     def download_dat_file_from_web(self, system: SystemConfig) -> None:
         """Download a DAT file from predefined web sources."""
         dat_sources = get_dat_sources()
+        # Navigation plus the 1-9 shortcuts handled below
+        accepted_keys = _MENU_KEYS | frozenset(range(ord('1'), ord('9') + 1))
+
+        # Row labels of the sources followed by the Download All and Back
+        # entries, built once
+        download_all_idx = len(dat_sources)
+        back_idx = download_all_idx + 1
+        rows = [f"[{idx + 1}] {source.name}" for idx, source in enumerate(dat_sources)]
+        rows.append(f"[{download_all_idx + 1}] Download All Sources")
+        rows.append(f"[{back_idx + 1}] Back")
+        selected_attr = self.selected_attr
 
         selected = 0
+        redraw = True
         while True:
-            self.stdscr.clear()
-            self.draw_header("Download and set DAT File from Web")
-
-            y = 2
-            self.stdscr.attron(curses.color_pair(5))
-            self.stdscr.addstr(y, 2, "Select a DAT file to download:")
-            self.stdscr.attroff(curses.color_pair(5))
-            y += 2
+            if redraw:
+                self.stdscr.erase()
+                self.draw_header("Download and set DAT File from Web")
 
-            # Display menu items
-            for idx, source in enumerate(dat_sources):
-                if idx == selected:
-                    self.stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
-                    self.stdscr.addstr(y, 4, f"> [{idx + 1}] {source.name}")
-                    self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
-                else:
-                    self.stdscr.addstr(y, 4, f"  [{idx + 1}] {source.name}")
-                y += 1
+                self.stdscr.addstr(2, 2, "Select a DAT file to download:", curses.color_pair(5))
 
-            # Display Back option
-            if selected == len(dat_sources):
-                self.stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
-                self.stdscr.addstr(y, 4, f"> [{len(dat_sources) + 1}] Back")
-                self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
-            else:
-                self.stdscr.addstr(y, 4, f"  [{len(dat_sources) + 1}] Back")
+                # Display menu items, one addstr per row
+                addstr = self.stdscr.addstr
+                for idx, label in enumerate(rows):
+                    if idx == selected:
+                        addstr(4 + idx, 4, "> " + label, selected_attr)
+                    else:
+                        addstr(4 + idx, 4, "  " + label)
 
-            self.draw_footer("Up/Down: Navigate | Enter: Download | Esc/q: Back")
-            self.stdscr.refresh()
+                self.draw_footer("Up/Down: Navigate | Enter: Download | Esc/q: Back")
+                self.present()
 
-            key = self.stdscr.getch()
+            key, delta = self.wait_for_move(accepted_keys)
+            # Any key but a move may change the screen underneath
+            redraw = not delta
 
             # Handle numeric key presses (1-9)
             if ord('1') <= key <= ord('9'):
                 key_num = key - ord('1')  # Convert to 0-based index
-                if key_num < len(dat_sources):
+                if key_num < back_idx:
                     selected = key_num
                     # Simulate Enter key press
                     key = ord('\n')
-                elif key_num == len(dat_sources):
+                elif key_num == back_idx:
                     # "Back" option
                     break
 
-            if key == curses.KEY_UP and selected > 0:
-                selected -= 1
-            elif key == curses.KEY_DOWN and selected < len(dat_sources):
-                selected += 1
+            if key == curses.KEY_RESIZE:
+                self.height, self.width = self.stdscr.getmaxyx()
+            elif delta:
+                # The Download All and Back entries sit after the sources
+                moved = max(0, min(back_idx, selected + delta))
+                # A move past either end leaves the frame as it is
+                redraw = moved != selected
+                selected = moved
             elif key == ord('\n'):
-                if selected == len(dat_sources):
+                if selected == back_idx:
                     break
+                if selected == download_all_idx:
+                    self._download_all_dat_files(dat_sources)
+                    continue
 
                 source = dat_sources[selected]
 
                 # Create downloaded_dats folder in script directory
-                script_dir = Path(__file__).parent.parent.parent / "downloaded_dats"
-                script_dir.mkdir(exist_ok=True)  # Create directory if it doesn't exist
+                script_dir = _downloaded_dats_dir()
 
                 # Show downloading message
-                self.stdscr.clear()
+                self.stdscr.erase()
                 self.draw_header("Downloading DAT File")
                 self.stdscr.addstr(self.height // 2 - 1, 4, f"Downloading: {source.name}")
                 self.stdscr.addstr(self.height // 2, 4, f"URL: {source.url[:self.width-10]}")
                 self.stdscr.addstr(self.height // 2 + 1, 4, "Please wait...")
-                self.stdscr.refresh()
+                self.present()
 
                 # Download using network module
                 success, file_path, error_msg = download_dat_file(source, script_dir)
@@ -1660,40 +2564,71 @@ class CursesGUI:
             elif key == 27 or key == ord('q'):
                 break
 
+    def _download_all_dat_files(self, dat_sources: list) -> None:
+        """
+        Download every DAT source at once and report which ones succeeded.
+
+        The files are saved to the downloaded DAT folder; none is set as a
+        system's DAT file, since the user picks that per system.
+
+        Args:
+            dat_sources: DATSources to download
+        """
+        script_dir = _downloaded_dats_dir()
+
+        self.stdscr.erase()
+        self.draw_header("Downloading DAT Files")
+        self.stdscr.addstr(self.height // 2 - 1, 4, f"Downloading {len(dat_sources)} DAT files...")
+        self.stdscr.addstr(self.height // 2, 4, "Please wait...")
+        self.present()
+
+        # The sources are fetched concurrently over the shared connection pool
+        results = download_all(dat_sources, script_dir)
+
+        lines = [f"Saved to: {script_dir}", ""]
+        failed = 0
+        for name, (success, file_path, error_msg) in results.items():
+            if success:
+                lines.append(f"{name}: {file_path.name}")
+            else:
+                failed += 1
+                lines.append(f"{name}: FAILED ({' '.join(error_msg.split())})")
+
+        if failed:
+            self.show_message("Error", f"{failed} of {len(results)} downloads failed\n\n" + "\n".join(lines), 3)
+        else:
+            self.show_message("Success", f"Downloaded {len(results)} DAT files\n\n" + "\n".join(lines), 2)
+
     def set_system_rom_folder(self, system: SystemConfig) -> None:
         """Set the ROM folder path for a system."""
         # Show selection menu: Browse or Manual Entry
         selected = 0
-        menu_items = [
-            ("[1] Browse for Folder", "Use file browser to select ROM folder"),
-            ("[2] Manual Entry", "Manually enter the ROM folder path"),
-            ("[3] Cancel", "Cancel and return to previous menu")
-        ]
+        menu_items = _ROM_FOLDER_MENU_ITEMS
 
+        redraw = True
         while True:
-            self.stdscr.clear()
-            self.draw_header(f"Set ROM Folder: {system.name}")
+            if redraw:
+                self.stdscr.erase()
+                self.draw_header(f"Set ROM Folder: {system.name}")
 
-            y = 2
-            if system.rom_folder:
-                self.stdscr.attron(curses.color_pair(5))
-                self.stdscr.addstr(y, 2, f"Current: {system.rom_folder[:self.width-12]}")
-                self.stdscr.attroff(curses.color_pair(5))
-                y += 2
+                y = 2
+                if system.rom_folder:
+                    self.stdscr.addstr(y, 2, f"Current: {system.rom_folder[:self.width-12]}", curses.color_pair(5))
+                    y += 2
 
-            self.draw_menu("", menu_items, selected, y)
+                self.draw_menu("", menu_items, selected, y)
 
-            # Show description of selected option at bottom
-            _, description = menu_items[selected]
-            desc_y = self.height - 3
-            self.stdscr.attron(curses.color_pair(5))
-            self.stdscr.addstr(desc_y, 2, description[:self.width-4])
-            self.stdscr.attroff(curses.color_pair(5))
+                # Show description of selected option at bottom
+                _, description = menu_items[selected]
+                desc_y = self.height - 3
+                self.stdscr.addstr(desc_y, 2, description[:self.width-4], curses.color_pair(5))
 
-            self.draw_footer("Up/Down: Navigate | Enter: Select | Esc/q: Cancel")
-            self.stdscr.refresh()
+                self.draw_footer("Up/Down: Navigate | Enter: Select | Esc/q: Cancel")
+                self.present()
 
-            key = self.stdscr.getch()
+            key, delta = self.wait_for_move(self.menu_keys(menu_items))
+            # Any key but a move may change the screen underneath
+            redraw = not delta
 
             # Check for numeric key press
             key_selection = self.get_menu_selection_from_key(key, menu_items)
@@ -1701,10 +2636,13 @@ class CursesGUI:
                 selected = key_selection
                 key = ord('\n')
 
-            if key == curses.KEY_UP and selected > 0:
-                selected -= 1
-            elif key == curses.KEY_DOWN and selected < len(menu_items) - 1:
-                selected += 1
+            if key == curses.KEY_RESIZE:
+                self.height, self.width = self.stdscr.getmaxyx()
+            elif delta:
+                moved = max(0, min(len(menu_items) - 1, selected + delta))
+                # A move past either end leaves the frame as it is
+                redraw = moved != selected
+                selected = moved
             elif key == ord('\n'):
                 if selected == 0:  # Browse
                     start_path = system.rom_folder if system.rom_folder else None
@@ -1721,7 +2659,8 @@ class CursesGUI:
                 elif selected == 1:  # Manual Entry
                     result = self.get_input(f"Enter ROM folder path for {system.name}:", system.rom_folder)
                     if result:
-                        if os.path.exists(result) and os.path.isdir(result):
+                        mode = _stat_mode(result)
+                        if mode is not None and stat.S_ISDIR(mode):
                             system.rom_folder = result
                             system.manager = None
                             self.show_message("Success", f"ROM folder set to:\n{result}", 2)
@@ -1737,41 +2676,34 @@ class CursesGUI:
         """Set the export folder path for a system."""
         # Show selection menu: Browse, Manual Entry, or Clear
         selected = 0
-        menu_items = [
-            ("[1] Browse for Folder", "Use file browser to select export folder"),
-            ("[2] Manual Entry", "Manually enter the export folder path"),
-            ("[3] Clear Export Folder", "Clear export folder setting (will use ROM folder)"),
-            ("[4] Cancel", "Cancel and return to previous menu")
-        ]
+        menu_items = _EXPORT_FOLDER_MENU_ITEMS
 
+        redraw = True
         while True:
-            self.stdscr.clear()
-            self.draw_header(f"Set Export Folder: {system.name}")
+            if redraw:
+                self.stdscr.erase()
+                self.draw_header(f"Set Export Folder: {system.name}")
 
-            y = 2
-            if system.export_folder:
-                self.stdscr.attron(curses.color_pair(5))
-                self.stdscr.addstr(y, 2, f"Current: {system.export_folder[:self.width-12]}")
-                self.stdscr.attroff(curses.color_pair(5))
-            else:
-                self.stdscr.attron(curses.color_pair(4))
-                self.stdscr.addstr(y, 2, "Not set - will use ROM folder")
-                self.stdscr.attroff(curses.color_pair(4))
-            y += 2
+                y = 2
+                if system.export_folder:
+                    self.stdscr.addstr(y, 2, f"Current: {system.export_folder[:self.width-12]}", curses.color_pair(5))
+                else:
+                    self.stdscr.addstr(y, 2, "Not set - will use ROM folder", curses.color_pair(4))
+                y += 2
 
-            self.draw_menu("", menu_items, selected, y)
+                self.draw_menu("", menu_items, selected, y)
 
-            # Show description of selected option at bottom
-            _, description = menu_items[selected]
-            desc_y = self.height - 3
-            self.stdscr.attron(curses.color_pair(5))
-            self.stdscr.addstr(desc_y, 2, description[:self.width-4])
-            self.stdscr.attroff(curses.color_pair(5))
+                # Show description of selected option at bottom
+                _, description = menu_items[selected]
+                desc_y = self.height - 3
+                self.stdscr.addstr(desc_y, 2, description[:self.width-4], curses.color_pair(5))
 
-            self.draw_footer("Up/Down: Navigate | Enter: Select | Esc/q: Cancel")
-            self.stdscr.refresh()
+                self.draw_footer("Up/Down: Navigate | Enter: Select | Esc/q: Cancel")
+                self.present()
 
-            key = self.stdscr.getch()
+            key, delta = self.wait_for_move(self.menu_keys(menu_items))
+            # Any key but a move may change the screen underneath
+            redraw = not delta
 
             # Check for numeric key press
             key_selection = self.get_menu_selection_from_key(key, menu_items)
@@ -1779,10 +2711,13 @@ class CursesGUI:
                 selected = key_selection
                 key = ord('\n')
 
-            if key == curses.KEY_UP and selected > 0:
-                selected -= 1
-            elif key == curses.KEY_DOWN and selected < len(menu_items) - 1:
-                selected += 1
+            if key == curses.KEY_RESIZE:
+                self.height, self.width = self.stdscr.getmaxyx()
+            elif delta:
+                moved = max(0, min(len(menu_items) - 1, selected + delta))
+                # A move past either end leaves the frame as it is
+                redraw = moved != selected
+                selected = moved
             elif key == ord('\n'):
                 if selected == 0:  # Browse
                     start_path = system.export_folder if system.export_folder else None
@@ -1798,7 +2733,8 @@ class CursesGUI:
                 elif selected == 1:  # Manual Entry
                     result = self.get_input(f"Enter export folder path for {system.name}:", system.export_folder)
                     if result:
-                        if os.path.exists(result) and os.path.isdir(result):
+                        mode = _stat_mode(result)
+                        if mode is not None and stat.S_ISDIR(mode):
                             system.export_folder = result
                             self.show_message("Success", f"Export folder set to:\n{result}", 2)
                             break
@@ -1813,51 +2749,33 @@ class CursesGUI:
             elif key == 27 or key == ord('q'):
                 break
 
+        # The manager keeps its parsed DAT; only its output folder follows the setting
+        if system.manager:
+            system.manager.export_folder = Path(system.export_folder) if system.export_folder else None
+
     def set_system_resolution_override(self, system: SystemConfig) -> None:
         """Set viewport configuration for a system."""
-        width = self.get_input("Enter override width (or leave empty for none):",
-                              str(system.override_width) if system.override_width else "")
-        if width:
-            try:
-                system.override_width = int(width)
-            except ValueError:
-                self.show_message("Error", "Invalid width value", 3)
-                return
-        else:
-            system.override_width = None
-
-        height = self.get_input("Enter override height (or leave empty for none):",
-                               str(system.override_height) if system.override_height else "")
-        if height:
-            try:
-                system.override_height = int(height)
-            except ValueError:
-                self.show_message("Error", "Invalid height value", 3)
-                return
-        else:
-            system.override_height = None
-
-        x = self.get_input("Enter viewport X position (or leave empty for none):",
-                          str(system.override_x) if system.override_x else "")
-        if x:
-            try:
-                system.override_x = int(x)
-            except ValueError:
-                self.show_message("Error", "Invalid X position value", 3)
-                return
-        else:
-            system.override_x = None
+        values = self.get_form("Enter viewport override (leave a field empty for none):", [
+            ("Width", str(system.override_width) if system.override_width else ""),
+            ("Height", str(system.override_height) if system.override_height else ""),
+            ("X position", str(system.override_x) if system.override_x else ""),
+            ("Y position", str(system.override_y) if system.override_y else ""),
+        ])
+        if values is None:
+            return
 
-        y = self.get_input("Enter viewport Y position (or leave empty for none):",
-                          str(system.override_y) if system.override_y else "")
-        if y:
+        # Parse every field before applying any, so an invalid entry changes nothing
+        parsed = []
+        for value, name in zip(values, ("width", "height", "X position", "Y position")):
+            if not value:
+                parsed.append(None)
+                continue
             try:
-                system.override_y = int(y)
+                parsed.append(int(value))
             except ValueError:
-                self.show_message("Error", "Invalid Y position value", 3)
+                self.show_message("Error", f"Invalid {name} value", 3)
                 return
-        else:
-            system.override_y = None
+        system.override_width, system.override_height, system.override_x, system.override_y = parsed
 
         if system.manager:
             system.manager.override_width = system.override_width
@@ -1913,16 +2831,15 @@ class CursesGUI:
             return
 
         # Generate backup filename
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"config_backup_{timestamp}.zip"
         backup_path = Path(result) / backup_name
 
-        # Show progress message
-        self.show_message("Backup", f"Creating backup...\n{len(config_files)} config files", 1)
+        progress_callback = self._progress_screen(f"Creating Backup: {system.name}", 2)
 
         # Create backup
-        success, final_path, error = system.manager.backup_configs(backup_path)
+        success, final_path, error = system.manager.backup_configs(backup_path,
+                                                                   progress_callback=progress_callback)
 
         if success:
             self.show_message("Success",
@@ -2012,12 +2929,68 @@ class CursesGUI:
                     system.export_folder if system.export_folder else None,
                     log_callback=self.log
                 )
-                system.manager.parse_dat_file()
+                self._load_dat(system.manager, system.dat_file)
             return True
         except Exception as e:
             self.show_message("Error", f"Failed to initialize {system.name}:\n{str(e)}", 3)
             return False
 
+    @staticmethod
+    def _format_game_list_row(game: GameInfo, column_widths: Tuple[int, ...]) -> str:
+        """
+        Format the column text of one ROM collection row, without the status column.
+
+        Args:
+            game: Game to format
+            column_widths: Column widths from _game_list_columns
+
+        Returns:
+            Padded row text; the status column is drawn separately in color
+        """
+        (name_width, desc_width, year_width, mfr_width, res_width, orient_width,
+         screen_width, _status_width) = column_widths
+
+        # Truncate fields
+        name = game.name[:name_width-1]
+        desc = game.description[:desc_width-1]
+        year = game.year[:year_width-1]
+        mfr = game.manufacturer[:mfr_width-1]
+        res = f"{game.width}x{game.height}"[:res_width-1]
+        orient = (game.rotate[:orient_width-1] if game.rotate else "-")
+        screen = (game.screen_type[:screen_width-1] if game.screen_type else "-")
+
+        # ljust pads without parsing a format spec per field
+        return (f"{name.ljust(name_width)} {desc.ljust(desc_width)} {year.ljust(year_width)} "
+                f"{mfr.ljust(mfr_width)} {res.ljust(res_width)} {orient.ljust(orient_width)} "
+                f"{screen.ljust(screen_width)} ")
+
+    def _draw_game_list_row(self, win, y: int, line: str, status_width: int,
+                            has_rom: bool, is_selected: bool) -> None:
+        """
+        Draw one ROM collection game row.
+
+        Args:
+            win: Window or pad to draw into
+            y: Line within win
+            line: Row text from _format_game_list_row
+            status_width: Width of the status column
+            has_rom: Whether the game's ROM is in the ROM folder
+            is_selected: Whether to draw the row highlighted
+        """
+        if has_rom:
+            status = "Found"
+            status_attr = self.found_bold_attr if is_selected else self.found_attr
+        else:
+            status = "Missing"
+            status_attr = self.missing_bold_attr if is_selected else self.missing_attr
+        # One clipped write for the columns and one for the status; each carries
+        # its attribute, so no attron/attroff pairs are needed
+        if is_selected:
+            win.addnstr(y, 0, f">{line}", self.width - status_width - 2, self.selected_attr)
+        else:
+            win.addnstr(y, 0, f" {line}", self.width - status_width - 2)
+        win.addstr(y, self.width - status_width, status, status_attr)
+
     def view_game_list(self) -> None:
         """View the list of games with resolutions and ROM status."""
         system = self.get_current_system()
@@ -2030,8 +3003,8 @@ class CursesGUI:
             return
 
         # Get all games with full metadata
-        all_games = sorted(system.manager.game_info.values(), key=lambda g: g.name)
-        rom_files = {f.stem for f in system.manager.get_rom_files()}
+        all_games = self._sorted_games(system.manager.game_info)
+        rom_files = system.manager.get_rom_stems()
 
         if not all_games:
             self.show_message("Warning", "No games with resolution data found in DAT file.", 4)
@@ -2042,44 +3015,58 @@ class CursesGUI:
         filter_text = ""
         games = all_games
 
-        while True:
-            self.stdscr.clear()
+        # (lowercased searchable text, game) pairs, shared with the DAT browser
+        # and built on the first filter, and those matching filter_text
+        search_index: Optional[List[Tuple[str, GameInfo]]] = None
+        matches: List[Tuple[str, GameInfo]] = []
 
+        # (formatted row text, ROM found) per game name
+        row_cache: Dict[str, Tuple[str, bool]] = {}
+        row_cache_widths = None
+
+        # Rendered game rows live in a pad covering games[pad_base:], as in the
+        # DAT browser: a row is drawn into it once and scrolling just copies a
+        # different slice to the screen
+        list_pad = None
+        pad_base = 0
+        pad_drawn: set = set()
+        pad_selected = None
+
+        # A selection move only changes two list rows and the details, so the
+        # rest of the frame is redrawn only when full_redraw is set
+        full_redraw = True
+
+        while True:
             # Calculate split point (60% top, 40% bottom)
             split_y = int(self.height * 0.6)
+            column_widths, header = _game_list_columns(self.width)
+            if column_widths != row_cache_widths:
+                # Formatted rows are only valid for the widths they were built with
+                row_cache.clear()
+                row_cache_widths = column_widths
 
-            # === TOP SECTION: Game List ===
-            if filter_text:
-                self.draw_header(f"ROM Collection: {system.name} ({len(games)}/{len(all_games)} games) Filter: {filter_text}")
-            else:
-                self.draw_header(f"ROM Collection: {system.name} ({len(games)} games)")
+            if full_redraw:
+                self.stdscr.erase()
 
-            # Column headers
-            y = 2
-            available_width = self.width - 4
-
-            # Calculate dynamic column widths
-            name_width = 15
-            year_width = 6
-            res_width = 11
-            orient_width = 6
-            screen_width = 8
-            status_width = 8
-
-            fixed_width = name_width + year_width + res_width + orient_width + screen_width + status_width + 6
-            remaining = available_width - fixed_width
-
-            if remaining > 30:
-                desc_width = int(remaining * 0.6)
-                mfr_width = remaining - desc_width
-            else:
-                desc_width = max(20, remaining // 2)
-                mfr_width = max(10, remaining - desc_width)
+                # === TOP SECTION: Game List ===
+                if filter_text:
+                    self.draw_header(f"ROM Collection: {system.name} ({len(games)}/{len(all_games)} games) Filter: {filter_text}")
+                else:
+                    self.draw_header(f"ROM Collection: {system.name} ({len(games)} games)")
+
+                # Column headers; the layout only changes with the screen width
+                self.stdscr.addstr(2, 0, header[:self.width], curses.color_pair(5) | curses.A_BOLD)
+
+                # Draw separator
+                self.stdscr.addstr(split_y, 0, _separator(self.width), curses.color_pair(5))
 
-            self.stdscr.attron(curses.color_pair(5) | curses.A_BOLD)
-            header = f"{'Name':<{name_width}} {'Desc':<{desc_width}} {'Year':<{year_width}} {'Mfr':<{mfr_width}} {'Res':<{res_width}} {'Orient':<{orient_width}} {'Screen':<{screen_width}} {'Status':<{status_width}}"
-            self.stdscr.addstr(y, 0, header[:self.width])
-            self.stdscr.attroff(curses.color_pair(5) | curses.A_BOLD)
+                # === BOTTOM SECTION: Game Details ===
+                self.stdscr.addstr(split_y + 1, 1, "Game Details:", curses.color_pair(5) | curses.A_BOLD)
+            else:
+                # Blank the old details below their title
+                for row in range(split_y + 2, self.height - 1):
+                    self.stdscr.move(row, 0)
+                    self.stdscr.clrtoeol()
 
             # Calculate visible games
             max_visible_top = split_y - 4
@@ -2091,69 +3078,56 @@ class CursesGUI:
                 scroll_offset = selected - max_visible_top + 1
 
             # Display games
-            y = 3
-            for idx in range(scroll_offset, min(scroll_offset + max_visible_top, len(games))):
-                if y >= split_y - 1:
-                    break
-
+            visible_end = min(scroll_offset + max_visible_top, len(games))
+            pad_rows = min(len(games) - pad_base, max(_DAT_PAD_ROWS, 2 * max_visible_top))
+            if list_pad is None or scroll_offset < pad_base or visible_end > pad_base + pad_rows:
+                # Center the pad on the visible rows; the spare line keeps the
+                # bottom-right cell of the last row writable
+                pad_base = max(0, scroll_offset - _DAT_PAD_ROWS // 2)
+                pad_rows = min(len(games) - pad_base, max(_DAT_PAD_ROWS, 2 * max_visible_top))
+                list_pad = curses.newpad(pad_rows + 1, self.width)
+                pad_drawn = set()
+                pad_selected = None
+
+            if pad_selected != selected:
+                # Only the old and new selection need their highlight changed
+                pad_drawn.discard(pad_selected)
+                pad_drawn.discard(selected)
+                pad_selected = selected
+
+            for idx in range(scroll_offset, visible_end):
+                if idx in pad_drawn:
+                    continue
                 game = games[idx]
-                has_rom = game.name in rom_files
-
-                # Truncate fields
-                name = game.name[:name_width-1]
-                desc = game.description[:desc_width-1]
-                year = game.year[:year_width-1]
-                mfr = game.manufacturer[:mfr_width-1]
-                res = f"{game.width}x{game.height}"[:res_width-1]
-                orient = (game.rotate[:orient_width-1] if game.rotate else "-")
-                screen = (game.screen_type[:screen_width-1] if game.screen_type else "-")
-                status = "Found" if has_rom else "Missing"
-
-                line = f"{name:<{name_width}} {desc:<{desc_width}} {year:<{year_width}} {mfr:<{mfr_width}} {res:<{res_width}} {orient:<{orient_width}} {screen:<{screen_width}} "
-
-                if idx == selected:
-                    self.stdscr.attron(curses.color_pair(1) | curses.A_BOLD)
-                    self.stdscr.addstr(y, 0, f">{line}"[:self.width-status_width-2])
-                    self.stdscr.attroff(curses.color_pair(1) | curses.A_BOLD)
-                    status_color = 2 if has_rom else 3
-                    self.stdscr.attron(curses.color_pair(status_color) | curses.A_BOLD)
-                    self.stdscr.addstr(y, self.width - status_width, status)
-                    self.stdscr.attroff(curses.color_pair(status_color) | curses.A_BOLD)
-                else:
-                    self.stdscr.addstr(y, 0, f" {line}"[:self.width-status_width-2])
-                    status_color = 2 if has_rom else 3
-                    self.stdscr.attron(curses.color_pair(status_color))
-                    self.stdscr.addstr(y, self.width - status_width, status)
-                    self.stdscr.attroff(curses.color_pair(status_color))
-
-                y += 1
-
-            # Draw separator
-            self.stdscr.attron(curses.color_pair(5))
-            self.stdscr.addstr(split_y, 0, "=" * self.width)
-            self.stdscr.attroff(curses.color_pair(5))
-
-            # === BOTTOM SECTION: Game Details ===
-            y = split_y + 1
-            self.stdscr.attron(curses.color_pair(5) | curses.A_BOLD)
-            self.stdscr.addstr(y, 1, "Game Details:")
-            self.stdscr.attroff(curses.color_pair(5) | curses.A_BOLD)
-
-            y += 1
+                # Row text and ROM status only depend on the game and the widths
+                row = row_cache.get(game.name)
+                if row is None:
+                    row = row_cache[game.name] = (self._format_game_list_row(game, column_widths),
+                                                  game.name in rom_files)
+                line, has_rom = row
+                self._draw_game_list_row(list_pad, idx - pad_base, line, column_widths[-1],
+                                         has_rom, idx == selected)
+                pad_drawn.add(idx)
+
+            if visible_end > scroll_offset:
+                list_pad.overwrite(self.stdscr, scroll_offset - pad_base, 0,
+                                   3, 0, 2 + visible_end - scroll_offset, self.width - 1)
+
+            y = split_y + 2
             if selected < len(games):
                 game = games[selected]
                 has_rom = game.name in rom_files
 
                 # Show game details
-                self.stdscr.attron(curses.color_pair(5))
+                detail_attr = curses.color_pair(5)
                 game_line = f"Game: {game.name}"
-                self.stdscr.addstr(y, 1, game_line[:self.width-2])
+                self.stdscr.addstr(y, 1, game_line[:self.width-2], detail_attr)
                 y += 1
 
                 if game.description:
                     desc_display = game.description if len(game.description) <= self.width - 15 else game.description[:self.width-18] + "..."
                     desc_line = f"Description: {desc_display}"
-                    self.stdscr.addstr(y, 1, desc_line[:self.width-2])
+                    self.stdscr.addstr(y, 1, desc_line[:self.width-2], detail_attr)
                     y += 1
 
                 if game.year or game.manufacturer:
@@ -2164,7 +3138,7 @@ class CursesGUI:
                         if info_line:
                             info_line += "  |  "
                         info_line += f"Manufacturer: {game.manufacturer}"
-                    self.stdscr.addstr(y, 1, info_line[:self.width-2])
+                    self.stdscr.addstr(y, 1, info_line[:self.width-2], detail_attr)
                     y += 1
 
                 if game.rotate or game.screen_type:
@@ -2175,28 +3149,36 @@ class CursesGUI:
                         if display_line:
                             display_line += "  |  "
                         display_line += f"Screen: {game.screen_type}"
-                    self.stdscr.addstr(y, 1, display_line[:self.width-2])
+                    self.stdscr.addstr(y, 1, display_line[:self.width-2], detail_attr)
                     y += 1
 
                 res_line = f"Resolution: {game.width}x{game.height}"
-                self.stdscr.addstr(y, 1, res_line[:self.width-2])
+                self.stdscr.addstr(y, 1, res_line[:self.width-2], detail_attr)
                 y += 1
 
-                self.stdscr.attroff(curses.color_pair(5))
-
                 # ROM status
-                status_color = 2 if has_rom else 3
-                self.stdscr.attron(curses.color_pair(status_color) | curses.A_BOLD)
+                status_attr = self.found_bold_attr if has_rom else self.missing_bold_attr
                 status_line = f"ROM Status: {'Found' if has_rom else 'Missing'}"
-                self.stdscr.addstr(y, 1, status_line[:self.width-2])
-                self.stdscr.attroff(curses.color_pair(status_color) | curses.A_BOLD)
+                self.stdscr.addstr(y, 1, status_line[:self.width-2], status_attr)
 
             self.draw_footer("Up/Down: Navigate | Enter: Write Config | /: Filter | c: Clear | q: Back")
-            self.stdscr.refresh()
-
-            key = self.stdscr.getch()
+            self.present()
 
-            if key == curses.KEY_UP and selected > 0:
+            # A move past either end of the list changes nothing, so it is
+            # dropped here instead of repainting an identical frame
+            while True:
+                key = _fold_key(self.wait_for_key(_GAME_LIST_KEYS))
+                if not ((key == curses.KEY_UP and selected == 0) or
+                        (key == curses.KEY_DOWN and selected >= len(games) - 1)):
+                    break
+            # Selection moves and the write dialogs, which put back the frame
+            # they covered, leave the header alone
+            full_redraw = key not in (curses.KEY_UP, curses.KEY_DOWN, ord('\n'))
+
+            if key == curses.KEY_RESIZE:
+                self.height, self.width = self.stdscr.getmaxyx()
+                list_pad = None
+            elif key == curses.KEY_UP and selected > 0:
                 selected -= 1
             elif key == curses.KEY_DOWN and selected < len(games) - 1:
                 selected += 1
@@ -2211,11 +3193,8 @@ class CursesGUI:
                     final_height = system.override_height if system.override_height else game.height
 
                     # Determine output location
-                    if system.export_folder:
-                        output_location = system.export_folder
-                    elif system.rom_folder:
-                        output_location = system.rom_folder
-                    else:
+                    output_location = system.output_location
+                    if not output_location:
                         self.show_message("Error", "No ROM folder or export folder set.\nPlease configure the system first.", 3)
                         continue
 
@@ -2232,17 +3211,10 @@ class CursesGUI:
 
                     if self.show_confirm("Confirm Write Config", confirm_msg, 5):
                         try:
-                            # Create a temporary manager to write the config
-                            write_manager = ViewportConfigurationManager(
-                                system.dat_file,
-                                system.rom_folder if system.rom_folder else None,
-                                system.override_width,
-                                system.override_height,
-                                system.export_folder if system.export_folder else None,
-                                log_callback=self.log
-                            )
-                            write_manager.parse_dat_file()
-                            write_manager.update_rom_config(game.name, final_width, final_height)
+                            # The system's manager is already set up with this
+                            # system's folders, so no new manager or DAT parse is needed
+                            system.manager.update_rom_config(game.name, final_width, final_height,
+                                                             system.override_x, system.override_y)
                             self.show_message("Success", f"Config written for {game.name}\n{final_width}x{final_height}", 2)
                         except Exception as e:
                             self.show_message("Error", f"Failed to write config:\n{str(e)}", 3)
@@ -2250,28 +3222,97 @@ class CursesGUI:
                 # Enter filter mode
                 new_filter = self.get_input("Filter games (name/description/year/mfr):", filter_text)
                 if new_filter is not None:
-                    filter_text = new_filter.lower()
+                    new_filter = new_filter.lower()
                     # Apply filter
-                    if filter_text:
-                        games = [g for g in all_games if
-                                filter_text in g.name.lower() or
-                                filter_text in g.description.lower() or
-                                filter_text in g.year.lower() or
-                                filter_text in g.manufacturer.lower()]
+                    if new_filter:
+                        if search_index is None:
+                            search_index = self._search_index(system.manager.game_info, all_games)
+                        # A filter containing the previous one can only narrow its matches
+                        pool = matches if filter_text and filter_text in new_filter else search_index
+                        matches = [entry for entry in pool if new_filter in entry[0]]
+                        games = [g for _, g in matches]
                     else:
                         games = all_games
+                    filter_text = new_filter
                     # Reset selection
                     selected = 0
                     scroll_offset = 0
-            elif key == ord('c') or key == ord('C'):
+                    list_pad = None
+            elif key == ord('c'):
                 # Clear filter
                 filter_text = ""
                 games = all_games
                 selected = 0
                 scroll_offset = 0
+                list_pad = None
             elif key == 27 or key == ord('q'):  # ESC or q
                 break
 
+    def _progress_screen(self, title: str, bar_color: int, system_line: Optional[str] = None,
+                         system_attr: int = 0) -> Callable[[int, int, str], None]:
+        """
+        Draw a progress screen and return the callback that updates it.
+
+        The header, the optional system line and the empty bar are drawn once,
+        here. The returned callback redraws at most every 50 ms (always for the
+        last item), adding only the newly filled bar cells and rewriting the
+        two text rows.
+
+        Args:
+            title: Header text
+            bar_color: Color pair of the progress bar
+            system_line: Optional line shown above the bar
+            system_attr: Attributes of the system line
+
+        Returns:
+            progress_callback(current, total, name), as taken by the manager's
+            process_roms, remove_all_overrides and backup_configs
+        """
+        self.stdscr.erase()
+        self.draw_header(title)
+
+        progress_y = self.height // 2 - 2
+        if system_line is not None:
+            self.stdscr.addstr(progress_y - 2, 4, system_line, system_attr)
+
+        bar_width = self.width - 10
+        bar_attr = curses.color_pair(bar_color)
+        self.stdscr.addstr(progress_y, 4, f"[{'-' * bar_width}]", bar_attr)
+        self.present()
+
+        drawn_filled = 0
+        last_draw = 0.0
+
+        # Bound once; the manager calls back once per ROM, thousands of times a run
+        stdscr = self.stdscr
+        addstr = stdscr.addstr
+        monotonic = time.monotonic
+        present = self.present
+        name_width = self.width - 5
+
+        def progress_callback(current: int, total: int, name: str) -> None:
+            nonlocal drawn_filled, last_draw
+            now = monotonic()
+            if current < total and now - last_draw < 0.05:
+                return
+            last_draw = now
+
+            # Progress bar; only the cells filled since the last draw change
+            filled = bar_width * current // total
+            if filled > drawn_filled:
+                addstr(progress_y, 5 + drawn_filled, "#" * (filled - drawn_filled), bar_attr)
+                drawn_filled = filled
+
+            # Progress text; names differ in length, so clear the old one first
+            addstr(progress_y + 2, 4, f"Progress: {current}/{total} ({100 * current // total}%)")
+            stdscr.move(progress_y + 3, 0)
+            stdscr.clrtoeol()
+            stdscr.addnstr(progress_y + 3, 4, f"Current: {name}", name_width)
+
+            present()
+
+        return progress_callback
+
     def process_current_system(self) -> None:
         """Process ROMs for the current system."""
         system = self.get_current_system()
@@ -2283,7 +3324,7 @@ class CursesGUI:
             return
 
         # Confirm with user
-        output_location = system.export_folder if system.export_folder else system.rom_folder
+        output_location = system.output_location
         confirm_msg = f"Process all ROMs for {system.name}?\n\n"
         confirm_msg += f"This will create/update config files for all games.\n"
         confirm_msg += f"Output: {output_location}"
@@ -2291,28 +3332,7 @@ class CursesGUI:
         if not self.show_confirm("Confirm Process System", confirm_msg, 5):
             return
 
-        # Progress screen
-        def progress_callback(current: int, total: int, rom_name: str):
-            self.stdscr.clear()
-            self.draw_header(f"Processing: {system.name}")
-
-            progress_y = self.height // 2 - 2
-
-            # Progress bar
-            bar_width = self.width - 10
-            filled = int(bar_width * current / total)
-            bar = "#" * filled + "-" * (bar_width - filled)
-
-            self.stdscr.attron(curses.color_pair(2))
-            self.stdscr.addstr(progress_y, 4, f"[{bar}]")
-            self.stdscr.attroff(curses.color_pair(2))
-
-            # Progress text
-            percent = int(100 * current / total)
-            self.stdscr.addstr(progress_y + 2, 4, f"Progress: {current}/{total} ({percent}%)")
-            self.stdscr.addstr(progress_y + 3, 4, f"Current: {rom_name}")
-
-            self.stdscr.refresh()
+        progress_callback = self._progress_screen(f"Processing: {system.name}", 2)
 
         try:
             processed, skipped = system.manager.process_roms(progress_callback)
@@ -2338,9 +3358,9 @@ class CursesGUI:
 
         # Confirm with user
         system_list = "\n".join([f"  - {s.name}" for s in processable_systems])
-        confirm_msg = f"Process {len(processable_systems)} system(s)?\n\n"
-        confirm_msg += f"This will create/update config files for all games.\n\n"
-        confirm_msg += f"Systems:\n{system_list}"
+        confirm_msg = (f"Process {len(processable_systems)} system(s)?\n\n"
+                       f"This will create/update config files for all games.\n\n"
+                       f"Systems:\n{system_list}")
 
         if not self.show_confirm("Confirm Process All Systems", confirm_msg, 5):
             return
@@ -2358,34 +3378,9 @@ class CursesGUI:
                 if not self.initialize_system_manager(system):
                     continue
 
-                # Progress screen
-                def progress_callback(current: int, total: int, rom_name: str):
-                    self.stdscr.clear()
-                    self.draw_header(f"Processing All Systems ({idx+1}/{len(self.systems)})")
-
-                    y = self.height // 2 - 4
-
-                    self.stdscr.attron(curses.color_pair(5) | curses.A_BOLD)
-                    self.stdscr.addstr(y, 4, f"Current System: {system.name}")
-                    self.stdscr.attroff(curses.color_pair(5) | curses.A_BOLD)
-
-                    y += 2
-
-                    # Progress bar
-                    bar_width = self.width - 10
-                    filled = int(bar_width * current / total)
-                    bar = "#" * filled + "-" * (bar_width - filled)
-
-                    self.stdscr.attron(curses.color_pair(2))
-                    self.stdscr.addstr(y, 4, f"[{bar}]")
-                    self.stdscr.attroff(curses.color_pair(2))
-
-                    y += 2
-                    percent = int(100 * current / total)
-                    self.stdscr.addstr(y, 4, f"Progress: {current}/{total} ({percent}%)")
-                    self.stdscr.addstr(y + 1, 4, f"Current: {rom_name}")
-
-                    self.stdscr.refresh()
+                progress_callback = self._progress_screen(
+                    f"Processing All Systems ({idx+1}/{len(self.systems)})", 2,
+                    f"Current System: {system.name}", curses.color_pair(5) | curses.A_BOLD)
 
                 processed, skipped = system.manager.process_roms(progress_callback)
                 results.append((system.name, processed, skipped))
@@ -2396,15 +3391,11 @@ class CursesGUI:
                 self.log(f"Error processing {system.name}: {e}")
 
         # Show summary
-        summary = "All Systems Processing Complete!\n\n"
-        for name, processed, skipped in results:
-            summary += f"{name}:\n"
-            summary += f"  Processed: {processed}\n"
-            summary += f"  Skipped: {skipped}\n\n"
-
-        summary += f"TOTAL:\n"
-        summary += f"  Processed: {total_processed}\n"
-        summary += f"  Skipped: {total_skipped}"
+        parts = ["All Systems Processing Complete!\n\n"]
+        parts.extend(f"{name}:\n  Processed: {processed}\n  Skipped: {skipped}\n\n"
+                     for name, processed, skipped in results)
+        parts.append(f"TOTAL:\n  Processed: {total_processed}\n  Skipped: {total_skipped}")
+        summary = "".join(parts)
 
         self.show_message("Success", summary, 2)
 
@@ -2416,11 +3407,8 @@ class CursesGUI:
             return
 
         # Determine output location
-        if system.export_folder:
-            output_location = system.export_folder
-        elif system.rom_folder:
-            output_location = system.rom_folder
-        else:
+        output_location = system.output_location
+        if not output_location:
             self.show_message("Error", "No ROM folder or export folder set.\nPlease configure the system first.", 3)
             return
 
@@ -2430,25 +3418,14 @@ class CursesGUI:
             self.show_message("Error", f"Output folder does not exist:\n{output_location}", 3)
             return
 
-        config_files = list(output_folder.glob('*.zip.cfg'))
+        config_count, files_with_overrides = _count_override_configs(output_folder)
 
-        if not config_files:
+        if not config_count:
             self.show_message("Info", f"No config files found in:\n{output_location}", 5)
             return
 
-        # Count files with overrides
-        files_with_overrides = 0
-        for config_file in config_files:
-            try:
-                with open(config_file, 'r') as f:
-                    content = f.read()
-                    if 'custom_viewport_width' in content or 'custom_viewport_height' in content or 'aspect_ratio_index' in content:
-                        files_with_overrides += 1
-            except Exception:
-                pass
-
         if files_with_overrides == 0:
-            self.show_message("Info", f"No viewport overrides found in {len(config_files)} config files.", 5)
+            self.show_message("Info", f"No viewport overrides found in {config_count} config files.", 5)
             return
 
         # Confirm with user
@@ -2467,28 +3444,7 @@ class CursesGUI:
         if not self.initialize_system_manager(system):
             return
 
-        # Progress screen
-        def progress_callback(current: int, total: int, rom_name: str):
-            self.stdscr.clear()
-            self.draw_header(f"Removing Overrides: {system.name}")
-
-            progress_y = self.height // 2 - 2
-
-            # Progress bar
-            bar_width = self.width - 10
-            filled = int(bar_width * current / total)
-            bar = "#" * filled + "-" * (bar_width - filled)
-
-            self.stdscr.attron(curses.color_pair(4))
-            self.stdscr.addstr(progress_y, 4, f"[{bar}]")
-            self.stdscr.attroff(curses.color_pair(4))
-
-            # Progress text
-            percent = int(100 * current / total)
-            self.stdscr.addstr(progress_y + 2, 4, f"Progress: {current}/{total} ({percent}%)")
-            self.stdscr.addstr(progress_y + 3, 4, f"Current: {rom_name}")
-
-            self.stdscr.refresh()
+        progress_callback = self._progress_screen(f"Removing Overrides: {system.name}", 4)
 
         try:
             removed, skipped = system.manager.remove_all_overrides(progress_callback)
@@ -2512,31 +3468,27 @@ class CursesGUI:
             self.show_message("Error", "No systems have ROM folder or export folder configured.", 3)
             return
 
-        # Check if any systems have overrides before confirming
-        total_with_overrides = 0
-        for system in processable_systems:
-            output_folder = Path(system.export_folder) if system.export_folder else Path(system.rom_folder) if system.rom_folder else None
-            if output_folder and output_folder.exists():
-                config_files = list(output_folder.glob('*.zip.cfg'))
-                for config_file in config_files:
-                    try:
-                        with open(config_file, 'r') as f:
-                            content = f.read()
-                            if 'custom_viewport_width' in content or 'custom_viewport_height' in content or 'aspect_ratio_index' in content:
-                                total_with_overrides += 1
-                                break  # Found at least one in this system, move to next
-                    except Exception:
-                        pass
-
-        if total_with_overrides == 0:
+        def has_overrides(system: SystemConfig) -> bool:
+            output_folder = Path(system.output_location) if system.output_location else None
+            if not output_folder or not output_folder.exists():
+                return False
+            # Finding one config with overrides is enough for this system
+            return _count_override_configs(output_folder, stop_at_first=True)[1] > 0
+
+        # Check if any systems have overrides before confirming; the scans are
+        # file I/O that releases the GIL, so systems are checked in parallel
+        with ThreadPoolExecutor(max_workers=min(8, len(processable_systems))) as executor:
+            any_overrides = any(executor.map(has_overrides, processable_systems))
+
+        if not any_overrides:
             self.show_message("Info", f"No viewport overrides found in any of the {len(processable_systems)} system(s).", 5)
             return
 
         # Confirm with user
         system_list = "\n".join([f"  - {s.name}" for s in processable_systems])
-        confirm_msg = f"Remove viewport overrides from {len(processable_systems)} system(s)?\n\n"
-        confirm_msg += f"This will remove viewport settings from all config files.\n\n"
-        confirm_msg += f"Systems:\n{system_list}"
+        confirm_msg = (f"Remove viewport overrides from {len(processable_systems)} system(s)?\n\n"
+                       f"This will remove viewport settings from all config files.\n\n"
+                       f"Systems:\n{system_list}")
 
         if not self.show_confirm("Confirm Remove All Systems Overrides", confirm_msg, 4):
             return
@@ -2546,12 +3498,7 @@ class CursesGUI:
         total_skipped = 0
 
         for idx, system in enumerate(processable_systems):
-            # Determine output location
-            if system.export_folder:
-                output_location = system.export_folder
-            elif system.rom_folder:
-                output_location = system.rom_folder
-            else:
+            if not system.output_location:
                 continue
 
             # Initialize manager
@@ -2559,31 +3506,9 @@ class CursesGUI:
                 self.log(f"Skipping {system.name}: Failed to initialize manager")
                 continue
 
-            # Progress screen
-            def progress_callback(current: int, total: int, rom_name: str):
-                self.stdscr.clear()
-                self.draw_header(f"Removing Overrides: {idx+1}/{len(processable_systems)}")
-
-                # System progress
-                y = self.height // 2 - 4
-                self.stdscr.addstr(y, 4, f"Current System: {system.name}")
-                y += 2
-
-                # File progress bar
-                bar_width = self.width - 10
-                filled = int(bar_width * current / total)
-                bar = "#" * filled + "-" * (bar_width - filled)
-
-                self.stdscr.attron(curses.color_pair(4))
-                self.stdscr.addstr(y, 4, f"[{bar}]")
-                self.stdscr.attroff(curses.color_pair(4))
-
-                y += 2
-                percent = int(100 * current / total)
-                self.stdscr.addstr(y, 4, f"Progress: {current}/{total} ({percent}%)")
-                self.stdscr.addstr(y + 1, 4, f"Current: {rom_name}")
-
-                self.stdscr.refresh()
+            progress_callback = self._progress_screen(
+                f"Removing Overrides: {idx+1}/{len(processable_systems)}", 4,
+                f"Current System: {system.name}")
 
             try:
                 removed, skipped = system.manager.remove_all_overrides(progress_callback)
@@ -2594,15 +3519,11 @@ class CursesGUI:
                 self.log(f"Error removing overrides for {system.name}: {e}")
 
         # Show summary
-        summary = "All Systems Removal Complete!\n\n"
-        for name, removed, skipped in results:
-            summary += f"{name}:\n"
-            summary += f"  Removed: {removed}\n"
-            summary += f"  Skipped: {skipped}\n\n"
-
-        summary += f"TOTAL:\n"
-        summary += f"  Removed: {total_removed}\n"
-        summary += f"  Skipped: {total_skipped}"
+        parts = ["All Systems Removal Complete!\n\n"]
+        parts.extend(f"{name}:\n  Removed: {removed}\n  Skipped: {skipped}\n\n"
+                     for name, removed, skipped in results)
+        parts.append(f"TOTAL:\n  Removed: {total_removed}\n  Skipped: {total_skipped}")
+        summary = "".join(parts)
 
         self.show_message("Success", summary, 2)
 
@@ -2611,24 +3532,26 @@ class CursesGUI:
         selected = max(0, len(self.log_messages) - (self.height - 6))
 
         while True:
-            self.stdscr.clear()
+            self.stdscr.erase()
             self.draw_header(f"Log ({len(self.log_messages)} messages)")
 
             max_visible = self.height - 4
 
             # Display log messages
-            for idx in range(selected, min(selected + max_visible, len(self.log_messages))):
-                y = 2 + (idx - selected)
+            visible = itertools.islice(self.log_messages, selected, selected + max_visible)
+            for y, msg in enumerate(visible, 2):
                 if y < self.height - 2:
-                    msg = self.log_messages[idx]
-                    self.stdscr.addstr(y, 2, msg[:self.width - 4])
+                    # addnstr clips in C, without slicing a copy of each message
+                    self.stdscr.addnstr(y, 2, msg, self.width - 4)
 
             self.draw_footer("Up/Down: Scroll | Esc/q: Back")
-            self.stdscr.refresh()
+            self.present()
 
-            key = self.stdscr.getch()
+            key = self.wait_for_key(_LOG_KEYS)
 
-            if key == curses.KEY_UP and selected > 0:
+            if key == curses.KEY_RESIZE:
+                self.height, self.width = self.stdscr.getmaxyx()
+            elif key == curses.KEY_UP and selected > 0:
                 selected -= 1
             elif key == curses.KEY_DOWN and selected < len(self.log_messages) - max_visible:
                 selected += 1
@@ -2637,7 +3560,22 @@ class CursesGUI:
 
     def run(self) -> None:
         """Run the GUI main loop."""
+        if _RESET_NCURSES_FLUSH:
+            # Until a screen has been suspended and resumed once, ncurses 6.4
+            # flushes its output after every cursor move, so a frame goes out
+            # as one write() per changed row. This is undocumented behaviour,
+            # hence the version gate: a throwaway endwin()/refresh() cycle
+            # before the first frame lets each doupdate() leave in a single write
+            curses.endwin()
+            self.stdscr.refresh()
+
         curses.curs_set(0)  # Hide cursor
+        # The cursor stays hidden outside get_input, so let curses leave it
+        # wherever the last write ended instead of moving it back each update
+        self.stdscr.leaveok(True)
+        # Every screen waits in a blocking getch(), so the process sleeps until
+        # a key arrives; only _read_line switches to non-blocking, temporarily
+        self.stdscr.timeout(-1)
         self.stdscr.keypad(True)  # Enable keypad mode
 
         self.main_menu()